@@ -0,0 +1,213 @@
+"""
+Benchmark the API client's request chains against a local stand-in server.
+
+Sweeps the number of addresses, the chain depth and the number of chains run
+at once, fetching the bin days of every address through `BinDaysApiClient`
+and reporting throughput and chain latency percentiles. See `standin.py` for
+the server.
+
+Run from the repository root:
+
+    python benchmarks/bench_client.py
+    python benchmarks/bench_client.py --addresses 1,20 --depths 1,4 \\
+        --council-latency 0.05 --output results.json
+
+A table is printed, and `--output` writes the results as JSON so runs can be
+compared for regressions.
+"""
+
+# External Packages
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import aiohttp
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Home Assistant is not needed to run the client
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+# Internal Packages
+from custom_components.bindays.api import (  # noqa: E402
+    BinDaysApiClient,
+    RateLimiter,
+    RetryPolicy,
+)
+from custom_components.bindays.models.address import Address  # noqa: E402
+from custom_components.bindays.models.collector import Collector  # noqa: E402
+from standin import COLLECTOR_ID, StandIn, StandInConfig  # noqa: E402
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Return the nearest-rank percentile of some values.
+    """
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * percent / 100)) - 1]
+
+
+async def run_case(
+    config: StandInConfig,
+    concurrency: int,
+    rate_limit: bool,
+    upload_encoding: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Fetch the bin days of every address from a fresh stand-in, returning the results.
+    """
+    async with StandIn(config) as standin, aiohttp.ClientSession() as session:
+        client = BinDaysApiClient(
+            session,
+            standin.api_url,
+            retry_policy=RetryPolicy(max_attempts=5, base_delay=0.01, max_delay=0.1),
+            # Every mock council is the same host, so only pace them if asked to
+            rate_limiter=None if rate_limit else RateLimiter(rate=1e9, burst=1_000_000),
+            upload_encoding=upload_encoding,
+        )
+        collector = Collector(govUkId=COLLECTOR_ID, name="Stand-In Council")
+        addresses = [Address(**standin.address(i)) for i in range(config.addresses)]
+
+        limit = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        errors = 0
+
+        async def fetch(address: Address) -> None:
+            nonlocal errors
+            async with limit:
+                started_at = time.perf_counter()
+                try:
+                    bin_days = await client.get_bin_days(collector, address)
+                except Exception:  # noqa: BLE001 - counted, not raised
+                    errors += 1
+                    return
+                latencies.append(time.perf_counter() - started_at)
+                assert len(bin_days) == config.bin_days
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(fetch(a) for a in addresses))
+        elapsed = time.perf_counter() - started_at
+
+        await client.close()
+
+    return {
+        "addresses": config.addresses,
+        "depth": config.depth,
+        "concurrency": concurrency,
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else None,
+        "errors": errors,
+        "p50": percentile(latencies, 50) if latencies else None,
+        "p95": percentile(latencies, 95) if latencies else None,
+        "p99": percentile(latencies, 99) if latencies else None,
+        "config": config.as_dict(),
+        "server": standin.stats.as_dict(),
+        "client": client.stats.total.as_dict(),
+    }
+
+
+def int_list(value: str) -> List[int]:
+    """
+    Parse a comma-separated list of integers.
+    """
+    return [int(v) for v in value.split(",") if v]
+
+
+def format_ms(value: Any) -> str:
+    """
+    Format seconds as milliseconds for the table.
+    """
+    return f"{value * 1000:.1f}" if value is not None else "-"
+
+
+async def main() -> None:
+    """
+    Run every benchmark case.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--addresses", type=int_list, default=[1, 10, 50])
+    parser.add_argument("--depths", type=int_list, default=[1, 3])
+    parser.add_argument("--concurrency", type=int_list, default=[1, 4, 16])
+    parser.add_argument("--api-latency", type=float, default=0.005, help="seconds")
+    parser.add_argument("--council-latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--payload-size", type=int, default=50_000, help="bytes")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", action="store_true", help="pace council requests")
+    parser.add_argument(
+        "--upload-encoding", choices=["gzip", "deflate", "none"], default="gzip"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'addresses':>9} {'depth':>5} {'conc':>4} {'chains/s':>9}"
+        f" {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}"
+    )
+    for addresses in args.addresses:
+        for depth in args.depths:
+            for concurrency in args.concurrency:
+                config = StandInConfig(
+                    depth=depth,
+                    api_latency=args.api_latency,
+                    council_latency=args.council_latency,
+                    payload_size=args.payload_size,
+                    addresses=addresses,
+                    failure_rate=args.failure_rate,
+                    seed=args.seed,
+                )
+                result = await run_case(
+                    config,
+                    concurrency,
+                    args.rate_limit,
+                    None if args.upload_encoding == "none" else args.upload_encoding,
+                )
+                results.append(result)
+                print(
+                    f"{addresses:>9} {depth:>5} {concurrency:>4} {result['throughput']:>9.1f}"
+                    f" {format_ms(result['p50']):>8} {format_ms(result['p95']):>8}"
+                    f" {format_ms(result['p99']):>8} {result['errors']:>6}"
+                )
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "benchmark": "client",
+                    "python": platform.python_version(),
+                    "aiohttp": aiohttp.__version__,
+                    "settings": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
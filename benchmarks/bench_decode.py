@@ -0,0 +1,184 @@
+"""
+Benchmark decoding API payloads into models.
+
+Compares parsing responses into dicts and constructing each model from
+keyword arguments, as the client used to, with validating the raw JSON using
+the decoders in `api/decode.py`.
+
+Run from the repository root:
+
+    python benchmarks/bench_decode.py
+"""
+
+# External Packages
+import json
+import sys
+import timeit
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Home Assistant is not needed to decode payloads
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+# Internal Packages
+from custom_components.bindays.api.decode import (  # noqa: E402
+    ADDRESSES_RESPONSE,
+    BIN_DAYS_RESPONSE,
+    decode_collectors,
+)
+from custom_components.bindays.models.address import Address  # noqa: E402
+from custom_components.bindays.models.bin_day import BinDay  # noqa: E402
+from custom_components.bindays.models.client_side_request import ClientSideRequest  # noqa: E402
+from custom_components.bindays.models.collector import Collector  # noqa: E402
+
+COLLECTOR_COUNT = 400
+"""Roughly the number of councils in the collectors list."""
+
+ADDRESS_COUNT = 60
+"""A busy postcode."""
+
+BIN_DAY_COUNT = 52
+"""A year of weekly collections."""
+
+
+def collectors_payload() -> bytes:
+    """
+    Return a collectors list response body.
+    """
+    return json.dumps(
+        [
+            {
+                "govUkId": f"council-{i}",
+                "name": f"Council {i}",
+                "websiteUrl": f"https://www.council-{i}.gov.uk",
+                "govUkUrl": f"https://www.gov.uk/council-{i}",
+            }
+            for i in range(COLLECTOR_COUNT)
+        ]
+    ).encode()
+
+
+def address(uid: int) -> dict:
+    """
+    Return an address as the API sends it.
+    """
+    return {
+        "uid": f"1000{uid:08d}",
+        "postcode": "AB1 2CD",
+        "property": str(uid),
+        "street": "High Street",
+        "town": "Town",
+    }
+
+
+def addresses_payload() -> bytes:
+    """
+    Return an addresses response body.
+    """
+    return json.dumps({"addresses": [address(i) for i in range(ADDRESS_COUNT)]}).encode()
+
+
+def bin_days_payload() -> bytes:
+    """
+    Return a bin days response body.
+    """
+    bins = [
+        {"name": "General Waste", "colour": "Black", "keys": ["refuse"]},
+        {"name": "Recycling", "colour": "Blue", "keys": ["recycling"]},
+        {"name": "Garden Waste", "colour": "Green", "type": "Wheelie Bin", "keys": ["garden"]},
+    ]
+    bin_days = [
+        {"date": f"2026-{1 + i // 5:02d}-{1 + (i % 5) * 6:02d}", "address": address(1), "bins": bins}
+        for i in range(BIN_DAY_COUNT)
+    ]
+    return json.dumps({"binDays": bin_days}).encode()
+
+
+def next_step_payload() -> bytes:
+    """
+    Return a response body asking for a client-side request.
+    """
+    return json.dumps(
+        {
+            "nextClientSideRequest": {
+                "requestId": 1,
+                "url": "https://www.council.gov.uk/bins?uprn=100012345678",
+                "method": "POST",
+                "headers": {"Content-Type": "application/x-www-form-urlencoded"},
+                "body": "uprn=100012345678&token=abcdef",
+                "options": {"followRedirects": False},
+            }
+        }
+    ).encode()
+
+
+def report(name: str, baseline, candidate, number: int) -> None:
+    """
+    Time a baseline and candidate decoder and print the speed-up.
+    """
+    assert baseline() == candidate(), f"{name}: decoders disagree"
+
+    baseline_time = min(timeit.repeat(baseline, number=number, repeat=5)) / number
+    candidate_time = min(timeit.repeat(candidate, number=number, repeat=5)) / number
+
+    print(
+        f"{name:<28} {baseline_time * 1e6:>10.1f} us {candidate_time * 1e6:>10.1f} us"
+        f" {baseline_time / candidate_time:>7.2f}x"
+    )
+
+
+def main() -> None:
+    """
+    Run every benchmark.
+    """
+    collectors = collectors_payload()
+    addresses = addresses_payload()
+    bin_days = bin_days_payload()
+    next_step = next_step_payload()
+
+    print(f"{'payload':<28} {'kwargs':>13} {'decode':>13} {'speed-up':>8}")
+    report(
+        f"collectors ({COLLECTOR_COUNT})",
+        lambda: [Collector(**c) for c in json.loads(collectors)],
+        lambda: decode_collectors(collectors),
+        number=50,
+    )
+    report(
+        f"addresses ({ADDRESS_COUNT})",
+        lambda: [Address(**a) for a in json.loads(addresses)["addresses"]],
+        lambda: ADDRESSES_RESPONSE.decode(addresses)[0],
+        number=200,
+    )
+    report(
+        f"bin days ({BIN_DAY_COUNT})",
+        lambda: [BinDay(**b) for b in json.loads(bin_days)["binDays"]],
+        lambda: BIN_DAYS_RESPONSE.decode(bin_days)[0],
+        number=200,
+    )
+    report(
+        "next client-side request",
+        lambda: ClientSideRequest(**json.loads(next_step)["nextClientSideRequest"]),
+        lambda: BIN_DAYS_RESPONSE.decode(next_step)[1],
+        number=2000,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark encoding and decoding the JSON sent to and from the API.
+
+Compares encoders for the client-side response uploaded on every step of a
+request chain, with council pages of realistic sizes, and decoders for API
+responses. See `api/json_backend.py`.
+
+Run from the repository root:
+
+    python benchmarks/bench_json.py
+"""
+
+# External Packages
+import json
+import sys
+import timeit
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Home Assistant is not needed to encode payloads
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Internal Packages
+from bench_decode import bin_days_payload, collectors_payload  # noqa: E402
+from custom_components.bindays.api.decode import BIN_DAYS_RESPONSE, _COLLECTORS  # noqa: E402
+from custom_components.bindays.api.json_backend import JSON_BACKEND, stdlib_dumps  # noqa: E402
+from custom_components.bindays.models.client_side_response import ClientSideResponse  # noqa: E402
+
+PAGE_SIZES = (10_000, 100_000, 500_000)
+"""Council page sizes in bytes, from a small form to a large schedule table."""
+
+
+def client_side_response(size: int) -> ClientSideResponse:
+    """
+    Return a council response with a page of roughly `size` bytes.
+    """
+    row = '<tr><td class="bin">Garden Waste – Green</td><td>Mon 5 Jan 2026 &amp; every 2nd week</td></tr>\n'
+    return ClientSideResponse(
+        requestId=3,
+        statusCode=200,
+        headers={
+            "content-type": "text/html; charset=utf-8",
+            "set-cookie": "ASP.NET_SessionId=abcdef0123456789; path=/; HttpOnly",
+            "cache-control": "private",
+            "date": "Mon, 05 Jan 2026 08:00:00 GMT",
+        },
+        content=row * (size // len(row.encode()) + 1),
+        reasonPhrase="OK",
+        options={"followRedirects": True, "metadata": {"uprn": "100012345678"}},
+    )
+
+
+def time_per_call(func, number: int) -> float:
+    """
+    Return the best time per call in microseconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """
+    Run every benchmark.
+    """
+    print(f"json_dumps backend: {JSON_BACKEND}\n")
+
+    print(f"{'encode':<28} " + " ".join(f"{f'{s // 1000} KB':>10}" for s in PAGE_SIZES))
+    responses = [client_side_response(size) for size in PAGE_SIZES]
+    encoders = {"stdlib_dumps (fallback)": stdlib_dumps}
+    if orjson is not None:
+        encoders["orjson.dumps"] = orjson.dumps
+
+    for name, encode in encoders.items():
+        times = [
+            time_per_call(lambda r=r: encode(r.to_api_payload()), number=50)
+            for r in responses
+        ]
+        print(f"{name:<28} " + " ".join(f"{t:>7.0f} us" for t in times))
+
+    times = [time_per_call(lambda r=r: r.model_dump_json(by_alias=True), number=50) for r in responses]
+    print(f"{'model_dump_json':<28} " + " ".join(f"{t:>7.0f} us" for t in times))
+
+    print(f"\n{'decode':<28} {'collectors':>10} {'bin days':>10}")
+    collectors = collectors_payload()
+    bin_days = bin_days_payload()
+    decoders = {
+        "validate_json (used)": (
+            lambda: _COLLECTORS.validate_json(collectors),
+            lambda: BIN_DAYS_RESPONSE.decode(bin_days),
+        ),
+        "json.loads + validate": (
+            lambda: _COLLECTORS.validate_python(json.loads(collectors)),
+            lambda: BIN_DAYS_RESPONSE._adapter.validate_python(json.loads(bin_days)),
+        ),
+    }
+    if orjson is not None:
+        decoders["orjson.loads + validate"] = (
+            lambda: _COLLECTORS.validate_python(orjson.loads(collectors)),
+            lambda: BIN_DAYS_RESPONSE._adapter.validate_python(orjson.loads(bin_days)),
+        )
+
+    for name, (decode_collectors, decode_bin_days) in decoders.items():
+        print(
+            f"{name:<28} {time_per_call(decode_collectors, 200):>7.0f} us"
+            f" {time_per_call(decode_bin_days, 200):>7.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Local stand-in for the BinDays API and the council websites behind it.
+
+Every lookup is a request chain: the API asks for `depth` client-side
+requests to a mock council before it returns its data, like a council that
+needs a session cookie, a token and then a search. Latency, council page
+sizes and failures can all be injected, so the client can be measured
+repeatably without touching the real API or any council.
+
+    async with StandIn(StandInConfig(depth=3, council_latency=0.05)) as standin:
+        client = BinDaysApiClient(session, standin.api_url)
+"""
+
+# External Packages
+import asyncio
+import json
+import random
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+COLLECTOR_ID = "stand-in"
+"""Collector ID of the mock council."""
+
+
+class StandInConfig:
+    """
+    Behaviour of the stand-in server.
+    """
+
+    def __init__(
+        self,
+        depth: int = 2,
+        api_latency: float = 0.0,
+        council_latency: float = 0.0,
+        payload_size: int = 20_000,
+        addresses: int = 20,
+        bin_days: int = 52,
+        failure_rate: float = 0.0,
+        accept_compressed: bool = True,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialise the configuration.
+
+        `depth` is the number of council requests in each chain, and
+        `payload_size` the size in bytes of each council page. A
+        `failure_rate` fraction of all responses are a 503 asking to be
+        retried straight away. Compressed request bodies are rejected with a
+        415 unless `accept_compressed`.
+        """
+        self.depth = depth
+        self.api_latency = api_latency
+        self.council_latency = council_latency
+        self.payload_size = payload_size
+        self.addresses = addresses
+        self.bin_days = bin_days
+        self.failure_rate = failure_rate
+        self.accept_compressed = accept_compressed
+        self.seed = seed
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the configuration, e.g. to record alongside results.
+        """
+        return dict(vars(self))
+
+
+class StandInStats:
+    """
+    Counts of the requests the stand-in has served.
+    """
+
+    def __init__(self) -> None:
+        self.api_requests = 0
+        self.council_requests = 0
+        self.failures = 0
+        self.bytes_uploaded = 0
+        self.bytes_uploaded_decoded = 0
+        self.chains_completed = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Return the counts.
+        """
+        return dict(vars(self))
+
+
+class StandIn:
+    """
+    Stand-in BinDays API and mock council, served on a local port.
+    """
+
+    def __init__(self, config: Optional[StandInConfig] = None) -> None:
+        """
+        Initialise the stand-in. It is started by entering it as a context manager.
+        """
+        self.config = config or StandInConfig()
+        self.stats = StandInStats()
+        self._random = random.Random(self.config.seed)
+        self._page = self._council_page(self.config.payload_size)
+        self._server: Optional[TestServer] = None
+
+    async def __aenter__(self) -> "StandIn":
+        """
+        Start serving.
+        """
+        app = web.Application(client_max_size=64 * 1024**2)
+        app.router.add_post("/collector", self._collector)
+        app.router.add_post("/{collector}/addresses", self._addresses)
+        app.router.add_post("/{collector}/bin-days", self._bin_days)
+        app.router.add_route("*", "/council/{step}", self._council)
+
+        self._server = TestServer(app)
+        await self._server.start_server()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """
+        Stop serving.
+        """
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    @property
+    def api_url(self) -> str:
+        """
+        Return the base URL of the stand-in API.
+        """
+        assert self._server is not None, "Stand-in is not running"
+        return str(self._server.make_url("")).rstrip("/")
+
+    def address(self, index: int) -> Dict[str, str]:
+        """
+        Return an address of the mock council as the API sends it.
+        """
+        return {
+            "uid": f"{index:012d}",
+            "postcode": "SI1 1AA",
+            "property": str(index + 1),
+            "street": "Stand-In Street",
+            "town": "Benchton",
+        }
+
+    async def _collector(self, request: web.Request) -> web.Response:
+        return await self._step(
+            request,
+            "collector",
+            lambda: {"govUkId": COLLECTOR_ID, "name": "Stand-In Council"},
+        )
+
+    async def _addresses(self, request: web.Request) -> web.Response:
+        return await self._step(
+            request,
+            "addresses",
+            lambda: [self.address(i) for i in range(self.config.addresses)],
+        )
+
+    async def _bin_days(self, request: web.Request) -> web.Response:
+        uid = request.query.get("uid", "0")
+
+        def bin_days():
+            address = {"uid": uid, "postcode": request.query.get("postcode", "")}
+            bins = [{"name": "General Waste", "colour": "Black"}]
+            return [
+                {"date": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}", "address": address, "bins": bins}
+                for i in range(self.config.bin_days)
+            ]
+
+        return await self._step(request, "binDays", bin_days)
+
+    async def _step(self, request: web.Request, key: str, data) -> web.Response:
+        """
+        Serve one step of a chain: the next council request, or the data.
+        """
+        self.stats.api_requests += 1
+        if request.headers.get("Content-Encoding") and not self.config.accept_compressed:
+            return web.Response(status=415)
+
+        # The body is decompressed as it's read
+        body = await request.read()
+        self.stats.bytes_uploaded += request.content_length or 0
+        self.stats.bytes_uploaded_decoded += len(body)
+
+        if failure := await self._inject(self.config.api_latency):
+            return failure
+
+        # Each step echoes the ID of the council request it answers
+        step = json.loads(body)["requestId"] if body else 0
+        if step < self.config.depth:
+            query = request.query_string
+            return web.json_response({
+                "nextClientSideRequest": {
+                    "requestId": step + 1,
+                    "url": str(request.url.with_path(f"/council/{step + 1}").with_query(query)),
+                    "method": "POST" if step else "GET",
+                    "headers": {"Content-Type": "application/x-www-form-urlencoded"} if step else {},
+                    "body": f"step={step + 1}&{query}" if step else None,
+                }
+            })
+
+        self.stats.chains_completed += 1
+        return web.json_response({key: data()})
+
+    async def _council(self, request: web.Request) -> web.Response:
+        """
+        Serve a council page.
+        """
+        self.stats.council_requests += 1
+        await request.read()
+
+        if failure := await self._inject(self.config.council_latency):
+            return failure
+
+        return web.Response(
+            body=self._page,
+            content_type="text/html",
+            headers={"Set-Cookie": f"session={request.match_info['step']}; Path=/"},
+        )
+
+    async def _inject(self, latency: float) -> Optional[web.Response]:
+        """
+        Wait for the injected latency, and return a failure if one is due.
+        """
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        if self.config.failure_rate and self._random.random() < self.config.failure_rate:
+            self.stats.failures += 1
+            return web.Response(status=503, headers={"Retry-After": "0"})
+
+        return None
+
+    @staticmethod
+    def _council_page(size: int) -> bytes:
+        """
+        Return an HTML page of roughly `size` bytes.
+        """
+        row = b"<tr><td>General Waste</td><td>Monday 1 January 2026</td></tr>\n"
+        rows = row * max(0, (size - 32) // len(row) + 1)
+        return (b"<html><body><table>\n" + rows + b"</table></body></html>")[:max(size, 0)]
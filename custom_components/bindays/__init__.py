@@ -5,31 +5,22 @@ The BinDays integration.
 # External Packages
 from __future__ import annotations
 import logging
-from datetime import timedelta
 from typing import List
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.helpers.start import async_at_started
 
 # Internal Packages
-from .api import BinDaysApiClient, BinDaysApiClientError
-from .models.collector import Collector
-from .models.address import Address
-from .models.bin_day import BinDay
-from .const import (
-    DOMAIN,
-    CONF_POSTCODE,
-    CONF_ADDRESS_ID,
-    CONF_COLLECTOR_ID,
-    DEFAULT_API_URL,
-)
+from .hub import async_get_hub
+from .coordinator import BinDaysDataUpdateCoordinator
+from .store import ScheduleStore
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: List[Platform] = [Platform.SENSOR]
+PLATFORMS: List[Platform] = [Platform.SENSOR, Platform.CALENDAR]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -37,64 +28,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Set up BinDays from a config entry.
     """
 
-    hass.data.setdefault(DOMAIN, {})
-
-    session = async_get_clientsession(hass)
-    client = BinDaysApiClient(session, DEFAULT_API_URL)
-
-    postcode = entry.data[CONF_POSTCODE]
-    collector_id = entry.data[CONF_COLLECTOR_ID]
-    address_id = entry.data[CONF_ADDRESS_ID]
-
-    async def async_update_data() -> List[BinDay]:
-        """
-        Fetch data from API endpoint.
-        """
-        try:
-            # Reconstruct minimal objects required by the API client
-            # The API client expects typed Collector and Address objects
-            collector = Collector(
-                govUkId=collector_id,
-                name="Stored Collector",
-                websiteUrl=None,
-                govUkUrl=None,
-            )
-            address = Address(
-                uid=address_id,
-                postcode=postcode,
-                property=None,
-                street=None,
-                town=None,
-            )
-
-            bin_days = await client.get_bin_days(collector, address)
-            return bin_days
-        except BinDaysApiClientError as err:
-            _LOGGER.error("Error communicating with API for %s: %s", address_id, err)
-            raise UpdateFailed(f"Error communicating with API: {err}")
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=DOMAIN,
-        update_method=async_update_data,
-        update_interval=timedelta(hours=12),  # Update twice a day
-    )
-
-    await coordinator.async_config_entry_first_refresh()
+    # A single hub is shared by all entries so refreshes can be de-duplicated
+    coordinator = BinDaysDataUpdateCoordinator(hass, entry, async_get_hub(hass))
+
+    # Releases the entry from the hub on unload, and also when setup fails and is retried
+    entry.async_on_unload(coordinator.async_shutdown)
+
+    # Serve the stored schedule straight away and only block on the API without one
+    has_stored = await coordinator.async_load_stored()
+    if hass.state is not CoreState.running:
+        # Don't hold up Home Assistant starting, refresh once it has started
+        if not has_stored or coordinator.is_stale:
+            _async_refresh_after_start(hass, entry, coordinator)
+    elif not has_stored:
+        await coordinator.async_config_entry_first_refresh()
+    elif coordinator.is_stale:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.entry_id}"
+        )
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+@callback
+def _async_refresh_after_start(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: BinDaysDataUpdateCoordinator
+) -> None:
+    """
+    Refresh an entry once Home Assistant has started.
+
+    Entries without a stored schedule are unavailable until then. Only a few
+    entries refresh at once, so councils aren't all scraped at the same time.
+    """
+
+    @callback
+    def async_start_refresh(_: HomeAssistant) -> None:
+        """
+        Start the refresh in the background.
+        """
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh_in_turn(coordinator.hub.startup_refreshes),
+            f"{DOMAIN} startup refresh {entry.entry_id}",
+        )
+
+    entry.async_on_unload(async_at_started(hass, async_start_refresh))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     Unload a config entry.
     """
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: BinDaysDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+
+        # Cancel the entry's refreshes, closing the shared hub after the last entry
+        await coordinator.async_shutdown()
+
+    return unload_ok
+
 
-    return unload_ok
\ No newline at end of file
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Reload a config entry when its options change.
+    """
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Remove the stored schedule when a config entry is deleted.
+    """
+    await ScheduleStore(hass, entry.entry_id).async_remove()
@@ -1,9 +1,54 @@
 """
 API package.
+
+The client, its response cache and the client-side session are imported on
+first use, so setting up config entries from their stored schedules doesn't
+import the client or the models it sends and receives.
 """
 
+# External Packages
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 # Internal Packages
-from .client import BinDaysApiClient
-from .error import BinDaysApiClientError
+from .error import BinDaysApiClientError, BinDaysChainLimitError, BinDaysCircuitOpenError
+from .rate_limit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .client import BinDaysApiClient, BinDaysResult
+    from .session import create_client_side_session
+
+_LAZY_IMPORTS = {
+    "BinDaysApiClient": ".client",
+    "BinDaysResult": ".client",
+    "ResponseCache": ".cache",
+    "create_client_side_session": ".session",
+}
+"""Module each lazily imported name is defined in."""
+
+__all__ = [
+    "BinDaysApiClient",
+    "BinDaysApiClientError",
+    "BinDaysChainLimitError",
+    "BinDaysCircuitOpenError",
+    "BinDaysResult",
+    "CircuitBreaker",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "create_client_side_session",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a lazily imported name on first use.
+    """
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ["BinDaysApiClient", "BinDaysApiClientError"]
\ No newline at end of file
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,113 @@
+"""
+Streamed, size-capped reading of council response bodies.
+"""
+
+# External Packages
+import codecs
+import re
+from typing import Optional, Tuple
+
+import aiohttp
+
+# Internal Packages
+from .error import BinDaysApiClientError
+
+DEFAULT_MAX_RESPONSE_SIZE = 5 * 1024 * 1024
+"""Default maximum size, in bytes, of a council response body."""
+
+CHUNK_SIZE = 64 * 1024
+"""Size of the chunks a response body is read in."""
+
+SNIFF_SIZE = 1024
+"""Number of bytes at the start of a body searched for a declared charset."""
+
+DEFAULT_CHARSET = "utf-8"
+"""Charset used when a response doesn't declare one."""
+
+_DECLARED_CHARSET = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)|<\?xml[^>]+encoding\s*=\s*["']([\w.:-]+)""",
+    re.IGNORECASE,
+)
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _lookup(charset: Optional[str]) -> Optional[str]:
+    """
+    Return the canonical name of a charset, or None if Python doesn't know it.
+    """
+    if not charset:
+        return None
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return None
+
+
+def detect_charset(content_type_charset: Optional[str], head: bytes) -> str:
+    """
+    Return the charset of a body from its Content-Type, byte order mark or markup.
+    """
+    for bom, charset in _BOMS:
+        if head.startswith(bom):
+            return charset
+
+    if charset := _lookup(content_type_charset):
+        return charset
+
+    if match := _DECLARED_CHARSET.search(head[:SNIFF_SIZE]):
+        if charset := _lookup((match.group(1) or match.group(2)).decode("ascii")):
+            return charset
+
+    return DEFAULT_CHARSET
+
+
+async def read_text(
+    response: aiohttp.ClientResponse, max_size: int = DEFAULT_MAX_RESPONSE_SIZE
+) -> Tuple[str, int]:
+    """
+    Read and decode a response body as it streams in, returning it and its size.
+
+    Fails without reading any more once the body is bigger than `max_size`
+    bytes, or as soon as a larger Content-Length is seen. Undecodable bytes
+    are replaced rather than failing the request.
+    """
+    if response.content_length is not None and response.content_length > max_size:
+        raise BinDaysApiClientError(
+            f"Council response of {response.content_length} bytes is larger than {max_size}"
+        )
+
+    head = b""
+    decoder: Optional[codecs.IncrementalDecoder] = None
+    parts = []
+    size = 0
+
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            raise BinDaysApiClientError(f"Council response is larger than {max_size} bytes")
+
+        # Hold the start of the body back until its charset can be sniffed
+        if decoder is None:
+            head += chunk
+            if len(head) < SNIFF_SIZE:
+                continue
+            chunk, head = head, b""
+            decoder = codecs.getincrementaldecoder(detect_charset(response.charset, chunk))(
+                errors="replace"
+            )
+
+        parts.append(decoder.decode(chunk))
+
+    if decoder is None:
+        decoder = codecs.getincrementaldecoder(detect_charset(response.charset, head))(
+            errors="replace"
+        )
+        parts.append(decoder.decode(head))
+
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts), size
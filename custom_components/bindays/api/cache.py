@@ -0,0 +1,314 @@
+"""
+In-memory caches used by the API client.
+"""
+
+# External Packages
+from __future__ import annotations
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
+# Internal Packages
+if TYPE_CHECKING:
+    from ..models.client_side_response import ClientSideResponse
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_ENTRIES = 256
+"""Default maximum number of entries held by a cache."""
+
+DEFAULT_MAX_VALIDATED_ENTRIES = 32
+"""Default maximum number of response bodies kept for conditional revalidation."""
+
+DEFAULT_MAX_VALIDATED_SIZE = 4 * 1024 * 1024
+"""Default maximum total size, in characters, of the response bodies kept for revalidation."""
+
+DEFAULT_VALIDATED_TTL = 24 * 60 * 60
+"""Default time in seconds a response body is kept for revalidation."""
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+"""HTTP methods whose client-side responses are cached by default."""
+
+
+def conditional_headers(response_headers: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Return the conditional request headers for a response's validators.
+    """
+    headers = {}
+    if etag := response_headers.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := response_headers.get("last-modified"):
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+class LruTtlCache(Generic[K, V]):
+    """
+    A least-recently-used cache whose entries expire after a time to live.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_size: Optional[int] = None,
+        size_of: Optional[Callable[[V], int]] = None,
+    ) -> None:
+        """
+        Initialise the cache.
+
+        With a `max_size`, least recently used entries are also evicted to keep
+        the total of their `size_of` within it, and larger values aren't stored.
+        """
+        self._max_entries = max_entries
+        self._max_size = max_size
+        self._size_of = size_of or (lambda value: 0)
+        self._entries: "OrderedDict[K, Tuple[float, V, int]]" = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        """Number of lookups served from the cache."""
+
+        self.misses = 0
+        """Number of lookups not found in the cache, or found expired."""
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries in the cache.
+        """
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Return the unexpired value for a key, counting the hit or miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: K) -> Optional[V]:
+        """
+        Return the unexpired value for a key without counting it or marking it used.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        """
+        Store a value for a key, evicting the least recently used entries if full.
+        """
+        self._remove(key)
+
+        size = self._size_of(value)
+        if self._max_size is not None and size > self._max_size:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value, size)
+        self._size += size
+
+        while len(self._entries) > self._max_entries or (
+            self._max_size is not None and self._size > self._max_size
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: K) -> None:
+        """
+        Remove the entry for a key, if there is one.
+        """
+        if entry := self._entries.pop(key, None):
+            self._size -= entry[2]
+
+
+ResponseKey = Tuple[str, str, Tuple[Tuple[str, str], ...], Optional[str]]
+"""Cache key of method, URL, request headers and body."""
+
+
+class ResponseCache:
+    """
+    Opt-in cache of client-side responses that are safe to reuse.
+
+    Responses are cached per host for the configured time to live, keyed on
+    the method, URL, request headers and body, so any difference in the
+    request misses the cache. Only successful responses are stored, and never
+    ones marked `Cache-Control: no-store` or setting a cookie, as a session
+    started by one request chain must not be reused by another.
+
+    Successful responses carrying an `ETag` or `Last-Modified` validator are
+    also kept for a while, whatever their time to live, so later requests can
+    be sent conditionally and a `304 Not Modified` answered from the kept body.
+    """
+
+    def __init__(
+        self,
+        host_ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0,
+        methods: Collection[str] = CACHEABLE_METHODS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_validated_entries: int = DEFAULT_MAX_VALIDATED_ENTRIES,
+        max_validated_size: int = DEFAULT_MAX_VALIDATED_SIZE,
+        validated_ttl: float = DEFAULT_VALIDATED_TTL,
+    ) -> None:
+        """
+        Initialise the response cache.
+
+        `host_ttls` maps a host (which also matches its subdomains) to a time
+        to live in seconds. Other hosts use `default_ttl`, where zero disables
+        caching. Up to `max_validated_entries` responses, with bodies totalling
+        at most `max_validated_size` characters, are kept for revalidation for
+        `validated_ttl` seconds.
+        """
+        self._host_ttls = {h.lower(): ttl for h, ttl in (host_ttls or {}).items()}
+        self._default_ttl = default_ttl
+        self._methods = frozenset(m.upper() for m in methods)
+        self._entries: LruTtlCache[ResponseKey, ClientSideResponse] = LruTtlCache(max_entries)
+        self._validated: LruTtlCache[ResponseKey, ClientSideResponse] = LruTtlCache(
+            max_validated_entries,
+            max_size=max_validated_size,
+            size_of=lambda response: len(response.content),
+        )
+        self._validated_ttl = validated_ttl
+
+    @property
+    def hits(self) -> int:
+        """
+        Return the number of requests served from the cache.
+        """
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Return the number of cacheable requests not served from the cache.
+        """
+        return self._entries.misses
+
+    @property
+    def revalidations(self) -> int:
+        """
+        Return the number of `304 Not Modified` responses served from a kept body.
+        """
+        return self._validated.hits
+
+    def __len__(self) -> int:
+        """
+        Return the number of cached responses.
+        """
+        return len(self._entries)
+
+    def is_cacheable(self, method: str) -> bool:
+        """
+        Return whether responses to a request method may be cached.
+        """
+        return method.upper() in self._methods
+
+    def ttl_for(self, method: str, url: str) -> float:
+        """
+        Return the time to live for a request, or zero if it isn't cacheable.
+        """
+        if not self.is_cacheable(method):
+            return 0
+
+        host = (urlsplit(url).hostname or "").lower()
+        while host:
+            if host in self._host_ttls:
+                return self._host_ttls[host]
+            _, _, host = host.partition(".")
+
+        return self._default_ttl
+
+    @staticmethod
+    def key(
+        method: str, url: str, headers: Mapping[str, str], body: Optional[str]
+    ) -> ResponseKey:
+        """
+        Return the cache key for a request.
+        """
+        normalised_headers = tuple(sorted((k.lower(), v) for k, v in headers.items()))
+        return (method.upper(), url, normalised_headers, body)
+
+    def get(self, key: ResponseKey) -> Optional[ClientSideResponse]:
+        """
+        Return the cached response for a request, if there is a fresh one.
+        """
+        return self._entries.get(key)
+
+    def conditional_headers(self, key: ResponseKey) -> Dict[str, str]:
+        """
+        Return the conditional request headers for a request with a kept response.
+        """
+        # Peek without counting, hits are counted when a 304 is served
+        kept = self._validated.peek(key)
+        return conditional_headers(kept.headers) if kept else {}
+
+    def revalidated(
+        self, key: ResponseKey, not_modified: ClientSideResponse
+    ) -> Optional[ClientSideResponse]:
+        """
+        Return the kept response for a request answered with `304 Not Modified`.
+        """
+        kept = self._validated.get(key)
+        if kept is None:
+            return None
+
+        # Headers sent with the 304 replace the kept ones
+        return kept.model_copy(update={"headers": {**kept.headers, **not_modified.headers}})
+
+    def store(
+        self, key: ResponseKey, response: ClientSideResponse, ttl: float
+    ) -> None:
+        """
+        Cache a response if it is successful and may be stored.
+        """
+        if not 200 <= response.status_code < 300:
+            return
+
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return
+
+        if "set-cookie" in response.headers:
+            return
+
+        if ttl > 0:
+            self._entries.set(key, response, ttl)
+
+        if conditional_headers(response.headers):
+            self._validated.set(key, response, self._validated_ttl)
+
+    def clear(self) -> None:
+        """
+        Remove every cached response.
+        """
+        self._entries.clear()
+        self._validated.clear()
@@ -3,8 +3,23 @@ BinDays API Client.
 """
 
 # External Packages
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, TypeVar, Callable
+from typing import (
+    AsyncIterator,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Callable,
+    Awaitable,
+)
+from urllib.parse import urlsplit
+
 import aiohttp
 from pydantic import ValidationError
 
@@ -15,12 +30,70 @@ from ..models.address import Address
 from ..models.bin_day import BinDay
 from ..models.client_side_request import ClientSideRequest
 from ..models.client_side_response import ClientSideResponse
-from .error import BinDaysApiClientError
+from .body import DEFAULT_MAX_RESPONSE_SIZE, read_text
+from .cache import ResponseCache, conditional_headers
+from .deadline import Deadline
+from .decode import (
+    ADDRESSES_RESPONSE,
+    BIN_DAYS_RESPONSE,
+    COLLECTOR_RESPONSE,
+    ResponseDecoder,
+    decode_collectors,
+)
+from .error import BinDaysApiClientError, BinDaysChainLimitError, BinDaysCircuitOpenError
+from .json_backend import JsonDumps, json_dumps
+from .rate_limit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from .session import create_client_side_session
+from .single_flight import SingleFlight
+from .stats import STEP_API, STEP_COUNCIL, ChainRecorder, ClientStats, StepRecorder
+from .upload import (
+    DROPPED_RESPONSE_HEADERS,
+    UPLOAD_ENCODINGS,
+    compress_body,
+    encode_client_side_payload,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+CONDITIONAL_HEADERS = frozenset({"if-none-match", "if-modified-since"})
+"""Request headers that make a request conditional."""
+
+DEFAULT_BULK_CONCURRENCY = 10
+"""Default maximum number of bin day chains run at once by a bulk fetch."""
+
+DEFAULT_BULK_CONCURRENCY_PER_COLLECTOR = 2
+"""Default maximum number of bin day chains run at once against one council."""
+
+DEFAULT_CHAIN_TIMEOUT = 120.0
+"""Default time in seconds a request chain has to return data, including retries."""
+
+DEFAULT_REQUEST_TIMEOUT = 30.0
+"""Default time in seconds a single request in a chain has to complete."""
+
+DEFAULT_MAX_STEPS = 20
+"""Default maximum number of API requests made by a request chain."""
+
+
+class BinDaysResult(NamedTuple):
+    """
+    The outcome of fetching the bin days for one address in a bulk fetch.
+    """
+
+    collector: Collector
+    """The Collector the bin days were requested from."""
+
+    address: Address
+    """The Address the bin days were requested for."""
+
+    bin_days: Optional[List[BinDay]]
+    """The bin days, or None if fetching them failed."""
+
+    error: Optional[BinDaysApiClientError]
+    """The error raised fetching the bin days, if any."""
+
 
 class BinDaysApiClient:
     """
@@ -31,22 +104,98 @@ class BinDaysApiClient:
         self,
         session: aiohttp.ClientSession,
         base_url: str = DEFAULT_API_URL,
+        response_cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        chain_timeout: float = DEFAULT_CHAIN_TIMEOUT,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        max_steps: int = DEFAULT_MAX_STEPS,
+        client_side_session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        upload_encoding: Optional[str] = "gzip",
+        dropped_response_headers: Collection[str] = DROPPED_RESPONSE_HEADERS,
+        max_response_size: int = DEFAULT_MAX_RESPONSE_SIZE,
+        json_encoder: JsonDumps = json_dumps,
     ):
         """
         Initialise BinDays API client.
+
+        Client-side responses are only reused if a `response_cache` is given.
+        Each API and client-side request is retried by the `retry_policy`, and
+        the `circuit_breaker` fails fast for hosts that keep failing.
+
+        A multi-step request chain must return data within `chain_timeout`
+        seconds and `max_steps` API requests. Each request in the chain gets
+        the rest of that budget, up to `request_timeout` seconds.
+
+        Client-side requests are sent with `client_side_session`, which should
+        be stateless and is left open for its owner to close. Without one, the
+        client creates its own session on first use and closes it in `close`.
+        They are paced per council by the `rate_limiter`, which also holds back
+        a council for as long as its `Retry-After` header asks. Their bodies
+        are streamed in, failing once larger than `max_response_size` bytes.
+
+        Client-side responses are uploaded back to the API without the
+        `dropped_response_headers`, and compressed with `upload_encoding`
+        ("gzip", "deflate" or None). Compression is turned off if the API
+        rejects a compressed body with a 415, or with a 400 that the same body
+        uncompressed doesn't get. Request bodies are encoded
+        with `json_encoder`, orjson when it is installed.
         """
+        if upload_encoding is not None and upload_encoding not in UPLOAD_ENCODINGS:
+            raise ValueError(f"Unsupported upload encoding '{upload_encoding}'")
+
         self._session = session
         self._base_url = base_url.rstrip("/")
+        self._response_cache = response_cache
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._chain_timeout = chain_timeout
+        self._request_timeout = request_timeout
+        self._max_steps = max(1, max_steps)
 
-        # Internal session for client-side requests that should be stateless (no automatic cookie handling)
-        # We reuse the connector from the provided session to benefit from connection pooling
-        # Disable Brotli compression to avoid aiohttp bugs with br encoding
-        self._client_side_session = aiohttp.ClientSession(
-            connector=session.connector,
-            connector_owner=False,
-            cookie_jar=aiohttp.DummyCookieJar(),
-            headers={"Accept-Encoding": "gzip, deflate"},
-        )
+        # Session for client-side requests that should be stateless (no automatic cookie handling)
+        self._client_side_session = client_side_session
+        self._owns_client_side_session = client_side_session is None
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._upload_encoding = upload_encoding
+        self._max_response_size = max_response_size
+        self._json_encoder = json_encoder
+        self._dropped_response_headers = frozenset(h.lower() for h in dropped_response_headers)
+
+        # Identical multi-step chains already in flight, shared between callers
+        self._in_flight = SingleFlight()
+
+        self.stats = ClientStats()
+        """Statistics on the request chains run by the client."""
+
+        # Last collectors list and the validators to revalidate it with
+        self._collectors: Optional[List[Collector]] = None
+        self._collectors_validators: Dict[str, str] = {}
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        Returns the cache client-side responses are reused from, if any.
+        """
+        return self._response_cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """
+        Returns the rate limiter pacing client-side requests.
+        """
+        return self._rate_limiter
+
+    async def close(self) -> None:
+        """
+        Cancels the request chains in flight and closes the client's own session.
+        """
+        self._in_flight.cancel_all()
+
+        if self._owns_client_side_session and self._client_side_session is not None:
+            await self._client_side_session.close()
+            self._client_side_session = None
 
     async def get_collectors(self) -> List[Collector]:
         """
@@ -54,11 +203,22 @@ class BinDaysApiClient:
         """
         url = f"{self._base_url}/collectors"
 
+        # Only download and validate the list again if it has changed
+        headers = self._collectors_validators if self._collectors is not None else {}
+
         try:
-            async with self._session.get(url) as response:
+            async with self._session.get(url, headers=headers) as response:
+                if response.status == 304 and self._collectors is not None:
+                    _LOGGER.debug("Collectors not modified, using previous list")
+                    return list(self._collectors)
+
                 response.raise_for_status()
-                data = await response.json()
-                return [Collector(**c) for c in data]
+                # Validated straight from the raw JSON, without building dicts first
+                collectors = decode_collectors(await response.read())
+
+                self._collectors = collectors
+                self._collectors_validators = conditional_headers(response.headers)
+                return list(collectors)
         except aiohttp.ClientError as e:
             _LOGGER.debug("Failed to fetch collectors: %s", e)
             raise BinDaysApiClientError(f"Network error fetching collectors: {e}") from e
@@ -77,9 +237,7 @@ class BinDaysApiClient:
         return await self._fetch_data(
             url=url,
             params={"postcode": postcode},
-            data_extractor=lambda json_data: Collector(**json_data["collector"])
-            if json_data.get("collector")
-            else None,
+            decoder=COLLECTOR_RESPONSE,
             error_message=f"No collector found for postcode '{postcode}'.",
         )
 
@@ -92,12 +250,9 @@ class BinDaysApiClient:
         return await self._fetch_data(
             url=url,
             params={"postcode": postcode},
-            data_extractor=lambda json_data: [
-                Address(**a) for a in json_data["addresses"]
-            ]
-            if json_data.get("addresses")
-            else None,
+            decoder=ADDRESSES_RESPONSE,
             error_message=f"No addresses found for postcode '{postcode}'.",
+            collector_id=collector.gov_uk_id,
         )
 
     async def get_bin_days(self, collector: Collector, address: Address) -> List[BinDay]:
@@ -112,83 +267,344 @@ class BinDaysApiClient:
         return await self._fetch_data(
             url=url,
             params={"postcode": address.postcode, "uid": address.uid},
-            data_extractor=lambda json_data: [BinDay(**b) for b in json_data["binDays"]]
-            if json_data.get("binDays")
-            else None,
+            decoder=BIN_DAYS_RESPONSE,
             error_message=f"No bin days found for collector '{collector.name}' and address '{address_string}'.",
+            collector_id=collector.gov_uk_id,
         )
 
+    async def get_bin_days_many(
+        self,
+        targets: Iterable[Tuple[Collector, Address]],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        max_concurrency_per_collector: int = DEFAULT_BULK_CONCURRENCY_PER_COLLECTOR,
+    ) -> AsyncIterator[BinDaysResult]:
+        """
+        Retrieves the BinDay lists for many Collector and Address pairs.
+
+        Chains run concurrently, bounded both overall and per council, and
+        results are yielded as each one finishes. A failure for one address is
+        reported in its result rather than raised.
+        """
+        overall_limit = asyncio.Semaphore(max_concurrency)
+        collector_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(collector: Collector, address: Address) -> BinDaysResult:
+            collector_limit = collector_limits.setdefault(
+                collector.gov_uk_id, asyncio.Semaphore(max_concurrency_per_collector)
+            )
+
+            # Wait for the council's limit first so queued chains don't hold an overall slot
+            async with collector_limit, overall_limit:
+                try:
+                    bin_days = await self.get_bin_days(collector, address)
+                except BinDaysApiClientError as e:
+                    return BinDaysResult(collector, address, None, e)
+
+            return BinDaysResult(collector, address, bin_days, None)
+
+        tasks = [asyncio.ensure_future(fetch(c, a)) for c, a in targets]
+
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Stop outstanding chains if the caller stops iterating early
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _fetch_data(
         self,
         url: str,
         params: Dict[str, str],
-        data_extractor: Callable[[Dict[str, Any]], Optional[T]],
+        decoder: ResponseDecoder[T],
         error_message: str,
+        collector_id: Optional[str] = None,
     ) -> T:
         """
         Generic function to fetch data from the API, handling multi-step requests.
+
+        Concurrent calls for the same URL and parameters share a single chain.
+        """
+        key = (url, tuple(sorted(params.items())))
+
+        result = await self._in_flight.run(
+            key,
+            lambda: self._run_chain(url, params, decoder, error_message, collector_id),
+        )
+
+        # Callers get their own list so in-place changes don't leak between them
+        return list(result) if isinstance(result, list) else result
+
+    async def _run_chain(
+        self,
+        url: str,
+        params: Dict[str, str],
+        decoder: ResponseDecoder[T],
+        error_message: str,
+        collector_id: Optional[str] = None,
+    ) -> T:
+        """
+        Run a multi-step request chain against the API until it returns data.
+
+        Fails with `BinDaysChainLimitError` if the chain runs out of time or steps.
+        The chain and each of its steps are recorded in the client's `stats`,
+        against `collector_id` if given.
+        """
+        with self.stats.chain(collector_id) as chain:
+            return await self._run_chain_steps(
+                url, params, decoder, error_message, chain, collector_id
+            )
+
+    async def _run_chain_steps(
+        self,
+        url: str,
+        params: Dict[str, str],
+        decoder: ResponseDecoder[T],
+        error_message: str,
+        chain: ChainRecorder,
+        collector_id: Optional[str] = None,
+    ) -> T:
+        """
+        Run the steps of a multi-step request chain.
+
+        API requests for a collector have a circuit of their own, as the API
+        fails a step when the collector's council or scraper does.
         """
         client_side_response: Optional[ClientSideResponse] = None
+        deadline = Deadline(self._chain_timeout, self._request_timeout)
+        circuit = f"{urlsplit(url).hostname} for {collector_id}" if collector_id else None
 
-        while True:
+        for _ in range(self._max_steps):
             # Prepare body for the main API request.
             request_body = None
             if client_side_response:
-                request_body = client_side_response.to_api_payload()
+                request_body = encode_client_side_payload(
+                    client_side_response.to_api_payload(),
+                    self._dropped_response_headers,
+                    self._json_encoder,
+                )
 
+            # Make the main POST request to our API endpoint
+            with chain.step(STEP_API) as step:
+                data = await self._post_step(
+                    url, params, request_body, deadline, step, circuit
+                )
+                step.received = len(data)
+
+            # Try to extract the final data, or the next step
             try:
-                # Make the main POST request to our API endpoint
-                async with self._session.post(
-                    url,
-                    params=params,
-                    json=request_body,
-                ) as response:
-                    if not response.ok:
-                        text = await response.text()
-                        _LOGGER.debug("API Error %s: %s", response.status, text)
-                        raise BinDaysApiClientError(
-                            f"API returned {response.status}: {text}",
-                            status=response.status,
-                            data=text,
-                        )
-
-                    data = await response.json()
-            except aiohttp.ClientError as e:
-                _LOGGER.debug("API request failed: %s", e)
-                raise BinDaysApiClientError(f"API request failed: {e}") from e
-
-            # Try to extract the final data
-            try:
-                extracted_data = data_extractor(data)
-                if extracted_data is not None:
-                    return extracted_data
+                extracted_data, next_request = decoder.decode(data)
             except ValidationError as e:
                 _LOGGER.debug("Data validation error: %s", e)
                 raise BinDaysApiClientError(f"Failed to parse response: {e}") from e
 
-            # If no data, check if there's a next step
-            next_request_data = data.get("nextClientSideRequest")
-            if next_request_data:
-                try:
-                    next_request = ClientSideRequest(**next_request_data)
-                    # Perform the client-side request required by the API
+            if extracted_data:
+                return extracted_data
+
+            if next_request:
+                # Perform the client-side request required by the API
+                with chain.step(STEP_COUNCIL) as step:
+                    step.sent = len(next_request.body.encode()) if next_request.body else 0
                     client_side_response = await self._send_client_side_request(
-                        next_request
+                        next_request, deadline
                     )
-                    # Continue the loop
-                except ValidationError as e:
-                    _LOGGER.debug("Failed to parse next client side request: %s", e)
-                    raise BinDaysApiClientError(
-                        f"Invalid client side request received: {e}"
-                    ) from e
+                    step.received = client_side_response.body_size
+                # Continue the loop
             else:
                 _LOGGER.warning(
                     "API returned neither data nor next instruction. URL: %s", url
                 )
                 raise BinDaysApiClientError(error_message)
 
+        _LOGGER.warning(
+            "API did not return data within %s steps. URL: %s", self._max_steps, url
+        )
+        raise BinDaysChainLimitError(
+            f"Request chain did not return data within {self._max_steps} steps"
+        )
+
+    async def _post_step(
+        self,
+        url: str,
+        params: Dict[str, str],
+        request_body: Optional[bytes],
+        deadline: Deadline,
+        step: StepRecorder,
+        circuit: Optional[str] = None,
+    ) -> bytes:
+        """
+        Sends a step of a request chain to the API with retries, compressing its body.
+        """
+        upload, encoding = request_body, None
+        if request_body is not None:
+            upload, encoding = compress_body(request_body, self._upload_encoding)
+
+        step.sent = len(upload or b"")
+        try:
+            return await self._with_retries(
+                url,
+                lambda: self._post_api(url, params, upload, deadline, encoding),
+                deadline=deadline,
+                circuit=circuit,
+            )
+        except BinDaysApiClientError as e:
+            if encoding is None or e.status not in (400, 415):
+                raise
+            if e.status == 415:
+                # The API doesn't take compressed bodies at all
+                self._upload_encoding = None
+
+        _LOGGER.debug("API rejected a %s request body, sending uncompressed", encoding)
+
+        # If the uncompressed body is rejected too, the body was at fault, not compression
+        step.sent += len(request_body)
+        data = await self._with_retries(
+            url,
+            lambda: self._post_api(url, params, request_body, deadline),
+            deadline=deadline,
+            circuit=circuit,
+        )
+
+        # The API can't read compressed bodies, so stop sending them
+        self._upload_encoding = None
+        return data
+
+    async def _post_api(
+        self,
+        url: str,
+        params: Dict[str, str],
+        request_body: Optional[bytes],
+        deadline: Deadline,
+        encoding: Optional[str] = None,
+    ) -> bytes:
+        """
+        Sends a single step of a request chain to the API, returning the raw JSON.
+
+        The `request_body` is already encoded as JSON, and compressed with `encoding`.
+        """
+        headers = None
+        if request_body is not None:
+            headers = {"Content-Type": "application/json"}
+            if encoding is not None:
+                headers["Content-Encoding"] = encoding
+
+        try:
+            async with self._session.post(
+                url,
+                params=params,
+                data=request_body,
+                headers=headers,
+                timeout=deadline.client_timeout(),
+            ) as response:
+                if not response.ok:
+                    text = await response.text()
+                    _LOGGER.debug("API Error %s: %s", response.status, text)
+                    raise BinDaysApiClientError(
+                        f"API returned {response.status}: {text}",
+                        status=response.status,
+                        data=text,
+                        retry_after=parse_retry_after(response.headers),
+                    )
+
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.debug("API request failed: %s", e)
+            raise BinDaysApiClientError(f"API request failed: {e}") from e
+
+    async def _with_retries(
+        self,
+        url: str,
+        send: Callable[[], Awaitable[T]],
+        check: Optional[Callable[[T], Optional[BinDaysApiClientError]]] = None,
+        deadline: Optional[Deadline] = None,
+        circuit: Optional[str] = None,
+    ) -> T:
+        """
+        Sends a request, retrying transient failures and tracking its circuit.
+
+        `check` can report a returned result as a retryable failure. If the
+        retries run out, that result is returned rather than raised. No
+        attempt is started, and no retry waited for, past the `deadline`.
+        Failures count towards the `circuit`, which is the URL's host by default.
+        """
+        host = circuit or urlsplit(url).hostname or ""
+        attempt = 1
+
+        while True:
+            if deadline is not None and deadline.expired:
+                raise BinDaysChainLimitError(
+                    f"Request chain did not return data within {deadline.timeout:.0f}s"
+                )
+
+            if not self._circuit_breaker.allow(host):
+                raise BinDaysCircuitOpenError(
+                    f"Requests to {host} are failing, not retrying for "
+                    f"{self._circuit_breaker.retry_in(host):.0f}s"
+                )
+
+            try:
+                result = await send()
+            except BinDaysApiClientError as e:
+                if not self._retry_policy.is_retryable(e):
+                    # The host answered, so it isn't down
+                    if e.status is not None:
+                        self._circuit_breaker.record_success(host)
+                    raise
+
+                self._circuit_breaker.record_failure(host)
+                delay = self._retry_delay(attempt, e, deadline)
+                if delay is None:
+                    if deadline is not None and deadline.expired:
+                        raise BinDaysChainLimitError(
+                            f"Request chain did not return data within {deadline.timeout:.0f}s"
+                        ) from e
+                    raise
+                failure = e
+            else:
+                failure = check(result) if check else None
+                if failure is None:
+                    self._circuit_breaker.record_success(host)
+                    return result
+
+                self._circuit_breaker.record_failure(host)
+                delay = self._retry_delay(attempt, failure, deadline)
+                if delay is None:
+                    return result
+
+            _LOGGER.debug(
+                "Request to %s failed (attempt %s), retrying in %.1fs: %s",
+                host,
+                attempt,
+                delay,
+                failure,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        failure: BinDaysApiClientError,
+        deadline: Optional[Deadline],
+    ) -> Optional[float]:
+        """
+        Returns how long to wait before retrying a failure, or None if it shouldn't be.
+        """
+        if attempt >= self._retry_policy.max_attempts:
+            return None
+
+        delay = self._retry_policy.delay(attempt, failure.retry_after)
+
+        # Waiting would use up the rest of the chain's time
+        if deadline is not None and delay >= deadline.remaining:
+            return None
+
+        return delay
+
     async def _send_client_side_request(
-        self, request: ClientSideRequest
+        self, request: ClientSideRequest, deadline: Deadline
     ) -> ClientSideResponse:
         """
         Sends a client-side request as instructed by the main API.
@@ -207,6 +623,74 @@ class BinDaysApiClient:
                 if request.method.upper() == "POST":
                     headers_to_send["Content-Type"] = "application/json"
 
+        # Serve idempotent requests from the response cache when enabled
+        cache_key = None
+        cache_ttl = 0.0
+        validators: Dict[str, str] = {}
+        if self._response_cache is not None and self._response_cache.is_cacheable(request.method):
+            cache_key = ResponseCache.key(
+                request.method, request.url, headers_to_send, request.body
+            )
+            cache_ttl = self._response_cache.ttl_for(request.method, request.url)
+            if cache_ttl > 0 and (cached := self._response_cache.get(cache_key)):
+                _LOGGER.debug("Client-side response served from cache: %s", request.url)
+                return cached.model_copy(
+                    update={"request_id": request.request_id, "options": request.options}
+                )
+
+            # Revalidate a kept response rather than downloading it again
+            if not any(k.lower() in CONDITIONAL_HEADERS for k in headers_to_send):
+                validators = self._response_cache.conditional_headers(cache_key)
+                headers_to_send.update(validators)
+
+        def send() -> Awaitable[ClientSideResponse]:
+            return self._with_retries(
+                request.url,
+                lambda: self._perform_client_side_request(request, headers_to_send, deadline),
+                check=self._retryable_client_side_failure,
+                deadline=deadline,
+            )
+
+        client_side_response = await send()
+
+        if cache_key is not None:
+            if validators and client_side_response.status_code == 304:
+                if kept := self._response_cache.revalidated(cache_key, client_side_response):
+                    _LOGGER.debug("Client-side response not modified: %s", request.url)
+                    client_side_response = kept.model_copy(
+                        update={"request_id": request.request_id, "options": request.options}
+                    )
+                else:
+                    # The kept body has gone since the request was sent, so ask for it in full
+                    for name in validators:
+                        del headers_to_send[name]
+                    client_side_response = await send()
+
+            self._response_cache.store(cache_key, client_side_response, cache_ttl)
+
+        return client_side_response
+
+    async def _perform_client_side_request(
+        self,
+        request: ClientSideRequest,
+        headers_to_send: Dict[str, str],
+        deadline: Deadline,
+    ) -> ClientSideResponse:
+        """
+        Performs a single attempt of a client-side request.
+        """
+        if self._client_side_session is None:
+            self._client_side_session = create_client_side_session()
+
+        host = urlsplit(request.url).hostname or ""
+        try:
+            await asyncio.wait_for(self._rate_limiter.acquire(host), deadline.remaining)
+        except asyncio.TimeoutError:
+            # Not the council's fault, so raised without a retryable cause
+            raise BinDaysChainLimitError(
+                f"Request chain did not return data within {deadline.timeout:.0f}s"
+            )
+
         try:
             async with self._client_side_session.request(
                 method=request.method,
@@ -214,9 +698,17 @@ class BinDaysApiClient:
                 headers=headers_to_send,
                 data=request.body,
                 allow_redirects=request.options.follow_redirects,
+                timeout=deadline.client_timeout(),
             ) as response:
 
-                content = await response.text()
+                content, body_size = await read_text(response, self._max_response_size)
+                _LOGGER.debug("Read %s bytes from %s", body_size, request.url)
+
+                # Hold back every request to the council, not just this chain's retry
+                if response.status in (429, 503):
+                    retry_after = parse_retry_after(response.headers)
+                    if retry_after is not None:
+                        self._rate_limiter.pause(host, retry_after)
 
                 # Extract headers and normalize keys to lowercase
                 headers_dict = {}
@@ -234,8 +726,25 @@ class BinDaysApiClient:
                     content=content,
                     reasonPhrase=response.reason if response.reason else "",
                     options=request.options,
+                    body_size=body_size,
                 )
 
+        except BinDaysApiClientError:
+            raise
         except Exception as e:
             _LOGGER.debug("Client side request execution failed: %s", e)
-            raise BinDaysApiClientError(f"Client side request failed: {e}") from e
\ No newline at end of file
+            raise BinDaysApiClientError(f"Client side request failed: {e}") from e
+
+    @staticmethod
+    def _retryable_client_side_failure(
+        response: ClientSideResponse,
+    ) -> Optional[BinDaysApiClientError]:
+        """
+        Returns an error for a council response that is worth retrying, if it is one.
+        """
+        error = BinDaysApiClientError(
+            f"Council returned {response.status_code}",
+            status=response.status_code,
+            retry_after=parse_retry_after(response.headers),
+        )
+        return error if RetryPolicy.is_retryable(error) else None
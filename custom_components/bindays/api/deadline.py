@@ -0,0 +1,61 @@
+"""
+Time budget shared by the steps of a request chain.
+"""
+
+# External Packages
+import time
+from typing import Optional
+
+import aiohttp
+
+# Internal Packages
+from .error import BinDaysChainLimitError
+
+
+class Deadline:
+    """
+    A point in time by which a request chain must finish.
+
+    Every API and client-side request in the chain is given whatever is left
+    of the budget, capped at `request_timeout` so that a single hung request
+    can time out and be retried rather than use up the whole chain. No
+    request is given a timeout once the budget has run out.
+    """
+
+    def __init__(self, timeout: float, request_timeout: Optional[float] = None) -> None:
+        """
+        Initialise a deadline `timeout` seconds from now.
+        """
+        self.timeout = timeout
+        self.request_timeout = request_timeout
+        self._expires_at = time.monotonic() + timeout
+
+    @property
+    def remaining(self) -> float:
+        """
+        Return the number of seconds left before the deadline.
+        """
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """
+        Return whether the deadline has passed.
+        """
+        return self.remaining <= 0
+
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        """
+        Return the timeout for the next request in the chain.
+
+        Raises BinDaysChainLimitError once the deadline has passed, as aiohttp
+        treats a timeout of zero as no timeout at all.
+        """
+        remaining = self.remaining
+        if remaining <= 0:
+            raise BinDaysChainLimitError(
+                f"Request chain did not return data within {self.timeout:.0f}s"
+            )
+        if self.request_timeout is not None:
+            remaining = min(remaining, self.request_timeout)
+        return aiohttp.ClientTimeout(total=remaining)
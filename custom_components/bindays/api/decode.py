@@ -0,0 +1,69 @@
+"""
+Decoding of API payloads into models.
+
+Responses are validated straight from the raw JSON by validators built once at
+import, rather than parsed into dicts and then constructed model by model from
+keyword arguments. See `benchmarks/bench_decode.py`.
+"""
+
+# External Packages
+from typing import Any, Generic, List, Optional, Tuple, TypeVar, Union
+
+from pydantic import Field, TypeAdapter, create_model
+
+# Internal Packages
+from ..models.address import Address
+from ..models.bin_day import BinDay
+from ..models.client_side_request import ClientSideRequest
+from ..models.collector import Collector
+
+T = TypeVar("T")
+
+_COLLECTORS = TypeAdapter(List[Collector])
+
+
+def decode_collectors(raw: Union[bytes, str]) -> List[Collector]:
+    """
+    Decode the collectors list from its raw JSON.
+    """
+    return _COLLECTORS.validate_json(raw)
+
+
+class ResponseDecoder(Generic[T]):
+    """
+    Decodes the raw JSON of an API response in a multi-step request chain.
+
+    A response carries either its data under `key`, or the next client-side
+    request to perform.
+    """
+
+    def __init__(self, key: str, data_type: Any) -> None:
+        """
+        Initialise the decoder, building its validator.
+        """
+        model = create_model(
+            f"{key[0].upper()}{key[1:]}Response",
+            data=(Optional[data_type], Field(default=None, alias=key)),
+            next_client_side_request=(
+                Optional[ClientSideRequest],
+                Field(default=None, alias="nextClientSideRequest"),
+            ),
+        )
+        self._adapter = TypeAdapter(model)
+
+    def decode(self, raw: Union[bytes, str]) -> Tuple[Optional[T], Optional[ClientSideRequest]]:
+        """
+        Return the data and the next client-side request in a response.
+        """
+        response = self._adapter.validate_json(raw)
+        return response.data, response.next_client_side_request
+
+
+COLLECTOR_RESPONSE: ResponseDecoder[Collector] = ResponseDecoder("collector", Collector)
+"""Decoder for the collector lookup of a postcode."""
+
+ADDRESSES_RESPONSE: ResponseDecoder[List[Address]] = ResponseDecoder("addresses", List[Address])
+"""Decoder for the addresses of a postcode."""
+
+BIN_DAYS_RESPONSE: ResponseDecoder[List[BinDay]] = ResponseDecoder("binDays", List[BinDay])
+"""Decoder for the bin days of an address."""
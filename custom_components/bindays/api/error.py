@@ -15,7 +15,21 @@ class BinDaysApiClientError(Exception):
         message: str,
         status: Optional[int] = None,
         data: Optional[str] = None,
+        retry_after: Optional[float] = None,
     ) -> None:
         super().__init__(message)
         self.status = status
         self.data = data
+        self.retry_after = retry_after
+
+
+class BinDaysCircuitOpenError(BinDaysApiClientError):
+    """
+    Exception to indicate requests to a host are failing fast after repeated failures.
+    """
+
+
+class BinDaysChainLimitError(BinDaysApiClientError):
+    """
+    Exception to indicate a request chain ran out of time or steps before returning data.
+    """
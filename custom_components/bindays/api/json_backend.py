@@ -0,0 +1,37 @@
+"""
+JSON encoding of request bodies, using orjson when it is installed.
+
+Home Assistant installs orjson, so it is normally used. Otherwise the
+standard library encoder is used as it was before, escaping non-ASCII
+characters, as its ASCII-only path is the faster one.
+
+Responses are not decoded here: validating the raw JSON with pydantic is
+faster than parsing it with either library first. See
+`benchmarks/bench_json.py`.
+"""
+
+# External Packages
+import json
+from typing import Any, Callable
+
+JsonDumps = Callable[[Any], bytes]
+"""Function encoding an object as UTF-8 JSON."""
+
+
+def stdlib_dumps(obj: Any) -> bytes:
+    """
+    Encode an object as JSON with the standard library.
+    """
+    return json.dumps(obj).encode()
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+json_dumps: JsonDumps = orjson.dumps if orjson is not None else stdlib_dumps
+"""The fastest available JSON encoder."""
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+"""Name of the library behind `json_dumps`."""
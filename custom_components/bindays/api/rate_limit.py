@@ -0,0 +1,116 @@
+"""
+Rate limiting of client-side requests to council websites.
+"""
+
+# External Packages
+import asyncio
+import time
+from typing import Dict, Optional
+
+DEFAULT_RATE = 1.0
+"""Default number of requests per second sent to a single council."""
+
+DEFAULT_BURST = 5
+"""Default number of requests that can be sent to a single council at once."""
+
+
+class _Bucket:
+    """
+    Token bucket and queue of a single host.
+    """
+
+    def __init__(self, tokens: float) -> None:
+        self.tokens = tokens
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.waiting = 0
+        # Locks wake their waiters in the order they started waiting
+        self.lock = asyncio.Lock()
+
+
+class RateLimiter:
+    """
+    Per-host token bucket rate limiter.
+
+    Each host can be sent `burst` requests at once, then `rate` requests per
+    second. Requests to a host that is over its limit queue in the order they
+    arrived, without holding up requests to other hosts. A host can also be
+    paused, e.g. for the time asked for by a `Retry-After` header.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+        """
+        Initialise the rate limiter.
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, _Bucket] = {}
+
+        self.acquired = 0
+        """Number of requests let through."""
+
+        self.delayed = 0
+        """Number of requests that had to wait."""
+
+        self.wait_time = 0.0
+        """Total time in seconds requests have waited."""
+
+    def queue_depth(self, host: Optional[str] = None) -> int:
+        """
+        Return the number of requests waiting for a host, or for every host.
+        """
+        if host is not None:
+            bucket = self._buckets.get(host)
+            return bucket.waiting if bucket is not None else 0
+
+        return sum(bucket.waiting for bucket in self._buckets.values())
+
+    async def acquire(self, host: str) -> None:
+        """
+        Wait until a request may be sent to a host.
+        """
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self.burst)
+
+        started_at = time.monotonic()
+        bucket.waiting += 1
+        try:
+            async with bucket.lock:
+                while (delay := self._delay(bucket)) > 0:
+                    await asyncio.sleep(delay)
+                bucket.tokens -= 1
+        finally:
+            bucket.waiting -= 1
+
+        waited = time.monotonic() - started_at
+        self.acquired += 1
+        if waited > 0.001:
+            self.delayed += 1
+            self.wait_time += waited
+
+    def pause(self, host: str, delay: float) -> None:
+        """
+        Hold back requests to a host for `delay` seconds.
+        """
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self.burst)
+
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+
+    def _delay(self, bucket: _Bucket) -> float:
+        """
+        Refill a bucket, returning how long until it has a token to spend.
+        """
+        now = time.monotonic()
+        bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated_at) * self.rate)
+        bucket.updated_at = now
+
+        if bucket.blocked_until > now:
+            return bucket.blocked_until - now
+
+        if bucket.tokens >= 1:
+            return 0.0
+
+        return (1 - bucket.tokens) / self.rate
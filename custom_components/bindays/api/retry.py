@@ -0,0 +1,174 @@
+"""
+Retry policy and circuit breaker for the API client.
+"""
+
+# External Packages
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Mapping, Optional
+
+import aiohttp
+
+# Internal Packages
+from .error import BinDaysApiClientError
+
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+"""HTTP statuses worth retrying: timeouts, rate limiting and server errors."""
+
+RETRYABLE_EXCEPTIONS = (
+    asyncio.TimeoutError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+)
+"""Transport errors worth retrying."""
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Return the delay in seconds requested by a `Retry-After` header, if any.
+    """
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to wait between attempts.
+
+    Delays grow exponentially from `base_delay` up to `max_delay`, with full
+    jitter so many clients retrying the same council don't do so in step. A
+    `Retry-After` sent by the server is honoured, capped at `max_delay`.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ) -> None:
+        """
+        Initialise the retry policy.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def is_retryable(error: BinDaysApiClientError) -> bool:
+        """
+        Return whether a failure is transient and worth retrying.
+        """
+        if error.status is not None:
+            return error.status in RETRYABLE_STATUSES
+
+        return isinstance(error.__cause__, RETRYABLE_EXCEPTIONS)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Return how long to wait before the next attempt, after `attempt` failures.
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class _Circuit:
+    """
+    Failure state of a single host.
+    """
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_started_at: Optional[float] = None
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit for a host
+    opens and requests to it fail fast. Once `reset_timeout` has passed, a
+    single trial request is let through: success closes the circuit, and
+    failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        """
+        Initialise the circuit breaker.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def is_open(self, host: str) -> bool:
+        """
+        Return whether the circuit for a host is open.
+        """
+        circuit = self._circuits.get(host)
+        return circuit is not None and circuit.opened_at is not None
+
+    def retry_in(self, host: str) -> float:
+        """
+        Return how long until an open circuit lets a trial request through.
+        """
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.opened_at is None:
+            return 0.0
+        return max(0.0, circuit.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self, host: str) -> bool:
+        """
+        Return whether a request to a host may be sent now.
+        """
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.opened_at is None:
+            return True
+
+        if self.retry_in(host) > 0:
+            return False
+
+        # Only one trial at a time, unless the last one never reported back
+        now = time.monotonic()
+        trial_started_at = circuit.trial_started_at
+        if trial_started_at is not None and now - trial_started_at < self.reset_timeout:
+            return False
+
+        circuit.trial_started_at = now
+        return True
+
+    def record_success(self, host: str) -> None:
+        """
+        Record a successful request, closing the host's circuit.
+        """
+        self._circuits.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        """
+        Record a failed request, opening the host's circuit past the threshold.
+        """
+        circuit = self._circuits.setdefault(host, _Circuit())
+        circuit.failures += 1
+        circuit.trial_started_at = None
+
+        if circuit.opened_at is not None or circuit.failures >= self.failure_threshold:
+            circuit.opened_at = time.monotonic()
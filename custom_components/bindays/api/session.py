@@ -0,0 +1,46 @@
+"""
+HTTP session used for client-side requests to council websites.
+"""
+
+# External Packages
+import aiohttp
+
+DEFAULT_CONNECTION_LIMIT = 100
+"""Default maximum number of open connections across all councils."""
+
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 4
+"""Default maximum number of open connections to a single council."""
+
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+"""Default time in seconds an idle connection is kept open for reuse."""
+
+DEFAULT_DNS_CACHE_TTL = 300
+"""Default time in seconds resolved council host names are cached."""
+
+
+def create_client_side_session(
+    limit: int = DEFAULT_CONNECTION_LIMIT,
+    limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ttl_dns_cache: int = DEFAULT_DNS_CACHE_TTL,
+) -> aiohttp.ClientSession:
+    """
+    Create a session for client-side requests, with its own connection pool.
+
+    The session is stateless (no automatic cookie handling), as the API tells
+    each request which cookies to send. The caller owns the session and must
+    close it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+
+    # Disable Brotli compression to avoid aiohttp bugs with br encoding
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
@@ -0,0 +1,89 @@
+"""
+Single-flight de-duplication of concurrent identical calls.
+"""
+
+# External Packages
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    An in-flight call and the number of callers waiting on it.
+    """
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent callers with the same key.
+
+    Each caller waits on the shared task through a shield, so a caller being
+    cancelled doesn't cancel the call for the others. The call itself is only
+    cancelled once every caller waiting on it has given up.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the single-flight group.
+        """
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Return whether a call with the given key is in flight.
+        """
+        return key in self._calls
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the call built by the factory, or join the in-flight call with the same key.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(factory()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._done(key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nobody is left waiting for the result, so a caller arriving
+                # before the task has unwound starts a new call instead
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+
+    def cancel(self, key: Hashable) -> None:
+        """
+        Cancel the in-flight call with the given key, if any.
+        """
+        if call := self._calls.pop(key, None):
+            call.task.cancel()
+
+    def cancel_all(self) -> None:
+        """
+        Cancel every in-flight call.
+        """
+        for key in list(self._calls):
+            self.cancel(key)
+
+    def _done(self, key: Hashable, call: _Call) -> None:
+        """
+        Forget a finished call.
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+        # Mark the exception as retrieved in case every caller has already gone
+        if not call.task.cancelled():
+            call.task.exception()
+
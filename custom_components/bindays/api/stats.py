@@ -0,0 +1,266 @@
+"""
+Statistics on the requests made by the API client.
+"""
+
+# External Packages
+from __future__ import annotations
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional
+
+DEFAULT_SAMPLE_SIZE = 256
+"""Default number of recent samples percentiles are calculated from."""
+
+STEP_API = "api"
+"""Step kind for a request to the BinDays API."""
+
+STEP_COUNCIL = "council"
+"""Step kind for a client-side request to a council website."""
+
+
+class Samples:
+    """
+    The most recent values of a measurement, for calculating percentiles.
+    """
+
+    def __init__(self, size: int = DEFAULT_SAMPLE_SIZE) -> None:
+        """
+        Initialise the samples.
+        """
+        self._values: Deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        """
+        Add a value, dropping the oldest once full.
+        """
+        self._values.append(value)
+
+    @property
+    def last(self) -> Optional[float]:
+        """
+        Return the most recent value.
+        """
+        return self._values[-1] if self._values else None
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Return the nearest-rank percentile of the values.
+        """
+        if not self._values:
+            return None
+
+        values = sorted(self._values)
+        rank = max(1, math.ceil(len(values) * percent / 100))
+        return values[rank - 1]
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """
+        Return a summary of the values.
+        """
+        return {
+            "last": self.last,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": max(self._values) if self._values else None,
+        }
+
+
+class StepStats:
+    """
+    Counts, latencies and payload sizes of one kind of step in request chains.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the statistics.
+        """
+        self.count = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = Samples()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the statistics.
+        """
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class ChainStats:
+    """
+    Statistics on the request chains run against one council, or all of them.
+
+    `steps` are the client-side requests each chain needed before the API
+    returned its data.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the statistics.
+        """
+        self.chains = 0
+        self.errors = 0
+        self.steps = Samples()
+        self.duration = Samples()
+        self.step_stats: Dict[str, StepStats] = {}
+
+    def step(self, kind: str) -> StepStats:
+        """
+        Return the statistics for a kind of step.
+        """
+        stats = self.step_stats.get(kind)
+        if stats is None:
+            stats = self.step_stats[kind] = StepStats()
+        return stats
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the statistics.
+        """
+        return {
+            "chains": self.chains,
+            "errors": self.errors,
+            "steps": self.steps.as_dict(),
+            "duration": self.duration.as_dict(),
+            "step_stats": {kind: stats.as_dict() for kind, stats in self.step_stats.items()},
+        }
+
+
+class StepRecorder:
+    """
+    Payload sizes of a single step, set as they become known.
+    """
+
+    __slots__ = ("sent", "received")
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.received = 0
+
+
+class ChainRecorder:
+    """
+    Records a single request chain as it runs, and each of its steps.
+    """
+
+    def __init__(self, stats: ClientStats, collector_id: Optional[str]) -> None:
+        """
+        Initialise the recorder.
+        """
+        self._stats = stats
+        self._collector_id = collector_id
+        self.steps = 0
+
+    @contextmanager
+    def step(self, kind: str) -> Iterator[StepRecorder]:
+        """
+        Time a step of the chain, counting it as an error if it raises.
+        """
+        recorder = StepRecorder()
+        started_at = time.monotonic()
+        try:
+            yield recorder
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._record(kind, recorder, time.monotonic() - started_at, failed=True)
+            raise
+        self._record(kind, recorder, time.monotonic() - started_at, failed=False)
+
+    def _record(self, kind: str, recorder: StepRecorder, duration: float, failed: bool) -> None:
+        """
+        Add a finished step to the statistics.
+        """
+        # Each client-side request is a hop the chain needed to reach the data
+        if kind == STEP_COUNCIL:
+            self.steps += 1
+
+        for chain in self._stats.chains_for(self._collector_id):
+            stats = chain.step(kind)
+            stats.count += 1
+            stats.errors += failed
+            stats.bytes_sent += recorder.sent
+            stats.bytes_received += recorder.received
+            stats.latency.add(duration)
+
+
+class ClientStats:
+    """
+    Statistics on the request chains run by the API client, overall and per council.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the statistics.
+        """
+        self.total = ChainStats()
+        self.collectors: Dict[str, ChainStats] = {}
+
+    def collector(self, collector_id: str) -> Optional[ChainStats]:
+        """
+        Return the statistics for a council, if it has been requested from.
+        """
+        return self.collectors.get(collector_id)
+
+    def chains_for(self, collector_id: Optional[str]) -> Iterator[ChainStats]:
+        """
+        Return the statistics a request chain for a council counts towards.
+        """
+        yield self.total
+        if collector_id is not None:
+            stats = self.collectors.get(collector_id)
+            if stats is None:
+                stats = self.collectors[collector_id] = ChainStats()
+            yield stats
+
+    @contextmanager
+    def chain(self, collector_id: Optional[str]) -> Iterator[ChainRecorder]:
+        """
+        Time a request chain, counting it as an error if it raises.
+        """
+        recorder = ChainRecorder(self, collector_id)
+        started_at = time.monotonic()
+        try:
+            yield recorder
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._record(collector_id, recorder, time.monotonic() - started_at, failed=True)
+            raise
+        self._record(collector_id, recorder, time.monotonic() - started_at, failed=False)
+
+    def _record(
+        self,
+        collector_id: Optional[str],
+        recorder: ChainRecorder,
+        duration: float,
+        failed: bool,
+    ) -> None:
+        """
+        Add a finished request chain to the statistics.
+        """
+        for chain in self.chains_for(collector_id):
+            chain.chains += 1
+            chain.errors += failed
+            chain.steps.add(recorder.steps)
+            chain.duration.add(duration)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the statistics.
+        """
+        return {
+            "total": self.total.as_dict(),
+            "collectors": {cid: stats.as_dict() for cid, stats in self.collectors.items()},
+        }
@@ -0,0 +1,86 @@
+"""
+Encoding of client-side responses uploaded back to the API.
+"""
+
+# External Packages
+import gzip
+import zlib
+from typing import Any, Collection, Dict, Optional, Tuple
+
+# Internal Packages
+from .json_backend import JsonDumps, json_dumps
+
+UPLOAD_ENCODINGS = frozenset({"gzip", "deflate"})
+"""Content encodings request bodies can be compressed with."""
+
+MIN_COMPRESSED_SIZE = 1024
+"""Smallest request body, in bytes, worth compressing."""
+
+DROPPED_RESPONSE_HEADERS = frozenset({
+    # Browser security policies
+    "content-security-policy",
+    "content-security-policy-report-only",
+    "cross-origin-embedder-policy",
+    "cross-origin-opener-policy",
+    "cross-origin-resource-policy",
+    "expect-ct",
+    "nel",
+    "permissions-policy",
+    "referrer-policy",
+    "report-to",
+    "strict-transport-security",
+    "x-content-type-options",
+    "x-frame-options",
+    "x-xss-protection",
+    # CDN and proxy details
+    "alt-svc",
+    "cf-cache-status",
+    "cf-ray",
+    "server-timing",
+    "via",
+    "x-cache",
+    "x-cache-hits",
+    "x-served-by",
+    "x-timer",
+})
+"""Council response headers that only matter to browsers or proxies, not collectors."""
+
+
+def encode_client_side_payload(
+    payload: Dict[str, Any],
+    dropped_headers: Collection[str] = (),
+    dumps: JsonDumps = json_dumps,
+) -> bytes:
+    """
+    Encode a client-side response payload as JSON, without the dropped headers.
+
+    Header names in `dropped_headers` must be lowercase, as response headers are.
+    """
+    headers = payload.get("headers")
+    if dropped_headers and headers:
+        payload = {
+            **payload,
+            "headers": {k: v for k, v in headers.items() if k not in dropped_headers},
+        }
+
+    return dumps(payload)
+
+
+def compress_body(
+    body: bytes, encoding: Optional[str], min_size: int = MIN_COMPRESSED_SIZE
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Return a request body compressed with an encoding, and the encoding used.
+
+    Bodies smaller than `min_size` are returned as they are, with no encoding.
+    """
+    if encoding is None or len(body) < min_size:
+        return body, None
+
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0), encoding
+
+    if encoding == "deflate":
+        return zlib.compress(body, 6), encoding
+
+    raise ValueError(f"Unsupported upload encoding '{encoding}'")
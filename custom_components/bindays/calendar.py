@@ -0,0 +1,112 @@
+"""
+Platform for calendar integration.
+"""
+
+# External Packages
+from __future__ import annotations
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+# Internal Packages
+from .const import DOMAIN
+from .entity import BinDaysEntity, EntityState, collection_cutoff
+from .models.bin_day import BinDay
+from .schedule import Schedule
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """
+    Set up the calendar platform.
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        [CollectionCalendar(coordinator, entry.entry_id, collection_cutoff(entry))]
+    )
+
+
+class CollectionCalendar(BinDaysEntity, CalendarEntity):
+    """
+    Calendar of every upcoming bin collection.
+
+    Only the next collection is part of the entity's state. Other collections
+    are looked up from the schedule when a date range is requested, so the
+    full schedule never has to be written to the state machine or recorder.
+    """
+
+    _attr_has_entity_name = True
+    _attr_name = "Collections"
+    _attr_icon = "mdi:delete-empty"
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        cutoff: Optional[time] = None,
+    ) -> None:
+        """
+        Initialize the calendar.
+        """
+        super().__init__(coordinator, cutoff)
+        self._entry_id = entry_id
+        self._attr_unique_id = f"{entry_id}_calendar"
+
+    @property
+    def event(self) -> Optional[CalendarEvent]:
+        """
+        Return the next collection.
+        """
+        return self._state()[0]
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> List[CalendarEvent]:
+        """
+        Return the collections between two datetimes.
+        """
+        schedule = Schedule.of(self.coordinator.data)
+
+        # Collections are all-day events, so include any day the range ends partway through
+        start = dt_util.as_local(start_date).date()
+        end_local = dt_util.as_local(end_date)
+        end = end_local.date()
+        if end_local.time() != time.min:
+            end += timedelta(days=1)
+
+        return [
+            self._event(collection_date, bin_day)
+            for collection_date, bin_day in schedule.between(start, end).items()
+        ]
+
+    def _compute_state(self, schedule: Schedule, today: date) -> EntityState:
+        """
+        Return the event for the next collection.
+        """
+        next_collection = schedule.next_on_or_after(today)
+        if not next_collection:
+            return None, {}
+
+        return self._event(*next_collection), {}
+
+    @staticmethod
+    def _event(collection_date: date, bin_day: BinDay) -> CalendarEvent:
+        """
+        Return the all-day event for a collection.
+        """
+        return CalendarEvent(
+            start=collection_date,
+            end=collection_date + timedelta(days=1),
+            summary=", ".join(b.name for b in bin_day.bins) or "Bin collection",
+            description=", ".join(f"{b.name} ({b.colour})" for b in bin_day.bins) or None,
+        )
@@ -3,33 +3,45 @@ Sensor showing all upcoming bin collections.
 """
 
 from __future__ import annotations
-from typing import Any, List
-from datetime import date
+from typing import Any, Optional
+from datetime import date, time, timedelta
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .models.bin_day import BinDay
+from .const import DEFAULT_SCHEDULE_DAYS
+from .entity import BinDaysEntity, EntityState
+from .schedule import Schedule
 
 
-class CollectionScheduleSensor(CoordinatorEntity, SensorEntity):
+class CollectionScheduleSensor(BinDaysEntity, SensorEntity):
     """
     Sensor showing all upcoming bin collections.
+
+    The schedule attribute is limited to the next `schedule_days` days, and
+    isn't recorded. The calendar entity serves the full schedule.
     """
 
     _attr_has_entity_name = True
     _attr_name = "Collection Schedule"
     _attr_icon = "mdi:calendar-clock"
+    _unrecorded_attributes = BinDaysEntity._unrecorded_attributes | frozenset(
+        {"upcoming_collections"}
+    )
 
-    def __init__(self, coordinator: DataUpdateCoordinator, entry_id: str) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        schedule_days: int = DEFAULT_SCHEDULE_DAYS,
+        cutoff: Optional[time] = None,
+    ) -> None:
         """
         Initialize the sensor.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, cutoff)
         self._entry_id = entry_id
+        self._schedule_days = schedule_days
         self._attr_unique_id = f"{entry_id}_collection_schedule"
 
     @property
@@ -37,18 +49,28 @@ class CollectionScheduleSensor(CoordinatorEntity, SensorEntity):
         """
         Return the state of the sensor (count of upcoming collections).
         """
-        upcoming = self._get_upcoming_collections()
-        return len(upcoming)
+        return self._state()[0]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """
         Return the state attributes.
         """
-        upcoming = self._get_upcoming_collections()
-        schedule = []
-        for date_obj, bin_day in upcoming:
-            schedule.append({
+        return self._state()[1]
+
+    def _compute_state(self, schedule: Schedule, today: date) -> EntityState:
+        """
+        Return the number of upcoming collections, and their dates and bins.
+        """
+        upcoming = schedule.between(today)
+        if self._schedule_days:
+            shown = upcoming.between(today, today + timedelta(days=self._schedule_days))
+        else:
+            shown = upcoming
+
+        collections = []
+        for date_obj, bin_day in shown.items():
+            collections.append({
                 "date": date_obj.isoformat(),
                 "bins": [
                     {
@@ -60,26 +82,14 @@ class CollectionScheduleSensor(CoordinatorEntity, SensorEntity):
                 ]
             })
 
-        return {
-            "upcoming_collections": schedule
+        return len(upcoming), {
+            "upcoming_collections": collections,
         }
 
-    def _get_upcoming_collections(self) -> List[tuple[date, BinDay]]:
-        """
-        Get all upcoming collections from the coordinator data.
-        """
-        bin_days: List[BinDay] = self.coordinator.data
-        if not bin_days:
-            return []
-
-        today = date.today()
-        upcoming = []
 
-        for d in bin_days:
-            d_date = d.parsed_date
-            if d_date >= today:
-                upcoming.append((d_date, d))
+class RecordedCollectionScheduleSensor(CollectionScheduleSensor):
+    """
+    Sensor showing all upcoming bin collections, with the schedule attribute recorded.
+    """
 
-        # Sort by date
-        upcoming.sort(key=lambda x: x[0])
-        return upcoming
+    _unrecorded_attributes = BinDaysEntity._unrecorded_attributes
@@ -4,17 +4,20 @@ Config flow for BinDays integration.
 
 # External Packages
 from __future__ import annotations
+import asyncio
 import logging
-from typing import Any, List, Optional, Dict
+from typing import Any, Awaitable, List, Optional, Dict, TypeVar
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import selector
 
 # Internal Packages
 from .api import BinDaysApiClient, BinDaysApiClientError
+from .hub import BinDaysHub, async_get_hub
 from .models.collector import Collector
 from .models.address import Address
 from .const import (
@@ -22,11 +25,19 @@ from .const import (
     CONF_POSTCODE,
     CONF_ADDRESS_ID,
     CONF_COLLECTOR_ID,
-    DEFAULT_API_URL,
+    CONF_COLLECTION_CUTOFF,
+    CONF_MAX_STALE_HOURS,
+    CONF_RECORD_SCHEDULE,
+    CONF_SCHEDULE_DAYS,
+    DEFAULT_MAX_STALE_HOURS,
+    DEFAULT_RECORD_SCHEDULE,
+    DEFAULT_SCHEDULE_DAYS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_POSTCODE): str,
@@ -45,12 +56,64 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """
         Initialize.
         """
-        self.api: Optional[BinDaysApiClient] = None
         self.postcode: Optional[str] = None
         self.collector: Optional[Collector] = None
         self.addresses: Optional[List[Address]] = None
         self.all_collectors: Optional[List[Collector]] = None
 
+        # Lookups started while the user reads the confirm form
+        self._addresses_task: Optional[asyncio.Task[List[Address]]] = None
+        self._collectors_task: Optional[asyncio.Task[List[Collector]]] = None
+
+    @property
+    def hub(self) -> BinDaysHub:
+        """
+        Return the integration's shared hub, so its lookups outlive this flow.
+        """
+        return async_get_hub(self.hass)
+
+    @property
+    def api(self) -> BinDaysApiClient:
+        """
+        Return the integration's shared client, so its caches outlive this flow.
+        """
+        return self.hub.client
+
+    def _async_prefetch(self, name: str, lookup: Awaitable[_T]) -> asyncio.Task[_T]:
+        """
+        Start a lookup in the background, before the user has asked for it.
+        """
+        task = self.hass.async_create_background_task(lookup, f"{DOMAIN} {name} prefetch")
+        # An unused lookup's error is reported when it's awaited, or not at all
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    def _async_cancel_prefetches(self) -> None:
+        """
+        Cancel any lookups started in the background that are still running.
+        """
+        for task in (self._addresses_task, self._collectors_task):
+            if task is not None:
+                task.cancel()
+        self._addresses_task = self._collectors_task = None
+
+    @callback
+    def async_remove(self) -> None:
+        """
+        Cancel any lookups still running when the flow finishes or is abandoned.
+        """
+        self._async_cancel_prefetches()
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """
+        Get the options flow for this handler.
+        """
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -60,13 +123,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
         if user_input is not None:
             self.postcode = user_input[CONF_POSTCODE].strip().upper()
-
-            session = async_get_clientsession(self.hass)
-            self.api = BinDaysApiClient(session, DEFAULT_API_URL)
+            self._async_cancel_prefetches()
 
             try:
                 # 1. Get Collector
-                self.collector = await self.api.get_collector(self.postcode)
+                self.collector = await self.hub.async_get_collector(self.postcode)
                 return await self.async_step_confirm_collector()
 
             except BinDaysApiClientError as err:
@@ -98,6 +159,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self._async_fetch_addresses()
             return await self.async_step_select_collector()
 
+        # Look up the addresses, and the collectors in case the detected one is
+        # wrong, while the user reads the form
+        if self._addresses_task is None:
+            self._addresses_task = self._async_prefetch(
+                "addresses", self.hub.async_get_addresses(self.collector, self.postcode)
+            )
+        if self._collectors_task is None and self.all_collectors is None:
+            self._collectors_task = self._async_prefetch(
+                "collectors", self.api.get_collectors()
+            )
+
         return self.async_show_form(
             step_id="confirm_collector",
             description_placeholders={"collector_name": self.collector.name},
@@ -113,8 +185,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
 
         if self.all_collectors is None:
+            task, self._collectors_task = self._collectors_task, None
             try:
-                self.all_collectors = await self.api.get_collectors()
+                self.all_collectors = await (task or self.api.get_collectors())
                 self.all_collectors.sort(key=lambda c: c.name)
             except BinDaysApiClientError:
                 errors["base"] = "cannot_connect"
@@ -124,6 +197,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             selected_id = user_input[CONF_COLLECTOR_ID]
+            if selected_id != self.collector.gov_uk_id and self._addresses_task is not None:
+                # The prefetched addresses are for the detected collector
+                self._addresses_task.cancel()
+                self._addresses_task = None
             self.collector = next(
                 c for c in self.all_collectors if c.gov_uk_id == selected_id
             )
@@ -142,8 +219,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Helper to fetch addresses once collector is finalized.
         """
         errors: Dict[str, str] = {}
+        task, self._addresses_task = self._addresses_task, None
         try:
-            self.addresses = await self.api.get_addresses(self.collector, self.postcode)
+            self.addresses = await (
+                task or self.hub.async_get_addresses(self.collector, self.postcode)
+            )
 
             if not self.addresses:
                 errors["base"] = "no_addresses_found"
@@ -191,3 +271,50 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """
+    Handle options for BinDays.
+    """
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """
+        Initialize.
+        """
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """
+        Manage the options.
+        """
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_STALE_HOURS,
+                        default=options.get(CONF_MAX_STALE_HOURS, DEFAULT_MAX_STALE_HOURS),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_SCHEDULE_DAYS,
+                        default=options.get(CONF_SCHEDULE_DAYS, DEFAULT_SCHEDULE_DAYS),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_RECORD_SCHEDULE,
+                        default=options.get(CONF_RECORD_SCHEDULE, DEFAULT_RECORD_SCHEDULE),
+                    ): bool,
+                    vol.Optional(
+                        CONF_COLLECTION_CUTOFF,
+                        description={"suggested_value": options.get(CONF_COLLECTION_CUTOFF)},
+                    ): selector.TimeSelector(),
+                }
+            ),
+        )
@@ -2,6 +2,9 @@
 Constants for the BinDays integration.
 """
 
+from datetime import timedelta
+from typing import FrozenSet
+
 DOMAIN = "bindays"
 """Integration domain."""
 
@@ -14,5 +17,74 @@ CONF_ADDRESS_ID = "address_id"
 CONF_COLLECTOR_ID = "collector_id"
 """Configuration key for collector ID."""
 
+CONF_MAX_STALE_HOURS = "max_stale_hours"
+"""Option key for how old a schedule may get while it is being revalidated."""
+
+DEFAULT_MAX_STALE_HOURS = 168
+"""Default maximum age, in hours, of a schedule served while revalidating."""
+
+CONF_COLLECTION_CUTOFF = "collection_cutoff"
+"""Option key for the time of day after which that day's collection is assumed done."""
+
+CONF_SCHEDULE_DAYS = "schedule_days"
+"""Option key for how many days ahead the schedule attribute covers."""
+
+DEFAULT_SCHEDULE_DAYS = 28
+"""Default number of days covered by the schedule attribute, where zero covers all of them."""
+
+CONF_RECORD_SCHEDULE = "record_schedule"
+"""Option key for whether the detailed schedule attributes are recorded in history."""
+
+DEFAULT_RECORD_SCHEDULE = False
+"""Default for whether the detailed schedule attributes are recorded in history."""
+
 DEFAULT_API_URL = "https://api.bindays.app"
-"""Default base URL for the BinDays API."""
\ No newline at end of file
+"""Default base URL for the BinDays API."""
+
+UPDATE_INTERVAL = timedelta(hours=12)
+"""How soon bin days are refreshed from the API after a refresh that didn't change them."""
+
+MIN_UPDATE_INTERVAL = timedelta(hours=6)
+"""Shortest interval between refreshes, used after the schedule changed or is running out."""
+
+MAX_UPDATE_INTERVAL = timedelta(hours=48)
+"""Longest interval between refreshes, reached while the schedule stays the same."""
+
+UPDATE_INTERVAL_JITTER = 0.1
+"""Fraction by which each refresh interval is randomly lengthened or shortened."""
+
+RETRY_INTERVAL = timedelta(minutes=30)
+"""How soon a refresh is first retried after the API could not be reached."""
+
+STORE_TTL = timedelta(hours=12)
+"""How long a stored schedule is used before it is refreshed in the background."""
+
+CLIENT_SIDE_CACHE_TTL = timedelta(minutes=2)
+"""How long council GET responses are reused, e.g. by neighbouring addresses."""
+
+CLIENT_SIDE_CACHE_HOSTS: FrozenSet[str] = frozenset()
+"""Council hosts (and their subdomains) whose GET responses are known to be safe to reuse."""
+
+LOOKUP_CACHE_TTL = timedelta(minutes=30)
+"""How long a postcode's collector and addresses are reused when adding addresses."""
+
+STARTUP_REFRESH_CONCURRENCY = 2
+"""Maximum number of entries refreshing at once after Home Assistant starts."""
+
+DATA_SOURCE_FRESH = "fresh"
+"""Data source when the schedule was fetched by the latest refresh."""
+
+DATA_SOURCE_CACHED = "cached"
+"""Data source when the schedule was loaded from disk and not yet revalidated."""
+
+DATA_SOURCE_STALE = "stale"
+"""Data source when the latest refresh failed and the last good schedule is served."""
+
+ATTR_DATA_SOURCE = "data_source"
+"""State attribute for where the schedule data came from."""
+
+ATTR_FETCHED_AT = "fetched_at"
+"""State attribute for when the schedule data was fetched from the API."""
+
+DATA_HUB = "hub"
+"""Key in the integration's data for the shared BinDays hub."""
@@ -0,0 +1,343 @@
+"""
+Data update coordinator for the BinDays integration.
+"""
+
+# External Packages
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+# Internal Packages
+from .api import BinDaysApiClientError
+from .api.stats import ChainStats
+from .hub import BinDaysHub, async_release_hub
+from .models.bin_day import BinDay
+from .store import ScheduleStore
+from .schedule import Schedule
+from .const import (
+    DOMAIN,
+    CONF_POSTCODE,
+    CONF_ADDRESS_ID,
+    CONF_COLLECTOR_ID,
+    CONF_MAX_STALE_HOURS,
+    DEFAULT_MAX_STALE_HOURS,
+    DATA_SOURCE_FRESH,
+    DATA_SOURCE_CACHED,
+    DATA_SOURCE_STALE,
+    UPDATE_INTERVAL,
+    STORE_TTL,
+)
+from .polling import PollingPolicy
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BinDaysDataUpdateCoordinator(DataUpdateCoordinator):
+    """
+    Coordinator fetching the bin days for a single config entry.
+
+    The data is a `Schedule`, indexed once per update for the entities to query.
+
+    Once a schedule is available, scheduled refreshes return it immediately and
+    revalidate it in a background task (stale-while-revalidate). A failed
+    revalidation keeps the last good schedule until it is older than the
+    configured maximum stale age. A maximum stale age of zero disables this and
+    every refresh waits for the API.
+
+    The interval between refreshes adapts to the schedule, as decided by
+    `PollingPolicy`.
+
+    Entries for addresses in the same group share refreshes through the hub:
+    bin days fetched by a refresh of another entry in the group are taken as
+    if the entry had fetched them itself, which also postpones its next
+    refresh by a full interval.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, hub: BinDaysHub) -> None:
+        """
+        Initialise the coordinator.
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+        )
+        self._entry = entry
+        self._hub = hub
+        self._store = ScheduleStore(hass, entry.entry_id)
+
+        self._postcode: str = entry.data[CONF_POSTCODE]
+        self._collector_id: str = entry.data[CONF_COLLECTOR_ID]
+        self._address_id: str = entry.data[CONF_ADDRESS_ID]
+
+        # Include the address in the shared refreshes of its group
+        hub.register(
+            self._collector_id, self._postcode, self._address_id, self._async_handle_group_refresh
+        )
+        self._registered = True
+        self._fetches = 0
+
+        self._max_stale_age = timedelta(
+            hours=entry.options.get(CONF_MAX_STALE_HOURS, DEFAULT_MAX_STALE_HOURS)
+        )
+        self._revalidation: Optional[asyncio.Task] = None
+
+        self._polling = PollingPolicy()
+        self._stable_refreshes = 0
+        self._failures = 0
+
+        self.fetched_at: Optional[datetime] = None
+        """When the current data was fetched from the API."""
+
+        self.data_source: Optional[str] = None
+        """Whether the current data is fresh, cached (from disk) or stale."""
+
+        self.refresh_duration: Optional[float] = None
+        """How long the latest fetch from the API took, in seconds."""
+
+        self.refreshes = 0
+        """Number of successful fetches from the API."""
+
+        self.failed_refreshes = 0
+        """Number of failed fetches from the API."""
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        Return whether the current data is older than the store TTL.
+        """
+        return self.fetched_at is None or dt_util.utcnow() - self.fetched_at > STORE_TTL
+
+    @property
+    def hub(self) -> BinDaysHub:
+        """
+        Return the hub the entry fetches its bin days through.
+        """
+        return self._hub
+
+    @property
+    def collector_stats(self) -> Optional[ChainStats]:
+        """
+        Return the statistics on the request chains run against the entry's council.
+        """
+        if (stats := self._hub.client_stats) is None:
+            return None
+        return stats.collector(self._collector_id)
+
+    @property
+    def _can_serve_stale(self) -> bool:
+        """
+        Return whether the current data may still be served after a failed refresh.
+        """
+        if self.data is None or self.fetched_at is None:
+            return False
+
+        # The stored schedule is kept until the API has answered once
+        if self.data_source == DATA_SOURCE_CACHED:
+            return True
+
+        return dt_util.utcnow() - self.fetched_at <= self._max_stale_age
+
+    async def async_load_stored(self) -> bool:
+        """
+        Load the last good schedule from disk, returning whether one was found.
+        """
+        stored = await self._store.async_load()
+        if stored is None:
+            return False
+
+        _LOGGER.debug(
+            "Loaded stored schedule for %s fetched at %s", self._address_id, stored.fetched_at
+        )
+        schedule = Schedule(stored.bin_days)
+
+        # Polled as after a refresh that didn't change it, until the API has answered
+        self.update_interval = self._polling.interval(schedule, dt_util.now().date(), 1)
+
+        self.fetched_at = stored.fetched_at
+        self.data_source = DATA_SOURCE_CACHED
+        self.async_set_updated_data(schedule)
+        return True
+
+    async def async_refresh_in_turn(self, turns: asyncio.Semaphore) -> None:
+        """
+        Refresh once one of the `turns` is free, holding it until the fetch is done.
+
+        Without a schedule the refresh waits for the API. A stored schedule is
+        revalidated in the background as usual, but the turn is held until the
+        revalidation has finished too.
+        """
+        async with turns:
+            if self.data is None:
+                await self.async_refresh()
+                return
+
+            self._async_start_revalidation()
+            await self._revalidation
+
+    async def async_shutdown(self) -> None:
+        """
+        Cancel any scheduled or background refresh and release the entry from the hub.
+        """
+        await super().async_shutdown()
+
+        if self._revalidation is not None:
+            self._revalidation.cancel()
+            self._revalidation = None
+
+        if self._registered:
+            self._registered = False
+            self._hub.unregister(
+                self._collector_id,
+                self._postcode,
+                self._address_id,
+                self._async_handle_group_refresh,
+            )
+            await async_release_hub(self.hass, self._hub)
+
+    async def _async_update_data(self) -> Schedule:
+        """
+        Fetch data from API endpoint, or serve the current data and revalidate it.
+        """
+        if self._max_stale_age and self._can_serve_stale:
+            self._async_start_revalidation()
+            return self.data
+
+        try:
+            return await self._async_fetch()
+        except BinDaysApiClientError as err:
+            # Try again sooner than usual rather than waiting a full interval
+            self._async_record_failure()
+
+            if self._can_serve_stale:
+                self._async_mark_stale(err)
+                return self.data
+
+            _LOGGER.error("Error communicating with API for %s: %s", self._address_id, err)
+            raise UpdateFailed(f"Error communicating with API: {err}")
+
+    async def _async_fetch(self) -> Schedule:
+        """
+        Fetch the bin days from the API and store them.
+        """
+        started_at = time.monotonic()
+        self._fetches += 1
+        try:
+            bin_days = await self._hub.async_get_bin_days(
+                self._collector_id, self._postcode, self._address_id
+            )
+        finally:
+            self._fetches -= 1
+            self.refresh_duration = time.monotonic() - started_at
+
+        self.refreshes += 1
+        return await self._async_use_fetched(bin_days)
+
+    async def _async_use_fetched(self, bin_days: List[BinDay]) -> Schedule:
+        """
+        Make freshly fetched bin days the current schedule and store them.
+        """
+        schedule = Schedule(bin_days)
+
+        # A schedule that hasn't changed is polled less and less often
+        if self.data is not None and list(self.data) != list(schedule):
+            self._stable_refreshes = 0
+        else:
+            self._stable_refreshes += 1
+
+        self._failures = 0
+        self.update_interval = self._polling.interval(
+            schedule, dt_util.now().date(), self._stable_refreshes
+        )
+
+        self.fetched_at = dt_util.utcnow()
+        self.data_source = DATA_SOURCE_FRESH
+        await self._store.async_save(bin_days, self.fetched_at)
+
+        return schedule
+
+    @callback
+    def _async_handle_group_refresh(self, bin_days: List[BinDay]) -> None:
+        """
+        Take the bin days fetched by a refresh of another entry in the group.
+        """
+        # The entry's own refreshes use what they fetched
+        if self._fetches:
+            return
+
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_take_group_refresh(bin_days),
+            f"{DOMAIN} group refresh {self._entry.entry_id}",
+        )
+
+    async def _async_take_group_refresh(self, bin_days: List[BinDay]) -> None:
+        """
+        Push bin days fetched for the group to listeners, restarting the refresh interval.
+        """
+        self.async_set_updated_data(await self._async_use_fetched(bin_days))
+
+    def _async_start_revalidation(self) -> None:
+        """
+        Start revalidating the current data in the background, if not already running.
+        """
+        if self._revalidation is not None and not self._revalidation.done():
+            return
+
+        self._revalidation = self._entry.async_create_background_task(
+            self.hass,
+            self._async_revalidate(),
+            f"{DOMAIN} revalidate {self._entry.entry_id}",
+        )
+
+    async def _async_revalidate(self) -> None:
+        """
+        Fetch fresh data and push it to listeners, keeping stale data on failure.
+        """
+        try:
+            schedule = await self._async_fetch()
+        except BinDaysApiClientError as err:
+            # Try again sooner than the refresh scheduled before revalidating
+            self._async_record_failure()
+            self._schedule_refresh()
+
+            if self._can_serve_stale:
+                self._async_mark_stale(err)
+                self.async_update_listeners()
+                return
+
+            _LOGGER.error("Error communicating with API for %s: %s", self._address_id, err)
+            self.async_set_update_error(UpdateFailed(f"Error communicating with API: {err}"))
+            return
+
+        self.async_set_updated_data(schedule)
+
+    def _async_record_failure(self) -> None:
+        """
+        Record a failed refresh, retrying it sooner than a full interval.
+        """
+        self._failures += 1
+        self.failed_refreshes += 1
+        self.update_interval = self._polling.retry_interval_after(self._failures)
+
+    def _async_mark_stale(self, err: BinDaysApiClientError) -> None:
+        """
+        Record that the last good data is being served after a failed refresh.
+        """
+        _LOGGER.warning(
+            "Error communicating with API for %s, using schedule fetched at %s: %s",
+            self._address_id,
+            self.fetched_at,
+            err,
+        )
+        if self.data_source != DATA_SOURCE_CACHED:
+            self.data_source = DATA_SOURCE_STALE
@@ -0,0 +1,157 @@
+"""
+Diagnostic sensors showing how refreshes from the API perform.
+"""
+
+from __future__ import annotations
+from typing import Any, Optional
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api.stats import STEP_COUNCIL, Samples
+from .coordinator import BinDaysDataUpdateCoordinator
+
+
+class BinDaysDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """
+    Base diagnostic sensor, disabled until enabled from the entity settings.
+    """
+
+    coordinator: BinDaysDataUpdateCoordinator
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    # Key the unique ID of each diagnostic sensor is made from
+    _key: str = ""
+
+    def __init__(self, coordinator: BinDaysDataUpdateCoordinator, entry_id: str) -> None:
+        """
+        Initialize the sensor.
+        """
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self._attr_unique_id = f"{entry_id}_{self._key}"
+
+    @property
+    def available(self) -> bool:
+        """
+        Return whether there is anything to show yet.
+        """
+        return self.native_value is not None
+
+
+class RefreshDurationSensor(BinDaysDiagnosticSensor):
+    """
+    Sensor showing how long the latest fetch from the API took.
+    """
+
+    _attr_name = "Refresh duration"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+    _key = "refresh_duration"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """
+        Return the duration of the latest fetch.
+        """
+        return self.coordinator.refresh_duration
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """
+        Return the number of successful and failed fetches.
+        """
+        return {
+            "refreshes": self.coordinator.refreshes,
+            "failed_refreshes": self.coordinator.failed_refreshes,
+        }
+
+
+class RequestStepsSensor(BinDaysDiagnosticSensor):
+    """
+    Sensor showing how many council requests the latest request chain needed.
+    """
+
+    _attr_name = "Council requests"
+    _attr_icon = "mdi:swap-horizontal"
+    _key = "council_requests"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """
+        Return the number of council requests in the latest request chain.
+        """
+        stats = self.coordinator.collector_stats
+        return stats.steps.last if stats is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """
+        Return the spread of council requests per chain, and the chain error count.
+        """
+        stats = self.coordinator.collector_stats
+        if stats is None:
+            return {}
+
+        return {**_summary(stats.steps), "chains": stats.chains, "errors": stats.errors}
+
+
+class CouncilLatencySensor(BinDaysDiagnosticSensor):
+    """
+    Sensor showing the 90th percentile latency of requests to the council.
+    """
+
+    _attr_name = "Council latency"
+    _attr_icon = "mdi:speedometer"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+    _key = "council_latency"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """
+        Return the 90th percentile council request latency.
+        """
+        stats = self.coordinator.collector_stats
+        if stats is None or STEP_COUNCIL not in stats.step_stats:
+            return None
+        return stats.step_stats[STEP_COUNCIL].latency.percentile(90)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """
+        Return the spread of council request latencies, and payload sizes.
+        """
+        stats = self.coordinator.collector_stats
+        if stats is None or STEP_COUNCIL not in stats.step_stats:
+            return {}
+
+        step = stats.step_stats[STEP_COUNCIL]
+        return {
+            **_summary(step.latency),
+            "requests": step.count,
+            "errors": step.errors,
+            "bytes_sent": step.bytes_sent,
+            "bytes_received": step.bytes_received,
+        }
+
+
+def _summary(samples: Samples) -> dict[str, Any]:
+    """
+    Return the percentiles of some samples as state attributes.
+    """
+    summary = samples.as_dict()
+    del summary["last"]
+    return summary
@@ -0,0 +1,87 @@
+"""
+Diagnostics support for the BinDays integration.
+"""
+
+# External Packages
+from __future__ import annotations
+from typing import Any, Dict, Optional
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+# Internal Packages
+from .const import DOMAIN, CONF_POSTCODE, CONF_ADDRESS_ID
+from .coordinator import BinDaysDataUpdateCoordinator
+
+TO_REDACT = {CONF_POSTCODE, CONF_ADDRESS_ID}
+"""Config entry keys that identify the user's home."""
+
+
+def _hit_rate(hits: int, misses: int) -> Optional[float]:
+    """
+    Return the fraction of lookups that were hits, if there were any lookups.
+    """
+    lookups = hits + misses
+    return hits / lookups if lookups else None
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """
+    Return diagnostics for a config entry.
+
+    Includes the entry's refreshes, the request chains run against its council
+    and the statistics of the client shared by every entry, once it exists.
+    """
+    coordinator: BinDaysDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client_stats = coordinator.hub.client_stats
+    collector_stats = coordinator.collector_stats
+
+    diagnostics: Dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "refresh": {
+            "last_update_success": coordinator.last_update_success,
+            "data_source": coordinator.data_source,
+            "fetched_at": coordinator.fetched_at.isoformat() if coordinator.fetched_at else None,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "duration": coordinator.refresh_duration,
+            "refreshes": coordinator.refreshes,
+            "failed_refreshes": coordinator.failed_refreshes,
+            "collections": len(coordinator.data) if coordinator.data is not None else 0,
+        },
+        "collector": collector_stats.as_dict() if collector_stats is not None else None,
+        "client": client_stats.as_dict() if client_stats is not None else None,
+    }
+
+    # Nothing has needed the client yet, and creating it here would open its sessions
+    if client_stats is None:
+        return diagnostics
+
+    client = coordinator.hub.client
+    if (cache := client.response_cache) is not None:
+        diagnostics["response_cache"] = {
+            "entries": len(cache),
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "revalidations": cache.revalidations,
+            "hit_rate": _hit_rate(cache.hits, cache.misses),
+        }
+
+    limiter = client.rate_limiter
+    diagnostics["rate_limiter"] = {
+        "queue_depth": limiter.queue_depth(),
+        "acquired": limiter.acquired,
+        "delayed": limiter.delayed,
+        "wait_time": limiter.wait_time,
+    }
+
+    return diagnostics
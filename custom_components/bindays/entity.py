@@ -0,0 +1,171 @@
+"""
+Base entity for the BinDays integration.
+"""
+
+from __future__ import annotations
+from abc import abstractmethod
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_DATA_SOURCE, ATTR_FETCHED_AT, CONF_COLLECTION_CUTOFF
+from .schedule import Schedule
+
+EntityState = Tuple[Any, Dict[str, Any]]
+"""The value and state attributes of an entity."""
+
+
+def collection_cutoff(entry: ConfigEntry) -> Optional[time]:
+    """
+    Return the configured time after which a day's collection is assumed done.
+    """
+    value = entry.options.get(CONF_COLLECTION_CUTOFF)
+    return dt_util.parse_time(value) if value else None
+
+
+class BinDaysEntity(CoordinatorEntity):
+    """
+    Base entity for the BinDays integration.
+
+    The entity's value and attributes are derived from the coordinator's
+    schedule by `_compute_state`. They are only computed again once the
+    schedule, its source or the date changes, and coordinator updates that
+    don't change them (or the entity's availability) don't write state. The
+    fetch time changes on every refresh, so on its own it is only written
+    once it has moved on by the refresh interval.
+
+    Collections are compared against the local date, which moves on to the
+    next day at midnight or, if a `cutoff` time is given, once the day's
+    collection is assumed to be done. State is recomputed from the current
+    schedule at those times, without refreshing it from the API.
+    """
+
+    # Changes on every refresh, so would add a row to the recorder each time
+    _unrecorded_attributes = frozenset({ATTR_FETCHED_AT})
+
+    def __init__(self, coordinator: Any, cutoff: Optional[time] = None) -> None:
+        """
+        Initialise the entity.
+        """
+        super().__init__(coordinator)
+        # A cutoff at midnight is the same as no cutoff
+        self._cutoff = cutoff if cutoff != time.min else None
+        self._state_data: Any = None
+        self._state_key: Optional[Tuple[Any, ...]] = None
+        self._cached_state: Optional[EntityState] = None
+        self._written: Optional[Tuple[Any, ...]] = None
+        self._written_fetched_at: Optional[datetime] = None
+
+    async def async_added_to_hass(self) -> None:
+        """
+        Start recomputing the state when the date changes.
+        """
+        await super().async_added_to_hass()
+
+        rollovers = [time.min]
+        if self._cutoff is not None:
+            rollovers.append(self._cutoff)
+
+        for rollover in rollovers:
+            self.async_on_remove(
+                async_track_time_change(
+                    self.hass,
+                    self._async_handle_rollover,
+                    hour=rollover.hour,
+                    minute=rollover.minute,
+                    second=rollover.second,
+                )
+            )
+
+    @callback
+    def _async_handle_rollover(self, now: datetime) -> None:
+        """
+        Recompute the state from the current schedule for the new date.
+        """
+        self._handle_coordinator_update()
+
+    def _today(self) -> date:
+        """
+        Return the date collections are compared against.
+        """
+        now = dt_util.now()
+        if self._cutoff is not None and now.time() >= self._cutoff:
+            return now.date() + timedelta(days=1)
+        return now.date()
+
+    @abstractmethod
+    def _compute_state(self, schedule: Schedule, today: date) -> EntityState:
+        """
+        Return the value and attributes of the entity for a schedule and date.
+        """
+
+    @property
+    def available(self) -> bool:
+        """
+        Return whether the coordinator has a schedule to show.
+
+        Entries set up while Home Assistant starts have none until their
+        first refresh, unless a schedule was stored.
+        """
+        return super().available and self.coordinator.data is not None
+
+    def _state(self) -> EntityState:
+        """
+        Return the value and attributes of the entity, computing them if changed.
+        """
+        data = self.coordinator.data
+        key = (self._today(), self.coordinator.data_source, self.coordinator.fetched_at)
+
+        if self._cached_state is None or data is not self._state_data or key != self._state_key:
+            value, attributes = self._compute_state(Schedule.of(data), key[0])
+            self._cached_state = (value, {**attributes, **self._data_attributes()})
+            self._state_data = data
+            self._state_key = key
+
+        return self._cached_state
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Write state after a coordinator update, unless nothing shown has changed.
+        """
+        value, attributes = self._state()
+        written = (
+            self.available,
+            value,
+            {k: v for k, v in attributes.items() if k != ATTR_FETCHED_AT},
+        )
+        fetched_at = self.coordinator.fetched_at
+        if written == self._written and not self._fetched_at_moved(fetched_at):
+            return
+
+        self._written = written
+        self._written_fetched_at = fetched_at
+        super()._handle_coordinator_update()
+
+    def _fetched_at_moved(self, fetched_at: Optional[datetime]) -> bool:
+        """
+        Return whether the fetch time has moved on enough from the one written to write it.
+        """
+        if fetched_at == self._written_fetched_at:
+            return False
+        if fetched_at is None or self._written_fetched_at is None:
+            return True
+
+        # Revalidations pushed between refreshes don't each write state
+        return abs(fetched_at - self._written_fetched_at) >= self.coordinator.update_interval
+
+    def _data_attributes(self) -> dict[str, Any]:
+        """
+        Return attributes describing the age and source of the coordinator data.
+        """
+        fetched_at = self.coordinator.fetched_at
+        return {
+            ATTR_DATA_SOURCE: self.coordinator.data_source,
+            ATTR_FETCHED_AT: fetched_at.isoformat() if fetched_at else None,
+        }
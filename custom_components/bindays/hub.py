@@ -0,0 +1,399 @@
+"""
+Shared fetcher for all BinDays config entries.
+"""
+
+# External Packages
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+# Internal Packages
+from .api import BinDaysApiClientError
+from .api.cache import LruTtlCache
+from .api.single_flight import SingleFlight
+from .api.stats import ClientStats
+from .models.address import Address
+from .models.bin_day import BinDay
+from .models.collector import Collector
+from .const import (
+    DOMAIN,
+    DATA_HUB,
+    DEFAULT_API_URL,
+    CLIENT_SIDE_CACHE_HOSTS,
+    CLIENT_SIDE_CACHE_TTL,
+    LOOKUP_CACHE_TTL,
+    STARTUP_REFRESH_CONCURRENCY,
+)
+
+if TYPE_CHECKING:
+    from .api.client import BinDaysApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+GroupKey = Tuple[str, str]
+"""Key grouping config entries by collector ID and normalised postcode."""
+
+GroupResult = Dict[str, Union[List[BinDay], BinDaysApiClientError]]
+"""Bin days (or the error raised fetching them) for each address in a group."""
+
+BinDaysListener = Callable[[List[BinDay]], None]
+"""Callback given the bin days for an address fetched by a group refresh."""
+
+RESULT_REUSE_SECONDS = 300
+"""How long the bin days from a group refresh are reused by entries in the group."""
+
+LOOKUP_CACHE_SIZE = 32
+"""Maximum number of collector and address lookups kept for the config flow."""
+
+
+def async_get_hub(hass: HomeAssistant) -> BinDaysHub:
+    """
+    Return the shared hub, creating it if needed.
+
+    The hub's client is also used by the config flow, so anything the client
+    keeps (such as the collectors list) is shared with the config entries.
+    It is only created once something is fetched.
+
+    The client owns the session used for client-side requests. It is closed
+    when the last config entry is unloaded, or when Home Assistant shuts down.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    hub: Optional[BinDaysHub] = domain_data.get(DATA_HUB)
+    if hub is None:
+        hub = BinDaysHub(client_factory=lambda: _create_client(hass))
+        domain_data[DATA_HUB] = hub
+
+        async def async_close_hub(_: Event) -> None:
+            """
+            Close the hub when Home Assistant shuts down.
+            """
+            if domain_data.get(DATA_HUB) is hub:
+                domain_data.pop(DATA_HUB)
+            await hub.async_close()
+
+        hub.async_on_close(
+            hass.bus.async_listen(EVENT_HOMEASSISTANT_CLOSE, async_close_hub)
+        )
+
+    return hub
+
+
+async def async_release_hub(hass: HomeAssistant, hub: BinDaysHub) -> None:
+    """
+    Close the shared hub once no config entry is registered with it.
+    """
+    if hub.has_registrations:
+        return
+
+    if hass.data.get(DOMAIN, {}).get(DATA_HUB) is hub:
+        hass.data[DOMAIN].pop(DATA_HUB)
+
+    await hub.async_close()
+
+
+def _create_client(hass: HomeAssistant) -> BinDaysApiClient:
+    """
+    Create the client shared by the config entries and the config flow.
+    """
+    # Imported on first use, as entries set up from stored schedules don't need it
+    from .api.cache import ResponseCache
+    from .api.client import BinDaysApiClient
+
+    return BinDaysApiClient(
+        async_get_clientsession(hass),
+        DEFAULT_API_URL,
+        # Only councils known not to keep state in their pages are reused
+        ResponseCache(
+            host_ttls={
+                host: CLIENT_SIDE_CACHE_TTL.total_seconds() for host in CLIENT_SIDE_CACHE_HOSTS
+            },
+        ),
+    )
+
+
+def normalise_postcode(postcode: str) -> str:
+    """
+    Return a postcode in a canonical form suitable for grouping.
+    """
+    return " ".join(postcode.upper().split())
+
+
+class BinDaysHub:
+    """
+    Shared fetcher that de-duplicates refreshes across config entries.
+
+    Entries are grouped by collector and postcode. A refresh requested by any
+    entry in a group fetches the bin days for every address registered in that
+    group in one go. The bin days are passed to the listener registered for
+    each address, so the other entries don't need to refresh themselves, and
+    are reused for a short while by entries that refresh anyway. Failures are
+    not reused: an address that failed is fetched again on its own.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BinDaysApiClient] = None,
+        client_factory: Optional[Callable[[], BinDaysApiClient]] = None,
+    ) -> None:
+        """
+        Initialise the hub with a client, or a factory creating one on first use.
+        """
+        if client is None and client_factory is None:
+            raise ValueError("Either a client or a client factory is required")
+
+        self._client = client
+        self._client_factory = client_factory
+
+        self.startup_refreshes = asyncio.Semaphore(STARTUP_REFRESH_CONCURRENCY)
+        """Limits how many entries refresh at once after Home Assistant starts."""
+
+        self._addresses: Dict[GroupKey, Dict[str, int]] = {}
+        self._listeners: Dict[GroupKey, List[Tuple[str, BinDaysListener]]] = {}
+        self._refreshes = SingleFlight()
+        self._results: Dict[GroupKey, Tuple[float, Dict[str, List[BinDay]]]] = {}
+        self._lookups: LruTtlCache[Tuple[str, ...], Any] = LruTtlCache(LOOKUP_CACHE_SIZE)
+        self._on_close: List[Callable[[], None]] = []
+        self._closed = False
+
+    @property
+    def client(self) -> BinDaysApiClient:
+        """
+        Return the API client, creating it on first use.
+        """
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    @property
+    def client_stats(self) -> Optional[ClientStats]:
+        """
+        Return the client's statistics, or None if it hasn't been needed yet.
+        """
+        return self._client.stats if self._client is not None else None
+
+    @property
+    def has_registrations(self) -> bool:
+        """
+        Return whether any address is registered with the hub.
+        """
+        return bool(self._addresses)
+
+    def async_on_close(self, func: Callable[[], None]) -> None:
+        """
+        Add a function to call when the hub is closed.
+        """
+        self._on_close.append(func)
+
+    async def async_close(self) -> None:
+        """
+        Cancel every refresh in flight and close the client.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        while self._on_close:
+            self._on_close.pop()()
+
+        self._refreshes.cancel_all()
+        self._results.clear()
+        self._listeners.clear()
+        self._lookups.clear()
+
+        if self._client is not None:
+            await self._client.close()
+
+    def register(
+        self,
+        collector_id: str,
+        postcode: str,
+        address_id: str,
+        listener: Optional[BinDaysListener] = None,
+    ) -> None:
+        """
+        Register an address so it is included in its group's refreshes.
+
+        The listener, if any, is called with the address's bin days whenever
+        a group refresh fetches them successfully.
+        """
+        key = (collector_id, normalise_postcode(postcode))
+        addresses = self._addresses.setdefault(key, {})
+        addresses[address_id] = addresses.get(address_id, 0) + 1
+
+        if listener is not None:
+            self._listeners.setdefault(key, []).append((address_id, listener))
+
+    def unregister(
+        self,
+        collector_id: str,
+        postcode: str,
+        address_id: str,
+        listener: Optional[BinDaysListener] = None,
+    ) -> None:
+        """
+        Remove an address registration, dropping the group once it is empty.
+        """
+        key = (collector_id, normalise_postcode(postcode))
+        addresses = self._addresses.get(key)
+        if not addresses or address_id not in addresses:
+            return
+
+        if listener is not None and (listeners := self._listeners.get(key)):
+            if (address_id, listener) in listeners:
+                listeners.remove((address_id, listener))
+            if not listeners:
+                del self._listeners[key]
+
+        addresses[address_id] -= 1
+        if addresses[address_id] <= 0:
+            del addresses[address_id]
+
+        if not addresses:
+            del self._addresses[key]
+            self._listeners.pop(key, None)
+            self._results.pop(key, None)
+            self._refreshes.cancel(key)
+
+    async def async_get_collector(self, postcode: str) -> Collector:
+        """
+        Return the collector for a postcode, reusing a recent lookup.
+        """
+        key = ("collector", normalise_postcode(postcode))
+        if (collector := self._lookups.get(key)) is not None:
+            return collector
+
+        collector = await self.client.get_collector(postcode)
+        self._lookups.set(key, collector, LOOKUP_CACHE_TTL.total_seconds())
+        return collector
+
+    async def async_get_addresses(
+        self, collector: Collector, postcode: str
+    ) -> List[Address]:
+        """
+        Return the addresses in a postcode, reusing a recent lookup.
+
+        Adding several addresses in the same postcode then only runs the
+        collector's request chain once. Empty results aren't kept, as they
+        are more likely to be a council fault than an empty postcode.
+        """
+        key = ("addresses", collector.gov_uk_id, normalise_postcode(postcode))
+        if (addresses := self._lookups.get(key)) is not None:
+            return list(addresses)
+
+        addresses = await self.client.get_addresses(collector, postcode)
+        if addresses:
+            self._lookups.set(key, list(addresses), LOOKUP_CACHE_TTL.total_seconds())
+        return addresses
+
+    async def async_get_bin_days(
+        self, collector_id: str, postcode: str, address_id: str
+    ) -> List[BinDay]:
+        """
+        Return the bin days for an address, sharing the fetch with its group.
+        """
+        key = (collector_id, normalise_postcode(postcode))
+
+        # Serve from a recently completed group refresh if it covers the address
+        if cached := self._results.get(key):
+            completed_at, fetched = cached
+            if time.monotonic() - completed_at < RESULT_REUSE_SECONDS:
+                if address_id in fetched:
+                    return fetched[address_id]
+
+                # Failed, or registered since: the rest of the group is still fresh
+                return await self._async_fetch(collector_id, key[1], address_id)
+
+        # Overlapping requests from entries in the group share one refresh
+        result = await self._refreshes.run(
+            key, lambda: self._async_refresh_group(key, address_id)
+        )
+
+        if address_id not in result:
+            # Registered after the shared refresh had already started
+            return await self._async_fetch(collector_id, key[1], address_id)
+
+        return self._unwrap(result[address_id])
+
+    async def _async_refresh_group(self, key: GroupKey, requested_id: str) -> GroupResult:
+        """
+        Fetch bin days for every address registered in a group.
+        """
+        collector_id, postcode = key
+        address_ids: Set[str] = set(self._addresses.get(key, {}))
+        address_ids.add(requested_id)
+
+        _LOGGER.debug(
+            "Refreshing %s address(es) for %s %s", len(address_ids), collector_id, postcode
+        )
+
+        targets = [self._target(collector_id, postcode, a) for a in sorted(address_ids)]
+
+        result: GroupResult = {}
+        async for fetched in self.client.get_bin_days_many(targets):
+            result[fetched.address.uid] = (
+                fetched.error if fetched.error is not None else fetched.bin_days
+            )
+
+        if key not in self._addresses:
+            return result
+
+        succeeded = {a: r for a, r in result.items() if not isinstance(r, BinDaysApiClientError)}
+        self._results[key] = (time.monotonic(), succeeded)
+
+        # Hand every entry in the group its bin days, so it needn't fetch them too
+        for listener_address_id, listener in list(self._listeners.get(key, ())):
+            if listener_address_id in succeeded:
+                listener(succeeded[listener_address_id])
+
+        return result
+
+    async def _async_fetch(
+        self, collector_id: str, postcode: str, address_id: str
+    ) -> List[BinDay]:
+        """
+        Fetch bin days for a single address.
+        """
+        return await self.client.get_bin_days(
+            *self._target(collector_id, postcode, address_id)
+        )
+
+    @staticmethod
+    def _target(
+        collector_id: str, postcode: str, address_id: str
+    ) -> Tuple[Collector, Address]:
+        """
+        Build the Collector and Address for a registered address.
+        """
+        # Reconstruct minimal objects required by the API client
+        # The API client expects typed Collector and Address objects
+        collector = Collector(
+            govUkId=collector_id,
+            name="Stored Collector",
+            websiteUrl=None,
+            govUkUrl=None,
+        )
+        address = Address(
+            uid=address_id,
+            postcode=postcode,
+            property=None,
+            street=None,
+            town=None,
+        )
+
+        return collector, address
+
+    @staticmethod
+    def _unwrap(result: Union[List[BinDay], BinDaysApiClientError]) -> List[BinDay]:
+        """
+        Return the bin days for an address, or raise the error fetching them.
+        """
+        if isinstance(result, BinDaysApiClientError):
+            raise result
+        return result
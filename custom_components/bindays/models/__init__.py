@@ -1,16 +1,37 @@
 """
 Models package.
+
+Each model is imported on first use, so importing one model doesn't build
+the others.
 """
 
-# Internal Packages
-from .address import Address
-from .bin import Bin
-from .bin_day import BinDay
-from .collector import Collector
-from .client_side_options import ClientSideOptions
-from .client_side_request import ClientSideRequest
-from .client_side_response import ClientSideResponse
-from .api_response import ApiResponse
+# External Packages
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .address import Address
+    from .bin import Bin
+    from .bin_day import BinDay
+    from .collector import Collector
+    from .client_side_options import ClientSideOptions
+    from .client_side_request import ClientSideRequest
+    from .client_side_response import ClientSideResponse
+    from .api_response import ApiResponse
+    from .stored_schedule import StoredSchedule
+
+_LAZY_IMPORTS = {
+    "Address": ".address",
+    "Bin": ".bin",
+    "BinDay": ".bin_day",
+    "Collector": ".collector",
+    "ClientSideOptions": ".client_side_options",
+    "ClientSideRequest": ".client_side_request",
+    "ClientSideResponse": ".client_side_response",
+    "ApiResponse": ".api_response",
+    "StoredSchedule": ".stored_schedule",
+}
+"""Module each model is defined in."""
 
 __all__ = [
     "Address",
@@ -21,4 +42,17 @@ __all__ = [
     "ClientSideRequest",
     "ClientSideResponse",
     "ApiResponse",
-]
\ No newline at end of file
+    "StoredSchedule",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a model on first use.
+    """
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
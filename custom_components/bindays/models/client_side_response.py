@@ -33,6 +33,9 @@ class ClientSideResponse(BaseModel):
     options: ClientSideOptions = Field(description="Original options used")
     """Original options used."""
 
+    body_size: int = Field(0, exclude=True, description="Size of the body received, in bytes")
+    """Size of the body received, in bytes. Not sent to the API."""
+
     def to_api_payload(self) -> Dict[str, Any]:
         """
         Convert to the dictionary format expected by the API.
@@ -0,0 +1,23 @@
+"""
+Pydantic data model for a StoredSchedule.
+"""
+
+# External Packages
+import datetime
+from typing import List
+from pydantic import BaseModel, Field
+
+# Internal Packages
+from .bin_day import BinDay
+
+
+class StoredSchedule(BaseModel):
+    """
+    Pydantic data model for a StoredSchedule.
+    """
+
+    fetched_at: datetime.datetime = Field(alias="fetchedAt", description="When the schedule was fetched")
+    """When the schedule was fetched."""
+
+    bin_days: List[BinDay] = Field(default_factory=list, alias="binDays", description="The last good list of bin days")
+    """The last good list of bin days."""
@@ -3,22 +3,20 @@ Sensor showing the next bin collection date.
 """
 
 from __future__ import annotations
-from typing import Any, List, Optional
-from datetime import date
+from typing import Any, Optional
+from datetime import date, time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
 )
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .models.bin_day import BinDay
+from .entity import BinDaysEntity, EntityState
+from .schedule import Schedule
 
 
-class NextCollectionSensor(CoordinatorEntity, SensorEntity):
+class NextCollectionSensor(BinDaysEntity, SensorEntity):
     """
     Sensor showing the next bin collection date.
     """
@@ -27,12 +25,18 @@ class NextCollectionSensor(CoordinatorEntity, SensorEntity):
     _attr_name = "Next Collection"
     _attr_device_class = SensorDeviceClass.DATE
     _attr_icon = "mdi:delete"
-
-    def __init__(self, coordinator: DataUpdateCoordinator, entry_id: str) -> None:
+    _unrecorded_attributes = BinDaysEntity._unrecorded_attributes | frozenset({"raw_bins"})
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        entry_id: str,
+        cutoff: Optional[time] = None,
+    ) -> None:
         """
         Initialize the sensor.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, cutoff)
         self._entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_next_collection"
 
@@ -41,21 +45,25 @@ class NextCollectionSensor(CoordinatorEntity, SensorEntity):
         """
         Return the state of the sensor.
         """
-        next_collection: Optional[BinDay] = self._get_next_collection()
-        if next_collection:
-            return next_collection.parsed_date
-        return None
+        return self._state()[0]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """
         Return the state attributes.
         """
-        next_collection: Optional[BinDay] = self._get_next_collection()
+        return self._state()[1]
+
+    def _compute_state(self, schedule: Schedule, today: date) -> EntityState:
+        """
+        Return the next collection date, and the bins collected on it.
+        """
+        next_collection = schedule.next_on_or_after(today)
         if not next_collection:
-            return {}
+            return None, {}
 
-        bins = next_collection.bins
+        collection_date, bin_day = next_collection
+        bins = bin_day.bins
         bin_names = [b.name for b in bins]
         bin_colours = [b.colour for b in bins]
 
@@ -65,32 +73,16 @@ class NextCollectionSensor(CoordinatorEntity, SensorEntity):
             for b in bins
         ]
 
-        return {
+        return collection_date, {
             "bins": bin_names,
             "colours": bin_colours,
             "raw_bins": raw_bins,
         }
 
-    def _get_next_collection(self) -> Optional[BinDay]:
-        """
-        Get the next collection from the coordinator data.
-        """
-        bin_days: List[BinDay] = self.coordinator.data
-        if not bin_days:
-            return None
-
-        today = date.today()
-        upcoming = []
-
-        for d in bin_days:
-            d_date = d.parsed_date
-            if d_date >= today:
-                upcoming.append((d_date, d))
 
-        # Sort by date
-        upcoming.sort(key=lambda x: x[0])
-
-        if upcoming:
-            return upcoming[0][1]
+class RecordedNextCollectionSensor(NextCollectionSensor):
+    """
+    Sensor showing the next bin collection date, with the detailed bins recorded.
+    """
 
-        return None
+    _unrecorded_attributes = BinDaysEntity._unrecorded_attributes
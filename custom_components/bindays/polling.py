@@ -0,0 +1,87 @@
+"""
+Polling interval for refreshing a schedule from the API.
+"""
+
+# External Packages
+from __future__ import annotations
+import random
+from datetime import date, timedelta
+
+# Internal Packages
+from .schedule import Schedule
+from .const import (
+    MIN_UPDATE_INTERVAL,
+    MAX_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+    RETRY_INTERVAL,
+    UPDATE_INTERVAL_JITTER,
+)
+
+
+class PollingPolicy:
+    """
+    Decides how long to wait before refreshing a schedule again.
+
+    Each refresh that doesn't change the schedule doubles the interval from
+    `base_interval`, up to `max_interval`. The interval is also kept to a
+    quarter of the schedule's remaining horizon, so refreshes come sooner as
+    the known collections run out. After a change the next refresh comes after
+    `min_interval`, to confirm it, and failed refreshes are retried from
+    `retry_interval`, backing off up to `base_interval`.
+
+    Every interval is jittered by up to `jitter` either way, so installs
+    polling the same council drift apart rather than refreshing in step.
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta = MIN_UPDATE_INTERVAL,
+        base_interval: timedelta = UPDATE_INTERVAL,
+        max_interval: timedelta = MAX_UPDATE_INTERVAL,
+        retry_interval: timedelta = RETRY_INTERVAL,
+        jitter: float = UPDATE_INTERVAL_JITTER,
+    ) -> None:
+        """
+        Initialise the polling policy.
+        """
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.retry_interval = retry_interval
+        self.jitter = jitter
+
+    def interval(self, schedule: Schedule, today: date, stable_refreshes: int) -> timedelta:
+        """
+        Return the interval after a successful refresh.
+
+        `stable_refreshes` is the number of refreshes in a row, including this
+        one, that haven't changed the schedule.
+        """
+        if stable_refreshes <= 0:
+            return self._jittered(self.min_interval)
+
+        interval = min(
+            self.base_interval * 2 ** min(stable_refreshes - 1, 16),
+            self.max_interval,
+        )
+
+        horizon = schedule[-1].parsed_date - today if schedule else timedelta(0)
+        interval = max(min(interval, horizon / 4), self.min_interval)
+
+        return self._jittered(interval)
+
+    def retry_interval_after(self, failures: int) -> timedelta:
+        """
+        Return the interval after `failures` failed refreshes in a row.
+        """
+        interval = min(
+            self.retry_interval * 2 ** min(max(failures - 1, 0), 16),
+            self.base_interval,
+        )
+        return self._jittered(interval)
+
+    def _jittered(self, interval: timedelta) -> timedelta:
+        """
+        Return an interval randomly stretched or shortened by up to the jitter.
+        """
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
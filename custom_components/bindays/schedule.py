@@ -0,0 +1,112 @@
+"""
+Date-sorted index of the bin days for an address.
+"""
+
+# External Packages
+from __future__ import annotations
+from bisect import bisect_left
+from datetime import date
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union, overload
+
+# Internal Packages
+from .models.bin_day import BinDay
+
+
+class Schedule(Sequence[BinDay]):
+    """
+    Immutable, date-sorted index of bin days.
+
+    Each date is parsed once when the schedule is built, and lookups by date
+    use a binary search. Bin days on the same date keep the order they were
+    given in.
+    """
+
+    __slots__ = ("_dates", "_bin_days")
+
+    def __init__(self, bin_days: Iterable[BinDay] = ()) -> None:
+        """
+        Build the schedule, parsing and sorting the dates of the bin days.
+        """
+        entries = sorted(((d.parsed_date, d) for d in bin_days), key=lambda e: e[0])
+        self._dates: Tuple[date, ...] = tuple(e[0] for e in entries)
+        self._bin_days: Tuple[BinDay, ...] = tuple(e[1] for e in entries)
+
+    @classmethod
+    def of(cls, bin_days: Optional[Iterable[BinDay]]) -> Schedule:
+        """
+        Return bin days as a schedule, only building one if they aren't already.
+        """
+        if isinstance(bin_days, Schedule):
+            return bin_days
+        return cls(bin_days or ())
+
+    @classmethod
+    def _sorted(cls, dates: Tuple[date, ...], bin_days: Tuple[BinDay, ...]) -> Schedule:
+        """
+        Return a schedule of bin days that are already sorted by date.
+        """
+        schedule = cls.__new__(cls)
+        schedule._dates = dates
+        schedule._bin_days = bin_days
+        return schedule
+
+    def __len__(self) -> int:
+        """
+        Return the number of bin days.
+        """
+        return len(self._bin_days)
+
+    @overload
+    def __getitem__(self, index: int) -> BinDay: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Schedule: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BinDay, Schedule]:
+        """
+        Return a bin day, or a slice of the schedule.
+        """
+        if isinstance(index, slice):
+            return self._sorted(self._dates[index], self._bin_days[index])
+        return self._bin_days[index]
+
+    def __iter__(self) -> Iterator[BinDay]:
+        """
+        Iterate over the bin days in date order.
+        """
+        return iter(self._bin_days)
+
+    def __repr__(self) -> str:
+        """
+        Return a representation of the schedule.
+        """
+        return f"Schedule({list(self._bin_days)!r})"
+
+    def items(self) -> Iterator[Tuple[date, BinDay]]:
+        """
+        Iterate over the parsed date and bin day of each collection, in date order.
+        """
+        return zip(self._dates, self._bin_days)
+
+    def next_on_or_after(self, day: date) -> Optional[Tuple[date, BinDay]]:
+        """
+        Return the first collection on or after a date.
+        """
+        index = bisect_left(self._dates, day)
+        if index == len(self._dates):
+            return None
+        return self._dates[index], self._bin_days[index]
+
+    def count_on_or_after(self, day: date) -> int:
+        """
+        Return the number of collections on or after a date.
+        """
+        return len(self._dates) - bisect_left(self._dates, day)
+
+    def between(self, start: date, end: Optional[date] = None) -> Schedule:
+        """
+        Return the collections from `start` up to, but not including, `end`.
+        """
+        lower = bisect_left(self._dates, start)
+        upper = len(self._dates) if end is None else bisect_left(self._dates, end, lower)
+        return self[lower:upper]
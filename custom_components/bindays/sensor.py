@@ -10,9 +10,24 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 # Internal Packages
-from .const import DOMAIN
-from .next_collection_sensor import NextCollectionSensor
-from .collection_schedule_sensor import CollectionScheduleSensor
+from .const import (
+    DOMAIN,
+    CONF_RECORD_SCHEDULE,
+    CONF_SCHEDULE_DAYS,
+    DEFAULT_RECORD_SCHEDULE,
+    DEFAULT_SCHEDULE_DAYS,
+)
+from .next_collection_sensor import NextCollectionSensor, RecordedNextCollectionSensor
+from .collection_schedule_sensor import (
+    CollectionScheduleSensor,
+    RecordedCollectionScheduleSensor,
+)
+from .diagnostic_sensor import (
+    CouncilLatencySensor,
+    RefreshDurationSensor,
+    RequestStepsSensor,
+)
+from .entity import collection_cutoff
 
 
 async def async_setup_entry(
@@ -24,10 +39,28 @@ async def async_setup_entry(
     Set up the sensor platform.
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    cutoff = collection_cutoff(entry)
+
+    # The recorder only reads which attributes to leave out from the class
+    if entry.options.get(CONF_RECORD_SCHEDULE, DEFAULT_RECORD_SCHEDULE):
+        next_collection, collection_schedule = (
+            RecordedNextCollectionSensor,
+            RecordedCollectionScheduleSensor,
+        )
+    else:
+        next_collection, collection_schedule = NextCollectionSensor, CollectionScheduleSensor
 
     entities = [
-        NextCollectionSensor(coordinator, entry.entry_id),
-        CollectionScheduleSensor(coordinator, entry.entry_id),
+        next_collection(coordinator, entry.entry_id, cutoff),
+        collection_schedule(
+            coordinator,
+            entry.entry_id,
+            entry.options.get(CONF_SCHEDULE_DAYS, DEFAULT_SCHEDULE_DAYS),
+            cutoff,
+        ),
+        RefreshDurationSensor(coordinator, entry.entry_id),
+        RequestStepsSensor(coordinator, entry.entry_id),
+        CouncilLatencySensor(coordinator, entry.entry_id),
     ]
 
     async_add_entities(entities)
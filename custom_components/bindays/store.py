@@ -0,0 +1,69 @@
+"""
+On-disk store of the last good schedule for a config entry.
+"""
+
+# External Packages
+from __future__ import annotations
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+# Internal Packages
+from .models.bin_day import BinDay
+from .models.stored_schedule import StoredSchedule
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+"""Version of the stored schedule format."""
+
+
+class ScheduleStore:
+    """
+    On-disk store of the last good schedule for a config entry.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """
+        Initialise the store.
+        """
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}", private=True
+        )
+
+    async def async_load(self) -> Optional[StoredSchedule]:
+        """
+        Load the stored schedule, if there is a usable one.
+        """
+        data = await self._store.async_load()
+        if not data:
+            return None
+
+        try:
+            return StoredSchedule(**data)
+        except ValidationError as e:
+            _LOGGER.debug("Discarding invalid stored schedule: %s", e)
+            return None
+
+    async def async_save(self, bin_days: List[BinDay], fetched_at: datetime) -> None:
+        """
+        Save a schedule, omitting empty fields to keep the file compact.
+        """
+        stored = StoredSchedule(fetchedAt=fetched_at, binDays=bin_days)
+        await self._store.async_save(
+            stored.model_dump(
+                mode="json", by_alias=True, exclude_none=True, exclude_defaults=True
+            )
+        )
+
+    async def async_remove(self) -> None:
+        """
+        Remove the stored schedule.
+        """
+        await self._store.async_remove()
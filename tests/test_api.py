@@ -0,0 +1,811 @@
+import sys
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+# Mock homeassistant modules
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+# Import AFTER mocking
+from custom_components.bindays.api.body import detect_charset
+from custom_components.bindays.api.cache import LruTtlCache, ResponseCache
+from custom_components.bindays.api.client import BinDaysApiClient
+from custom_components.bindays.api.deadline import Deadline
+from custom_components.bindays.api.decode import BIN_DAYS_RESPONSE, decode_collectors
+from custom_components.bindays.api.error import (
+    BinDaysApiClientError,
+    BinDaysChainLimitError,
+    BinDaysCircuitOpenError,
+)
+from custom_components.bindays.api.json_backend import json_dumps, stdlib_dumps
+from custom_components.bindays.api.rate_limit import RateLimiter
+from custom_components.bindays.api.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from custom_components.bindays.api.single_flight import SingleFlight
+from custom_components.bindays.api.upload import encode_client_side_payload
+from custom_components.bindays.models.address import Address
+from custom_components.bindays.models.bin_day import BinDay
+from custom_components.bindays.models.client_side_options import ClientSideOptions
+from custom_components.bindays.models.client_side_request import ClientSideRequest
+from custom_components.bindays.models.client_side_response import ClientSideResponse
+from custom_components.bindays.models.collector import Collector
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call_between_callers():
+    flight = SingleFlight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flight.run("key", call) for _ in range(5)))
+
+    assert results == [1, 1, 1, 1, 1]
+    assert "key" not in flight
+
+    # A later call starts a new flight
+    assert await flight.run("key", call) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_caller_cancellation_does_not_abort_others():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.create_task(flight.run("key", call))
+    second = asyncio.create_task(flight.run("key", call))
+    await started.wait()
+
+    first.cancel()
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_call_once_every_caller_gives_up():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(flight.run("key", call))
+    await asyncio.sleep(0)
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+    assert "key" not in flight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_caller_after_every_caller_gives_up_starts_a_new_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        try:
+            await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            # Unwinding takes a turn of the loop
+            await asyncio.sleep(0)
+            raise
+        return calls
+
+    caller = asyncio.create_task(flight.run("key", call))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.sleep(0)
+
+    # The first call is still unwinding when the next caller arrives
+    assert "key" not in flight
+    assert await flight.run("key", call) == 2
+
+
+class FakeBulkClient:
+    get_bin_days_many = BinDaysApiClient.get_bin_days_many
+
+    def __init__(self):
+        self.active = {}
+        self.peak = {}
+        self.peak_total = 0
+
+    async def get_bin_days(self, collector, address):
+        council = collector.gov_uk_id
+        self.active[council] = self.active.get(council, 0) + 1
+        self.peak[council] = max(self.peak.get(council, 0), self.active[council])
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        try:
+            await asyncio.sleep(0.01 * int(address.uid))
+            if address.uid == "0":
+                raise BinDaysApiClientError("boom")
+            return [BinDay(date="2026-01-01", address=address, bins=[])]
+        finally:
+            self.active[council] -= 1
+
+
+@pytest.mark.asyncio
+async def test_get_bin_days_many_bounds_concurrency_and_streams_results():
+    client = FakeBulkClient()
+    targets = [
+        (Collector(govUkId=council, name=council), Address(uid=str(uid), postcode="AB1 2CD"))
+        for council in ("a", "b", "c")
+        for uid in range(4)
+    ]
+
+    results = [
+        r async for r in client.get_bin_days_many(
+            targets, max_concurrency=4, max_concurrency_per_collector=2
+        )
+    ]
+
+    assert len(results) == len(targets)
+    assert client.peak_total <= 4
+    assert all(peak <= 2 for peak in client.peak.values())
+
+    failed = [r for r in results if r.error is not None]
+    assert sorted(r.collector.gov_uk_id for r in failed) == ["a", "b", "c"]
+    assert all(r.address.uid == "0" and r.bin_days is None for r in failed)
+
+    # Results arrive in completion order rather than input order
+    assert results != sorted(results, key=lambda r: targets.index((r.collector, r.address)))
+
+
+@pytest.mark.asyncio
+async def test_get_bin_days_many_stops_outstanding_chains_when_closed_early():
+    client = FakeBulkClient()
+    targets = [
+        (Collector(govUkId="a", name="a"), Address(uid=str(uid), postcode="AB1 2CD"))
+        for uid in range(1, 5)
+    ]
+
+    results = client.get_bin_days_many(targets)
+    assert (await results.__anext__()).address.uid == "1"
+    await results.aclose()
+
+    # The other chains have finished cancelling by the time it returns
+    assert client.active == {"a": 0}
+
+
+def test_lru_ttl_cache_evicts_least_recently_used_and_expires():
+    cache = LruTtlCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, ttl=0)
+    assert cache.get("d") is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Sized entries are evicted to fit, and ones too large aren't stored
+    cache = LruTtlCache(max_entries=10, max_size=10, size_of=len)
+    cache.set("a", "x" * 4, ttl=60)
+    cache.set("b", "x" * 4, ttl=60)
+    cache.set("c", "x" * 4, ttl=60)
+    assert cache.peek("a") is None and cache.peek("b") and cache.peek("c")
+    cache.set("d", "x" * 11, ttl=60)
+    assert cache.peek("d") is None and len(cache) == 2
+
+
+def test_response_cache_ttls_keys_and_storage_rules():
+    cache = ResponseCache(host_ttls={"council.gov.uk": 300}, default_ttl=0)
+
+    assert cache.ttl_for("GET", "https://www.council.gov.uk/page") == 300
+    assert cache.ttl_for("POST", "https://www.council.gov.uk/page") == 0
+    assert cache.ttl_for("GET", "https://other.gov.uk/page") == 0
+
+    key = cache.key("get", "https://council.gov.uk", {"Accept": "text/html"}, None)
+    assert key != cache.key("GET", "https://council.gov.uk", {"Accept": "*/*"}, None)
+    assert key == cache.key("GET", "https://council.gov.uk", {"accept": "text/html"}, None)
+
+    def response(status, headers=None):
+        return ClientSideResponse(
+            requestId=1,
+            statusCode=status,
+            headers=headers or {},
+            content="<html></html>",
+            options=ClientSideOptions(),
+        )
+
+    cache.store(key, response(500), ttl=300)
+    assert cache.get(key) is None
+
+    cache.store(key, response(200, {"cache-control": "no-store"}), ttl=300)
+    assert cache.get(key) is None
+
+    # A page starting a session belongs to the chain that requested it
+    cache.store(key, response(200, {"set-cookie": "session=1", "etag": '"v1"'}), ttl=300)
+    assert cache.get(key) is None
+    assert cache.conditional_headers(key) == {}
+
+    cache.store(key, response(200), ttl=300)
+    assert cache.get(key).content == "<html></html>"
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_response_cache_keeps_validated_responses_for_revalidation():
+    cache = ResponseCache()
+    key = cache.key("GET", "https://council.gov.uk", {}, None)
+
+    def response(status, headers, content=""):
+        return ClientSideResponse(
+            requestId=1,
+            statusCode=status,
+            headers=headers,
+            content=content,
+            options=ClientSideOptions(),
+        )
+
+    # Not reusable without a TTL, but kept because it has validators
+    cache.store(key, response(200, {"etag": '"v1"', "x-a": "1"}, "<html></html>"), ttl=0)
+    assert cache.get(key) is None
+    assert cache.conditional_headers(key) == {"If-None-Match": '"v1"'}
+
+    revalidated = cache.revalidated(key, response(304, {"x-a": "2"}))
+    assert revalidated.status_code == 200
+    assert revalidated.content == "<html></html>"
+    assert revalidated.headers == {"etag": '"v1"', "x-a": "2"}
+    assert cache.revalidations == 1
+
+    other = cache.key("GET", "https://council.gov.uk/other", {}, None)
+    cache.store(other, response(200, {}), ttl=0)
+    assert cache.conditional_headers(other) == {}
+
+    # Kept bodies expire, and are only kept while they fit
+    cache = ResponseCache(max_validated_size=20, validated_ttl=0)
+    cache.store(key, response(200, {"etag": '"v1"'}, "<html></html>"), ttl=0)
+    assert cache.conditional_headers(key) == {}
+
+    cache = ResponseCache(max_validated_size=20)
+    cache.store(key, response(200, {"etag": '"v1"'}, "<html>" * 10), ttl=0)
+    assert cache.conditional_headers(key) == {}
+
+
+@pytest.mark.asyncio
+async def test_not_modified_without_a_kept_body_is_fetched_again_in_full():
+    cache = ResponseCache()
+    conditional = []
+
+    async def council(request):
+        conditional.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match"):
+            # The kept body is evicted while the request is out
+            cache.clear()
+            return web.Response(status=304)
+        return web.Response(text="<html></html>", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/council", council)
+
+    async with TestServer(app) as server:
+        client = BinDaysApiClient(MagicMock(), response_cache=cache)
+        request = ClientSideRequest(requestId=1, url=str(server.make_url("/council")))
+
+        await client._send_client_side_request(request, Deadline(10))
+        response = await client._send_client_side_request(request, Deadline(10))
+        assert response.status_code == 200
+        assert response.content == "<html></html>"
+        assert conditional == [None, '"v1"', None]
+
+        await client.close()
+
+
+def test_retry_policy_classifies_failures_and_honours_retry_after():
+    policy = RetryPolicy(base_delay=1, max_delay=10)
+
+    assert policy.is_retryable(BinDaysApiClientError("busy", status=503))
+    assert policy.is_retryable(BinDaysApiClientError("slow down", status=429))
+    assert not policy.is_retryable(BinDaysApiClientError("bad postcode", status=400))
+
+    timeout = BinDaysApiClientError("timed out")
+    timeout.__cause__ = asyncio.TimeoutError()
+    assert policy.is_retryable(timeout)
+    assert not policy.is_retryable(BinDaysApiClientError("invalid data"))
+
+    assert 0 <= policy.delay(3) <= 4
+    assert policy.delay(1, retry_after=60) == 10
+    assert parse_retry_after({"Retry-After": "5"}) == 5
+    assert parse_retry_after({}) is None
+
+
+def test_circuit_breaker_opens_and_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+
+    breaker.record_failure("council.gov.uk")
+    assert breaker.allow("council.gov.uk")
+    breaker.record_failure("council.gov.uk")
+    assert breaker.is_open("council.gov.uk")
+
+    breaker.reset_timeout = 60
+    assert not breaker.allow("council.gov.uk")
+    assert breaker.allow("other.gov.uk")
+
+    breaker.reset_timeout = 0
+    assert breaker.allow("council.gov.uk")
+    breaker.record_success("council.gov.uk")
+    assert not breaker.is_open("council.gov.uk")
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_each_host_in_order_without_blocking_others():
+    limiter = RateLimiter(rate=20, burst=2)
+    order = []
+
+    async def request(host, name):
+        await limiter.acquire(host)
+        order.append(name)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    slow = [asyncio.ensure_future(request("slow.gov.uk", i)) for i in range(4)]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth("slow.gov.uk") == 2
+    assert limiter.queue_depth() == 2
+
+    # Another council isn't held up by the queue
+    await request("other.gov.uk", "other")
+    assert order == [0, 1, "other"]
+
+    await asyncio.gather(*slow)
+    assert order == [0, 1, "other", 2, 3]
+    assert loop.time() - started >= 0.09
+    assert limiter.acquired == 5
+    assert limiter.delayed == 2
+    assert limiter.wait_time > 0
+    assert limiter.queue_depth() == 0
+
+    limiter.pause("other.gov.uk", 0.1)
+    started = loop.time()
+    await limiter.acquire("other.gov.uk")
+    assert loop.time() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_client_retries_transient_failures_then_fails_fast():
+    statuses = [503, 429, 200]
+    requests = 0
+
+    async def collector(request):
+        nonlocal requests
+        requests += 1
+        status = statuses.pop(0) if statuses else 503
+        if status != 200:
+            return web.Response(status=status, headers={"Retry-After": "0"})
+        return web.json_response({"collector": {"govUkId": "council", "name": "Council"}})
+
+    app = web.Application()
+    app.router.add_post("/collector", collector)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = BinDaysApiClient(
+            session,
+            str(server.make_url("")),
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60),
+        )
+
+        collector = await client.get_collector("AB1 2CD")
+        assert collector.gov_uk_id == "council"
+        assert requests == 3
+
+        # Every attempt fails, opening the circuit
+        with pytest.raises(BinDaysApiClientError) as err:
+            await client.get_collector("AB1 2CD")
+        assert err.value.status == 503
+
+        with pytest.raises(BinDaysCircuitOpenError):
+            await client.get_collector("AB1 2CD")
+        assert requests == 6
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_collector_does_not_open_the_circuit_for_others():
+    async def bin_days(request):
+        if request.match_info["collector"] == "broken":
+            return web.Response(status=500)
+        address = {"uid": "1", "postcode": "AB1 2CD"}
+        return web.json_response({"binDays": [{"date": "2026-01-01", "address": address, "bins": []}]})
+
+    app = web.Application()
+    app.router.add_post("/{collector}/bin-days", bin_days)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = BinDaysApiClient(
+            session,
+            str(server.make_url("")),
+            retry_policy=RetryPolicy(max_attempts=1, base_delay=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        )
+        address = Address(uid="1", postcode="AB1 2CD", property=None, street=None, town=None)
+
+        def collector(gov_uk_id):
+            return Collector(govUkId=gov_uk_id, name=gov_uk_id, websiteUrl=None, govUkUrl=None)
+
+        for _ in range(2):
+            with pytest.raises(BinDaysApiClientError) as err:
+                await client.get_bin_days(collector("broken"), address)
+            assert err.value.status == 500
+
+        with pytest.raises(BinDaysCircuitOpenError):
+            await client.get_bin_days(collector("broken"), address)
+
+        # The API host itself is fine, so other collectors are unaffected
+        assert await client.get_bin_days(collector("healthy"), address)
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_chain_is_bounded_by_steps_and_deadline():
+    steps = 0
+
+    async def looping_collector(request):
+        nonlocal steps
+        steps += 1
+        return web.json_response({
+            "nextClientSideRequest": {
+                "requestId": steps,
+                "url": str(request.url.with_path("/council")),
+                "method": "GET",
+            }
+        })
+
+    async def slow_collector(request):
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    async def council(request):
+        return web.Response(text="<html></html>")
+
+    app = web.Application()
+    app.router.add_post("/collector", looping_collector)
+    app.router.add_post("/slow/collector", slow_collector)
+    app.router.add_get("/council", council)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = BinDaysApiClient(session, str(server.make_url("")), max_steps=3)
+        with pytest.raises(BinDaysChainLimitError, match="3 steps"):
+            await client.get_collector("AB1 2CD")
+        assert steps == 3
+        await client.close()
+
+        client = BinDaysApiClient(
+            session,
+            str(server.make_url("/slow")),
+            retry_policy=RetryPolicy(base_delay=0),
+            chain_timeout=0.2,
+        )
+        with pytest.raises(BinDaysChainLimitError):
+            await asyncio.wait_for(client.get_collector("AB1 2CD"), 1)
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_no_request_is_sent_once_the_deadline_has_passed():
+    deadline = Deadline(10, request_timeout=2)
+    assert deadline.client_timeout().total == 2
+
+    # aiohttp would take a timeout of zero as no timeout at all
+    deadline = Deadline(0)
+    with pytest.raises(BinDaysChainLimitError):
+        deadline.client_timeout()
+
+    session = MagicMock()
+    client = BinDaysApiClient(session, "http://api.invalid")
+    with pytest.raises(BinDaysChainLimitError):
+        await client._post_api("http://api.invalid/collector", {}, b"{}", deadline, "gzip")
+    session.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_chain_steps_are_recorded_per_collector():
+    async def bin_days(request):
+        if await request.read():
+            return web.json_response({
+                "binDays": [{"date": "2026-01-01", "address": {"uid": "1", "postcode": "AB1 2CD"}}]
+            })
+        return web.json_response({
+            "nextClientSideRequest": {
+                "requestId": 1,
+                "url": str(request.url.with_path("/council")),
+                "method": "POST",
+                "body": "uprn=1",
+            }
+        })
+
+    async def council(request):
+        return web.Response(text="<html>bins</html>")
+
+    app = web.Application()
+    app.router.add_post("/council-id/bin-days", bin_days)
+    app.router.add_post("/council", council)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = BinDaysApiClient(session, str(server.make_url("")))
+        collector = Collector(govUkId="council-id", name="Council")
+
+        await client.get_bin_days(collector, Address(uid="1", postcode="AB1 2CD"))
+        await client.close()
+
+    stats = client.stats.collector("council-id")
+    assert stats.chains == 1 and stats.errors == 0
+    assert stats.steps.last == 1
+    assert stats.step_stats["api"].count == 2
+    assert stats.step_stats["api"].bytes_sent > 0
+    assert stats.step_stats["council"].bytes_sent == len("uprn=1")
+    assert stats.step_stats["council"].bytes_received == len("<html>bins</html>")
+    assert stats.step_stats["council"].latency.percentile(90) > 0
+    assert client.stats.total.chains == 1
+
+
+@pytest.mark.asyncio
+async def test_uploads_are_compressed_and_trimmed_until_the_api_rejects_compression():
+    uploads = []
+    accept_compressed = True
+
+    async def bin_days(request):
+        encoding = request.headers.get("Content-Encoding")
+        if encoding and not accept_compressed:
+            return web.Response(status=415)
+        body = await request.read()
+        if not body:
+            return web.json_response({
+                "nextClientSideRequest": {
+                    "requestId": 1, "url": str(request.url.with_path("/council")),
+                }
+            })
+        uploads.append((encoding, request.content_length, json.loads(body)))
+        return web.json_response({
+            "binDays": [{"date": "2026-01-01", "address": {"uid": "1", "postcode": "AB1 2CD"}}]
+        })
+
+    async def council(request):
+        return web.Response(
+            text="<tr><td>Recycling</td></tr>" * 200,
+            headers={"Content-Security-Policy": "default-src 'self'", "Set-Cookie": "a=1"},
+        )
+
+    app = web.Application()
+    app.router.add_post("/council-id/bin-days", bin_days)
+    app.router.add_get("/council", council)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = BinDaysApiClient(session, str(server.make_url("")))
+        collector = Collector(govUkId="council-id", name="Council")
+
+        await client.get_bin_days(collector, Address(uid="1", postcode="AB1 2CD"))
+        encoding, size, payload = uploads[-1]
+        assert encoding == "gzip"
+        assert size < len(payload["content"]) / 10
+        assert "set-cookie" in payload["headers"]
+        assert "content-security-policy" not in payload["headers"]
+
+        accept_compressed = False
+        await client.get_bin_days(collector, Address(uid="2", postcode="AB1 2CD"))
+        await client.get_bin_days(collector, Address(uid="3", postcode="AB1 2CD"))
+        assert [u[0] for u in uploads] == ["gzip", None, None]
+
+        await client.close()
+
+    with pytest.raises(ValueError):
+        BinDaysApiClient(MagicMock(), upload_encoding="br")
+
+
+@pytest.mark.asyncio
+async def test_compressed_upload_failures_only_turn_off_compression_if_it_is_at_fault():
+    uploads = []
+    failures = []
+
+    async def bin_days(request):
+        encoding = request.headers.get("Content-Encoding")
+        body = await request.read()
+        if not body:
+            return web.json_response({
+                "nextClientSideRequest": {
+                    "requestId": 1, "url": str(request.url.with_path("/council")),
+                }
+            })
+        uploads.append(encoding)
+        failure = failures.pop(0) if failures else None
+        if failure == "timeout":
+            await asyncio.sleep(1)
+        elif failure == "bad body" or (failure == "bad encoding" and encoding):
+            return web.Response(status=400)
+        elif failure:
+            return web.Response(status=failure, headers={"Retry-After": "0"})
+        return web.json_response({
+            "binDays": [{"date": "2026-01-01", "address": {"uid": "1", "postcode": "AB1 2CD"}}]
+        })
+
+    async def council(request):
+        return web.Response(text="<tr><td>Recycling</td></tr>" * 200)
+
+    app = web.Application()
+    app.router.add_post("/council-id/bin-days", bin_days)
+    app.router.add_get("/council", council)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client = BinDaysApiClient(
+            session,
+            str(server.make_url("")),
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+            request_timeout=0.2,
+        )
+        collector = Collector(govUkId="council-id", name="Council")
+        address = Address(uid="1", postcode="AB1 2CD")
+
+        # Transient failures are retried compressed, and compression stays on
+        for failure in (503, "timeout"):
+            uploads.clear()
+            failures[:] = [failure]
+            assert await client.get_bin_days(collector, address)
+            assert uploads == ["gzip", "gzip"]
+
+        # A 400 the uncompressed body gets too is the body's fault
+        uploads.clear()
+        failures[:] = ["bad body", "bad body"]
+        with pytest.raises(BinDaysApiClientError) as err:
+            await client.get_bin_days(collector, address)
+        assert err.value.status == 400
+        assert uploads == ["gzip", None]
+
+        uploads.clear()
+        assert await client.get_bin_days(collector, address)
+        assert uploads == ["gzip"]
+
+        # A 400 only the compressed body gets turns compression off
+        uploads.clear()
+        failures[:] = ["bad encoding"]
+        assert await client.get_bin_days(collector, address)
+        assert await client.get_bin_days(collector, address)
+        assert uploads == ["gzip", None, None]
+
+        await client.close()
+
+
+def test_detect_charset_prefers_bom_then_header_then_markup():
+    assert detect_charset(None, b"\xef\xbb\xbf<html>") == "utf-8-sig"
+    assert detect_charset("ISO-8859-1", b'<meta charset="utf-8">') == "iso8859-1"
+    assert detect_charset(None, b'<meta http-equiv="Content-Type" content="text/html; charset=windows-1252">') == "cp1252"
+    assert detect_charset(None, b'<?xml version="1.0" encoding="ISO-8859-1"?>') == "iso8859-1"
+    assert detect_charset("bogus", b"<html>") == "utf-8"
+
+
+@pytest.mark.asyncio
+async def test_council_responses_are_streamed_decoded_and_capped():
+    async def council(request):
+        if request.query.get("size") == "huge":
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for _ in range(100):
+                await response.write(b"x" * 1024)
+            return response
+        page = '<meta charset="windows-1252"><p>Caf\u00e9 \u2013 collection</p>'.encode("cp1252")
+        return web.Response(body=page * 100, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/council", council)
+
+    async with TestServer(app) as server:
+        client = BinDaysApiClient(MagicMock(), max_response_size=10 * 1024)
+        deadline = Deadline(10)
+
+        request = ClientSideRequest(requestId=1, url=str(server.make_url("/council")))
+        response = await client._perform_client_side_request(request, {}, deadline)
+        assert response.content.startswith('<meta charset="windows-1252"><p>Caf\u00e9 \u2013')
+        assert response.body_size == len(response.content)
+        assert "body_size" not in response.to_api_payload()
+
+        request = ClientSideRequest(requestId=1, url=str(server.make_url("/council?size=huge")))
+        with pytest.raises(BinDaysApiClientError, match="larger than 10240"):
+            await client._perform_client_side_request(request, {}, deadline)
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_close_cancels_chains_and_leaves_shared_session_open():
+    started = asyncio.Event()
+
+    async def slow_collector(request):
+        started.set()
+        await asyncio.sleep(10)
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_post("/collector", slow_collector)
+
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        client_side_session = aiohttp.ClientSession()
+        client = BinDaysApiClient(
+            session, str(server.make_url("")), client_side_session=client_side_session
+        )
+
+        chain = asyncio.create_task(client.get_collector("AB1 2CD"))
+        await started.wait()
+        await client.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await chain
+        assert not client_side_session.closed
+        await client_side_session.close()
+
+
+def test_decoders_match_keyword_construction():
+    bin_day = {
+        "date": "2026-01-01",
+        "address": {"uid": "1", "postcode": "AB1 2CD"},
+        "bins": [{"name": "Recycling", "colour": "Blue"}],
+    }
+
+    bin_days, next_request = BIN_DAYS_RESPONSE.decode(json.dumps({"binDays": [bin_day]}))
+    assert bin_days == [BinDay(**bin_day)]
+    assert next_request is None
+
+    bin_days, next_request = BIN_DAYS_RESPONSE.decode(
+        b'{"nextClientSideRequest": {"requestId": 2, "url": "https://council.gov.uk"}}'
+    )
+    assert bin_days is None
+    assert next_request.request_id == 2 and next_request.method == "GET"
+
+    collectors = decode_collectors(b'[{"govUkId": "council", "name": "Council"}]')
+    assert collectors == [Collector(govUkId="council", name="Council")]
+
+
+def test_json_backends_encode_the_same_payload():
+    payload = ClientSideResponse(
+        requestId=1,
+        statusCode=200,
+        headers={"set-cookie": "a=1", "x-frame-options": "DENY"},
+        content="<p>Caf\u00e9 \u2013 \"bins\"</p>",
+        options=ClientSideOptions(),
+    ).to_api_payload()
+
+    encoded = [
+        json.loads(encode_client_side_payload(payload, {"x-frame-options"}, dumps))
+        for dumps in (json_dumps, stdlib_dumps)
+    ]
+
+    assert encoded[0] == encoded[1]
+    assert encoded[0]["content"] == payload["content"]
+    assert encoded[0]["headers"] == {"set-cookie": "a=1"}
@@ -0,0 +1,148 @@
+import sys
+import asyncio
+import importlib
+from unittest.mock import MagicMock
+
+# Mock homeassistant modules
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.data_entry_flow",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+    "voluptuous",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+
+class MockConfigFlow:
+    """
+    The parts of ConfigFlow the config flow relies on.
+    """
+
+    def __init_subclass__(cls, domain=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+    def async_show_form(self, **kwargs):
+        return {"type": "form", **kwargs}
+
+    def async_create_entry(self, **kwargs):
+        return {"type": "create_entry", **kwargs}
+
+
+sys.modules["homeassistant.config_entries"].ConfigFlow = MockConfigFlow
+sys.modules["homeassistant"].config_entries = sys.modules["homeassistant.config_entries"]
+sys.modules["homeassistant.core"].callback = lambda func: func
+
+import pytest
+# Import AFTER mocking, again in case another test imported it with other mocks
+config_flow = importlib.reload(importlib.import_module("custom_components.bindays.config_flow"))
+
+from custom_components.bindays.const import CONF_ADDRESS_ID, CONF_COLLECTOR_ID, CONF_POSTCODE
+from custom_components.bindays.models.address import Address
+from custom_components.bindays.models.collector import Collector
+
+
+def make_collector(gov_uk_id):
+    return Collector(govUkId=gov_uk_id, name=gov_uk_id.upper(), websiteUrl=None, govUkUrl=None)
+
+
+class FakeHub:
+    def __init__(self):
+        self.client = self
+        self.lookups = []
+        self.cancelled = []
+
+    async def async_get_collector(self, postcode):
+        return make_collector("detected")
+
+    async def async_get_addresses(self, collector, postcode):
+        self.lookups.append(collector.gov_uk_id)
+        try:
+            # Slower than the collectors lookup, as the council's site is asked
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled.append(collector.gov_uk_id)
+            raise
+        return [Address(uid=f"{collector.gov_uk_id}-1", postcode=postcode, property="1")]
+
+    async def get_collectors(self):
+        await asyncio.sleep(0.01)
+        return [make_collector("detected"), make_collector("other")]
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    hub = FakeHub()
+    monkeypatch.setattr(config_flow, "async_get_hub", lambda hass: hub)
+    return hub
+
+
+def make_flow():
+    flow = config_flow.ConfigFlow()
+    flow.hass = MagicMock()
+    flow.hass.async_create_background_task = (
+        lambda coro, name: asyncio.get_running_loop().create_task(coro)
+    )
+    return flow
+
+
+@pytest.mark.asyncio
+async def test_confirm_reuses_the_prefetched_addresses(hub):
+    flow = make_flow()
+
+    result = await flow.async_step_user({CONF_POSTCODE: "ab1 2cd"})
+    assert result["step_id"] == "confirm_collector"
+    assert flow._addresses_task is not None
+
+    result = await flow.async_step_confirm_collector({"is_correct": True})
+    assert result["step_id"] == "address"
+    assert hub.lookups == ["detected"]
+    assert [a.uid for a in flow.addresses] == ["detected-1"]
+
+    result = await flow.async_step_address({CONF_ADDRESS_ID: "detected-1"})
+    assert result["type"] == "create_entry"
+    assert result["data"][CONF_COLLECTOR_ID] == "detected"
+
+
+@pytest.mark.asyncio
+async def test_picking_another_collector_cancels_the_prefetch(hub):
+    flow = make_flow()
+
+    await flow.async_step_user({CONF_POSTCODE: "ab1 2cd"})
+    prefetch = flow._addresses_task
+    await asyncio.sleep(0)
+
+    result = await flow.async_step_confirm_collector({"is_correct": False})
+    assert result["step_id"] == "select_collector"
+
+    result = await flow.async_step_select_collector({CONF_COLLECTOR_ID: "other"})
+    assert result["step_id"] == "address"
+    assert prefetch.cancelled()
+    assert hub.cancelled == ["detected"]
+    assert hub.lookups == ["detected", "other"]
+    assert [a.uid for a in flow.addresses] == ["other-1"]
+
+
+@pytest.mark.asyncio
+async def test_abandoning_the_flow_cancels_the_prefetches(hub):
+    flow = make_flow()
+
+    await flow.async_step_user({CONF_POSTCODE: "ab1 2cd"})
+    prefetches = [flow._addresses_task, flow._collectors_task]
+    await asyncio.sleep(0)
+
+    flow.async_remove()
+    await asyncio.sleep(0)
+
+    assert all(task.cancelled() for task in prefetches)
+    assert hub.cancelled == ["detected"]
@@ -0,0 +1,354 @@
+import sys
+import asyncio
+import importlib
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Mock homeassistant modules
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+
+class UpdateFailed(Exception):
+    pass
+
+
+class MockDataUpdateCoordinator:
+    """
+    The parts of DataUpdateCoordinator the coordinator relies on.
+    """
+
+    def __init__(self, hass, logger, name, update_interval):
+        self.hass = hass
+        self.update_interval = update_interval
+        self.data = None
+        self.last_update_success = True
+        self.updates = 0
+        self.scheduled = 0
+
+    async def async_refresh(self):
+        try:
+            self.data = await self._async_update_data()
+            self.last_update_success = True
+        except UpdateFailed:
+            self.last_update_success = False
+        self.updates += 1
+
+    def async_set_updated_data(self, data):
+        self.data = data
+        self.last_update_success = True
+        self.updates += 1
+        self._schedule_refresh()
+
+    def async_update_listeners(self):
+        self.updates += 1
+
+    def async_set_update_error(self, err):
+        self.last_update_success = False
+        self.updates += 1
+
+    def _schedule_refresh(self):
+        self.scheduled += 1
+
+    async def async_shutdown(self):
+        pass
+
+
+sys.modules["homeassistant.helpers.update_coordinator"].DataUpdateCoordinator = (
+    MockDataUpdateCoordinator
+)
+sys.modules["homeassistant.helpers.update_coordinator"].UpdateFailed = UpdateFailed
+sys.modules["homeassistant.core"].callback = lambda func: func
+
+import pytest
+# Import AFTER mocking, again in case another test imported them with other mocks
+coordinator_module = importlib.reload(importlib.import_module("custom_components.bindays.coordinator"))
+integration = importlib.reload(importlib.import_module("custom_components.bindays"))
+
+from custom_components.bindays.api.client import BinDaysApiClient
+from custom_components.bindays.const import (
+    CONF_ADDRESS_ID,
+    CONF_COLLECTOR_ID,
+    CONF_MAX_STALE_HOURS,
+    CONF_POSTCODE,
+    DATA_SOURCE_CACHED,
+    DATA_SOURCE_FRESH,
+    STARTUP_REFRESH_CONCURRENCY,
+)
+from custom_components.bindays import hub as hub_module
+from custom_components.bindays.hub import BinDaysHub
+from custom_components.bindays.models.address import Address
+from custom_components.bindays.models.bin_day import BinDay
+
+BinDaysDataUpdateCoordinator = coordinator_module.BinDaysDataUpdateCoordinator
+
+
+class Clock:
+    def __init__(self):
+        self.value = datetime(2026, 1, 1, 8, tzinfo=timezone.utc)
+
+    def utcnow(self):
+        return self.value
+
+    def now(self):
+        return self.value
+
+
+class FakeClient:
+    get_bin_days_many = BinDaysApiClient.get_bin_days_many
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.calls = []
+        self.fail = False
+        self.running = 0
+        self.peak = 0
+
+    async def close(self):
+        pass
+
+    async def get_bin_days(self, collector, address):
+        self.calls.append(address.uid)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if self.fail:
+            raise coordinator_module.BinDaysApiClientError("boom")
+        return [BinDay(date="2026-01-05", address=address, bins=[])]
+
+
+class FakeStore:
+    def __init__(self, stored=None):
+        self.stored = stored
+        self.saved = 0
+
+    async def async_load(self):
+        return self.stored
+
+    async def async_save(self, bin_days, fetched_at):
+        self.saved += 1
+        self.stored = SimpleNamespace(bin_days=bin_days, fetched_at=fetched_at)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(coordinator_module, "dt_util", clock)
+    # Moving the clock on doesn't age the hub's results, so don't reuse them
+    monkeypatch.setattr(hub_module, "RESULT_REUSE_SECONDS", 0)
+    return clock
+
+
+def stored_schedule(uid, fetched_at, last_date="2026-01-05"):
+    address = Address(uid=uid, postcode="AB1 2CD")
+    return SimpleNamespace(
+        bin_days=[BinDay(date=last_date, address=address, bins=[])], fetched_at=fetched_at
+    )
+
+
+def make_coordinator(hub, uid, postcode="AB1 2CD", stored=None, options=None, tasks=None):
+    hass = MagicMock()
+    hass.data = {}
+    entry = MagicMock()
+    entry.entry_id = f"entry_{uid}"
+    entry.data = {CONF_POSTCODE: postcode, CONF_COLLECTOR_ID: "council", CONF_ADDRESS_ID: uid}
+    entry.options = options or {}
+    tasks = tasks if tasks is not None else []
+    entry.async_create_background_task = (
+        lambda hass, coro, name: tasks.append(asyncio.ensure_future(coro)) or tasks[-1]
+    )
+
+    coordinator = BinDaysDataUpdateCoordinator(hass, entry, hub)
+    coordinator._store = FakeStore(stored)
+    coordinator.tasks = tasks
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_startup_refreshes_take_turns_until_each_fetch_is_done(clock, monkeypatch):
+    client = FakeClient(delay=0.05)
+    hub = BinDaysHub(client)
+    tasks = []
+    started = []
+    monkeypatch.setattr(
+        integration, "async_at_started", lambda hass, func: started.append(func) or (lambda: None)
+    )
+
+    coordinators = []
+    for i in range(6):
+        # Half have a stale stored schedule, which is revalidated in the background
+        stored = stored_schedule(str(i), clock.value - timedelta(days=1)) if i % 2 else None
+        coordinator = make_coordinator(hub, str(i), f"AB{i} 1CD", stored, tasks=tasks)
+        await coordinator.async_load_stored()
+        integration._async_refresh_after_start(coordinator.hass, coordinator._entry, coordinator)
+        coordinators.append(coordinator)
+
+    # Nothing is fetched until Home Assistant has started
+    await asyncio.sleep(0)
+    assert client.calls == []
+    assert [c.data_source for c in coordinators[1::2]] == [DATA_SOURCE_CACHED] * 3
+
+    for func in started:
+        func(coordinators[0].hass)
+    await asyncio.gather(*tasks[:6])
+
+    assert sorted(client.calls) == ["0", "1", "2", "3", "4", "5"]
+    assert client.peak == STARTUP_REFRESH_CONCURRENCY
+    assert all(c.data_source == DATA_SOURCE_FRESH for c in coordinators)
+    assert all(not c.is_stale for c in coordinators)
+
+
+@pytest.mark.asyncio
+async def test_fetches_and_stores_a_schedule_when_there_is_none(clock):
+    client = FakeClient()
+    coordinator = make_coordinator(BinDaysHub(client), "1")
+
+    assert not await coordinator.async_load_stored()
+    assert coordinator.is_stale
+
+    await coordinator.async_refresh()
+
+    assert client.calls == ["1"]
+    assert coordinator.last_update_success
+    assert coordinator.data_source == DATA_SOURCE_FRESH
+    assert coordinator.fetched_at == clock.value
+    assert coordinator._store.saved == 1
+    assert coordinator.refreshes == 1
+    assert not coordinator.is_stale
+
+    clock.value += timedelta(hours=13)
+    assert coordinator.is_stale
+
+
+@pytest.mark.asyncio
+async def test_serves_the_stored_schedule_while_revalidating(clock):
+    client = FakeClient()
+    stored = stored_schedule("1", clock.value - timedelta(hours=1), last_date="2026-01-02")
+    coordinator = make_coordinator(BinDaysHub(client), "1", stored=stored)
+
+    assert await coordinator.async_load_stored()
+    assert coordinator.data_source == DATA_SOURCE_CACHED
+    assert coordinator.fetched_at == stored.fetched_at
+    assert not coordinator.is_stale
+    # The schedule runs out tomorrow, so it is polled more often than usual
+    assert coordinator.update_interval < timedelta(hours=11)
+
+    # The refresh returns the current schedule straight away
+    scheduled = coordinator.scheduled
+    await coordinator.async_refresh()
+    assert client.calls == []
+    assert coordinator.data_source == DATA_SOURCE_CACHED
+
+    # The revalidated schedule is pushed to listeners, restarting the interval
+    await asyncio.gather(*coordinator.tasks)
+    assert client.calls == ["1"]
+    assert coordinator.data_source == DATA_SOURCE_FRESH
+    assert coordinator.fetched_at == clock.value
+    assert coordinator.scheduled == scheduled + 1
+
+
+@pytest.mark.asyncio
+async def test_failed_revalidations_keep_the_last_good_schedule_until_too_old(clock):
+    client = FakeClient()
+    stored = stored_schedule("1", clock.value - timedelta(days=30))
+    coordinator = make_coordinator(
+        BinDaysHub(client), "1", stored=stored, options={CONF_MAX_STALE_HOURS: 24}
+    )
+    await coordinator.async_load_stored()
+    schedule = coordinator.data
+
+    # A stored schedule is kept, however old, until the API has answered once
+    client.fail = True
+    await coordinator.async_refresh()
+    await asyncio.gather(*coordinator.tasks)
+    assert coordinator.data is schedule
+    assert coordinator.data_source == DATA_SOURCE_CACHED
+    assert coordinator.last_update_success
+    assert coordinator.failed_refreshes == 1
+    assert coordinator.update_interval < timedelta(hours=1)
+
+    client.fail = False
+    await coordinator.async_refresh()
+    await asyncio.gather(*coordinator.tasks)
+    assert coordinator.data_source == DATA_SOURCE_FRESH
+    assert coordinator.update_interval >= timedelta(hours=5)
+
+    # Within the maximum stale age, a failure serves the last good schedule as stale
+    client.fail = True
+    clock.value += timedelta(hours=12)
+    await coordinator.async_refresh()
+    await asyncio.gather(*coordinator.tasks)
+    assert coordinator.data_source == coordinator_module.DATA_SOURCE_STALE
+    assert coordinator.last_update_success
+
+    # Beyond it, the failure is reported
+    clock.value += timedelta(hours=13)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.failed_refreshes == 3
+
+
+@pytest.mark.asyncio
+async def test_without_a_maximum_stale_age_every_refresh_waits_for_the_api(clock):
+    client = FakeClient()
+    stored = stored_schedule("1", clock.value - timedelta(hours=1))
+    coordinator = make_coordinator(
+        BinDaysHub(client), "1", stored=stored, options={CONF_MAX_STALE_HOURS: 0}
+    )
+    await coordinator.async_load_stored()
+
+    await coordinator.async_refresh()
+    assert client.calls == ["1"]
+    assert coordinator.tasks == []
+    assert coordinator.data_source == DATA_SOURCE_FRESH
+
+    # Once the API has answered, a failure isn't hidden by the last good schedule
+    client.fail = True
+    clock.value += timedelta(minutes=1)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+
+@pytest.mark.asyncio
+async def test_entries_in_a_group_take_each_others_refreshes(clock):
+    client = FakeClient()
+    hub = BinDaysHub(client)
+    first = make_coordinator(hub, "1")
+    second = make_coordinator(hub, "2")
+
+    await first.async_refresh()
+    await asyncio.gather(*second.tasks)
+
+    # One chain per address, and the second entry's refresh interval restarts
+    assert sorted(client.calls) == ["1", "2"]
+    assert second.data[0].address.uid == "2"
+    assert second.data_source == DATA_SOURCE_FRESH
+    assert second._store.saved == 1
+    assert second.scheduled == 1
+    assert second.refreshes == 0
+
+    # The refreshing entry's own result isn't taken a second time
+    assert first.refreshes == 1
+    assert first._store.saved == 1
+
+    await second.async_shutdown()
+    await first.async_refresh()
+    assert client.calls.count("2") == 1
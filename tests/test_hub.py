@@ -0,0 +1,229 @@
+import sys
+import asyncio
+from unittest.mock import MagicMock
+
+# Mock homeassistant modules
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.diagnostics",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+import pytest
+# Import AFTER mocking
+from custom_components.bindays.api.client import BinDaysApiClient
+from custom_components.bindays.api.error import BinDaysApiClientError
+from custom_components.bindays.const import DOMAIN
+from custom_components.bindays.diagnostics import async_get_config_entry_diagnostics
+from custom_components.bindays.hub import BinDaysHub
+from custom_components.bindays.models.address import Address
+from custom_components.bindays.models.bin_day import BinDay
+from custom_components.bindays.models.collector import Collector
+
+
+class FakeClient:
+    get_bin_days_many = BinDaysApiClient.get_bin_days_many
+
+    def __init__(self, fail_uids=()):
+        self.calls = []
+        self.fail_uids = set(fail_uids)
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def get_bin_days(self, collector, address):
+        self.calls.append((collector.gov_uk_id, address.postcode, address.uid))
+        await asyncio.sleep(0.01)
+        if address.uid in self.fail_uids:
+            raise BinDaysApiClientError("boom")
+        return [BinDay(date="2026-01-01", address=address, bins=[])]
+
+    async def get_collector(self, postcode):
+        self.calls.append(("collector", postcode))
+        return Collector(govUkId="council", name="Council", websiteUrl=None, govUkUrl=None)
+
+    async def get_addresses(self, collector, postcode):
+        self.calls.append(("addresses", collector.gov_uk_id, postcode))
+        if postcode in self.fail_uids:
+            raise BinDaysApiClientError("boom")
+        return [
+            Address(uid=uid, postcode=postcode, property=uid, street=None, town=None)
+            for uid in ("2", "1")
+        ]
+
+
+@pytest.mark.asyncio
+async def test_hub_merges_overlapping_refreshes_within_a_group():
+    client = FakeClient()
+    hub = BinDaysHub(client)
+    hub.register("council", "AB1 2CD", "1")
+    hub.register("council", "ab1  2cd", "2")
+    hub.register("council", "AB1 2CD", "2")
+
+    results = await asyncio.gather(
+        hub.async_get_bin_days("council", "AB1 2CD", "1"),
+        hub.async_get_bin_days("council", "AB1 2CD", "2"),
+        hub.async_get_bin_days("council", "AB1 2CD", "2"),
+    )
+
+    # One chain per distinct address, regardless of how many entries asked
+    assert sorted(client.calls) == [
+        ("council", "AB1 2CD", "1"),
+        ("council", "AB1 2CD", "2"),
+    ]
+    assert [r[0].address.uid for r in results] == ["1", "2", "2"]
+
+    # A sibling refreshing shortly afterwards is served from the shared result
+    await hub.async_get_bin_days("council", "AB1 2CD", "1")
+    assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_hub_reports_errors_per_address():
+    client = FakeClient(fail_uids={"2"})
+    hub = BinDaysHub(client)
+    hub.register("council", "AB1 2CD", "1")
+    hub.register("council", "AB1 2CD", "2")
+
+    assert await hub.async_get_bin_days("council", "AB1 2CD", "1")
+    with pytest.raises(BinDaysApiClientError):
+        await hub.async_get_bin_days("council", "AB1 2CD", "2")
+
+    # Failures aren't reused: each retry fetches just the failed address again
+    client.fail_uids.clear()
+    assert await hub.async_get_bin_days("council", "AB1 2CD", "2")
+    assert client.calls.count(("council", "AB1 2CD", "2")) == 3
+    assert client.calls.count(("council", "AB1 2CD", "1")) == 1
+
+
+@pytest.mark.asyncio
+async def test_hub_passes_group_refreshes_to_every_entry():
+    client = FakeClient(fail_uids={"5"})
+    hub = BinDaysHub(client)
+    received = {}
+    for uid in ("1", "2", "3", "4", "5"):
+        hub.register(
+            "council", "AB1 2CD", uid, lambda bin_days, uid=uid: received.setdefault(uid, bin_days)
+        )
+
+    await hub.async_get_bin_days("council", "AB1 2CD", "1")
+
+    # One chain per address, and every entry that succeeded is handed its bin days
+    assert len(client.calls) == 5
+    assert sorted(received) == ["1", "2", "3", "4"]
+    assert all(bin_days[0].address.uid == uid for uid, bin_days in received.items())
+
+    listener = hub._listeners[("council", "AB1 2CD")][0][1]
+    hub.unregister("council", "AB1 2CD", "1", listener)
+    assert all(a != "1" for a, _ in hub._listeners[("council", "AB1 2CD")])
+
+
+def test_hub_unregister_drops_empty_groups():
+    hub = BinDaysHub(FakeClient())
+    hub.register("council", "AB1 2CD", "1")
+    hub.register("council", "AB1 2CD", "1")
+
+    hub.unregister("council", "AB1 2CD", "1")
+    assert hub.has_registrations
+
+    hub.unregister("council", "AB1 2CD", "1")
+    assert not hub.has_registrations
+
+
+@pytest.mark.asyncio
+async def test_hub_close_cancels_refreshes_and_closes_client():
+    client = FakeClient()
+    hub = BinDaysHub(client)
+    hub.register("council", "AB1 2CD", "1")
+    closed = []
+    hub.async_on_close(lambda: closed.append(True))
+
+    refresh = asyncio.create_task(hub.async_get_bin_days("council", "AB1 2CD", "1"))
+    await asyncio.sleep(0)
+    await hub.async_close()
+    await hub.async_close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await refresh
+    assert client.closed
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_hub_reuses_collector_and_address_lookups_per_postcode():
+    client = FakeClient(fail_uids={"ZZ9 9ZZ"})
+    hub = BinDaysHub(client)
+
+    collector = await hub.async_get_collector("AB1 2CD")
+    assert await hub.async_get_collector("ab1  2cd") is collector
+
+    addresses = await hub.async_get_addresses(collector, "AB1 2CD")
+    addresses.sort(key=lambda a: a.uid)
+    # Callers get their own list, so sorting one doesn't change the cached lookup
+    assert [a.uid for a in await hub.async_get_addresses(collector, "ab1 2cd")] == ["2", "1"]
+    assert client.calls == [("collector", "AB1 2CD"), ("addresses", "council", "AB1 2CD")]
+
+    # Failures aren't cached
+    for _ in range(2):
+        with pytest.raises(BinDaysApiClientError):
+            await hub.async_get_addresses(collector, "ZZ9 9ZZ")
+    assert client.calls.count(("addresses", "council", "ZZ9 9ZZ")) == 2
+
+    await hub.async_close()
+    await hub.async_get_collector("AB1 2CD")
+    assert client.calls.count(("collector", "AB1 2CD")) == 2
+
+
+@pytest.mark.asyncio
+async def test_hub_creates_client_on_first_use():
+    clients = []
+
+    def create_client():
+        clients.append(FakeClient())
+        return clients[-1]
+
+    hub = BinDaysHub(client_factory=create_client)
+    hub.register("council", "AB1 2CD", "1")
+    assert hub.client_stats is None
+    assert clients == []
+
+    await hub.async_get_bin_days("council", "AB1 2CD", "1")
+    assert hub.client is clients[0]
+    assert len(clients) == 1
+
+    await hub.async_close()
+    assert clients[0].closed
+
+    # Closing a hub that never fetched anything doesn't create a client
+    idle = BinDaysHub(client_factory=create_client)
+    await idle.async_close()
+    assert len(clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_do_not_create_the_client():
+    clients = []
+    hub = BinDaysHub(client_factory=lambda: clients.append(MagicMock()) or clients[-1])
+    coordinator = MagicMock(hub=hub, fetched_at=None, update_interval=None, data=None)
+    coordinator.collector_stats = None
+    entry = MagicMock(entry_id="entry", data={}, options={})
+    hass = MagicMock(data={DOMAIN: {"entry": coordinator}})
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["client"] is None
+    assert "rate_limiter" not in diagnostics
+    assert clients == []
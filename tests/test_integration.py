@@ -22,12 +22,19 @@ mock_ha_update = ModuleType("homeassistant.helpers.update_coordinator")
 mock_ha_entity = ModuleType("homeassistant.helpers.entity_platform")
 mock_ha_sensor = ModuleType("homeassistant.components.sensor")
 mock_ha_components = ModuleType("homeassistant.components")
+mock_ha_storage = ModuleType("homeassistant.helpers.storage")
+mock_ha_start = ModuleType("homeassistant.helpers.start")
+mock_ha_util = ModuleType("homeassistant.util")
 
 # Populate attributes to satisfy imports
 mock_ha_config.ConfigEntry = MagicMock()
 mock_ha_core.HomeAssistant = MagicMock()
+mock_ha_core.Event = MagicMock()
+mock_ha_core.CoreState = MagicMock()
+mock_ha_core.callback = lambda func: func
 mock_ha_const.Platform = MagicMock()
 mock_ha_const.Platform.SENSOR = "sensor"
+mock_ha_const.EVENT_HOMEASSISTANT_CLOSE = "homeassistant_close"
 mock_ha_flow.FlowResult = MagicMock()
 mock_ha_update.DataUpdateCoordinator = MagicMock()
 mock_ha_update.UpdateFailed = Exception
@@ -35,6 +42,9 @@ mock_ha_http.async_get_clientsession = MagicMock()
 mock_ha_sensor.SensorEntity = MagicMock()
 mock_ha_sensor.SensorDeviceClass = MagicMock()
 mock_ha_update.CoordinatorEntity = MagicMock()
+mock_ha_storage.Store = MagicMock()
+mock_ha_start.async_at_started = MagicMock()
+mock_ha_util.dt = MagicMock()
 
 sys.modules["homeassistant"] = mock_ha
 sys.modules["homeassistant.core"] = mock_ha_core
@@ -48,6 +58,9 @@ sys.modules["homeassistant.helpers.update_coordinator"] = mock_ha_update
 sys.modules["homeassistant.helpers.entity_platform"] = mock_ha_entity
 sys.modules["homeassistant.components"] = mock_ha_components
 sys.modules["homeassistant.components.sensor"] = mock_ha_sensor
+sys.modules["homeassistant.helpers.storage"] = mock_ha_storage
+sys.modules["homeassistant.helpers.start"] = mock_ha_start
+sys.modules["homeassistant.util"] = mock_ha_util
 
 # Internal Packages
 from custom_components.bindays.api.client import BinDaysApiClient
@@ -0,0 +1,70 @@
+import sys
+from unittest.mock import MagicMock
+
+# Mock homeassistant modules
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+from datetime import date, timedelta
+# Import AFTER mocking
+from custom_components.bindays.models.address import Address
+from custom_components.bindays.models.bin_day import BinDay
+from custom_components.bindays.polling import PollingPolicy
+from custom_components.bindays.schedule import Schedule
+
+ADDRESS = Address(uid="1", postcode="AB1 2CD")
+TODAY = date(2026, 1, 1)
+
+
+def schedule_until(days):
+    return Schedule([
+        BinDay(date=(TODAY + timedelta(days=d)).isoformat(), address=ADDRESS, bins=[])
+        for d in range(0, days + 1, 7)
+    ])
+
+
+def test_polling_interval_stretches_while_the_schedule_is_stable():
+    policy = PollingPolicy(jitter=0)
+    schedule = schedule_until(180)
+
+    assert policy.interval(schedule, TODAY, 1) == timedelta(hours=12)
+    assert policy.interval(schedule, TODAY, 2) == timedelta(hours=24)
+    assert policy.interval(schedule, TODAY, 10) == timedelta(hours=48)
+
+    # A change is confirmed soon after
+    assert policy.interval(schedule, TODAY, 0) == timedelta(hours=6)
+
+
+def test_polling_interval_tightens_as_the_schedule_runs_out():
+    policy = PollingPolicy(jitter=0)
+
+    assert policy.interval(schedule_until(7), TODAY, 10) == timedelta(hours=42)
+    assert policy.interval(schedule_until(0), TODAY, 10) == timedelta(hours=6)
+    assert policy.interval(Schedule(), TODAY, 10) == timedelta(hours=6)
+
+
+def test_polling_retries_back_off_and_intervals_are_jittered():
+    policy = PollingPolicy(jitter=0)
+
+    assert policy.retry_interval_after(1) == timedelta(minutes=30)
+    assert policy.retry_interval_after(2) == timedelta(minutes=60)
+    assert policy.retry_interval_after(10) == timedelta(hours=12)
+
+    policy = PollingPolicy(jitter=0.1)
+    intervals = {policy.interval(schedule_until(180), TODAY, 1) for _ in range(20)}
+    assert len(intervals) > 1
+    assert all(timedelta(hours=10.8) <= i <= timedelta(hours=13.2) for i in intervals)
@@ -0,0 +1,62 @@
+import sys
+from unittest.mock import MagicMock
+
+# Mock homeassistant modules
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+from datetime import date
+# Import AFTER mocking
+from custom_components.bindays.models.address import Address
+from custom_components.bindays.models.bin_day import BinDay
+from custom_components.bindays.schedule import Schedule
+
+ADDRESS = Address(uid="1", postcode="AB1 2CD")
+
+
+def bin_day(day, name="General"):
+    return BinDay(date=day, address=ADDRESS, bins=[{"name": name, "colour": "Black"}])
+
+
+def test_schedule_sorts_once_and_keeps_order_within_a_day():
+    schedule = Schedule([
+        bin_day("2026-01-15"),
+        bin_day("2026-01-01T00:00:00Z", "First"),
+        bin_day("2026-01-08"),
+        bin_day("2026-01-01", "Second"),
+    ])
+
+    assert [d.isoformat() for d, _ in schedule.items()] == [
+        "2026-01-01", "2026-01-01", "2026-01-08", "2026-01-15",
+    ]
+    assert [b.bins[0].name for b in schedule[:2]] == ["First", "Second"]
+    assert Schedule.of(schedule) is schedule
+    assert len(Schedule.of(None)) == 0
+
+
+def test_schedule_queries_by_date():
+    schedule = Schedule([bin_day("2026-01-01"), bin_day("2026-01-08"), bin_day("2026-01-15")])
+
+    assert schedule.next_on_or_after(date(2026, 1, 8))[0] == date(2026, 1, 8)
+    assert schedule.next_on_or_after(date(2026, 1, 9))[0] == date(2026, 1, 15)
+    assert schedule.next_on_or_after(date(2026, 1, 16)) is None
+
+    assert schedule.count_on_or_after(date(2026, 1, 2)) == 2
+    assert [d for d, _ in schedule.between(date(2026, 1, 1), date(2026, 1, 15)).items()] == [
+        date(2026, 1, 1), date(2026, 1, 8),
+    ]
+    assert len(schedule.between(date(2026, 2, 1))) == 0
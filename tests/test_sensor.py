@@ -1,4 +1,5 @@
 import sys
+from datetime import datetime
 from unittest.mock import MagicMock
 
 # Mock homeassistant modules
@@ -11,8 +12,12 @@ sys.modules["homeassistant.config_entries"] = MagicMock()
 sys.modules["homeassistant.core"] = MagicMock()
 sys.modules["homeassistant.helpers"] = MagicMock()
 sys.modules["homeassistant.helpers.entity_platform"] = MagicMock()
+sys.modules["homeassistant.helpers.event"] = MagicMock()
 sys.modules["homeassistant.helpers.update_coordinator"] = MagicMock()
 sys.modules["homeassistant.helpers.aiohttp_client"] = MagicMock()
+sys.modules["homeassistant.helpers.storage"] = MagicMock()
+sys.modules["homeassistant.helpers.start"] = MagicMock()
+sys.modules["homeassistant.util"] = MagicMock()
 
 # Define Mock classes for inheritance
 class MockEntity:
@@ -38,21 +43,37 @@ class MockEntity:
         return self._attr_icon
 
 class MockCoordinatorEntity(MockEntity):
+    available = True
+
     def __init__(self, coordinator):
         self.coordinator = coordinator
         super().__init__()
 
+    def _handle_coordinator_update(self):
+        self.async_write_ha_state()
+
+    def async_write_ha_state(self):
+        pass
+
 # Assign mocks to modules
 sys.modules["homeassistant.components.sensor"].SensorEntity = MockEntity
 sys.modules["homeassistant.helpers.update_coordinator"].CoordinatorEntity = MockCoordinatorEntity
 sys.modules["homeassistant.helpers.update_coordinator"].DataUpdateCoordinator = MagicMock
 sys.modules["homeassistant.components.sensor"].SensorDeviceClass = MagicMock()
+sys.modules["homeassistant.core"].callback = lambda func: func
+sys.modules["homeassistant.util"].dt.now = datetime.now
 
 import pytest
-from datetime import date, timedelta
+from datetime import date, time, timedelta
 # Import AFTER mocking
-from custom_components.bindays.collection_schedule_sensor import CollectionScheduleSensor
-from custom_components.bindays.next_collection_sensor import NextCollectionSensor
+from custom_components.bindays.collection_schedule_sensor import (
+    CollectionScheduleSensor,
+    RecordedCollectionScheduleSensor,
+)
+from custom_components.bindays.next_collection_sensor import (
+    NextCollectionSensor,
+    RecordedNextCollectionSensor,
+)
 from custom_components.bindays.models.bin_day import BinDay
 from custom_components.bindays.models.bin import Bin
 from custom_components.bindays.models.address import Address
@@ -61,6 +82,9 @@ from custom_components.bindays.models.address import Address
 def mock_coordinator():
     coordinator = MagicMock()
     coordinator.data = []
+    coordinator.data_source = "fresh"
+    coordinator.fetched_at = None
+    coordinator.update_interval = timedelta(hours=12)
     return coordinator
 
 @pytest.fixture
@@ -83,7 +107,11 @@ def test_collection_schedule_sensor_initialization(mock_coordinator, mock_entry)
 def test_collection_schedule_sensor_state_empty(mock_coordinator, mock_entry):
     sensor = CollectionScheduleSensor(mock_coordinator, mock_entry.entry_id)
     assert sensor.native_value == 0
-    assert sensor.extra_state_attributes == {"upcoming_collections": []}
+    assert sensor.extra_state_attributes == {
+        "upcoming_collections": [],
+        "data_source": "fresh",
+        "fetched_at": None,
+    }
 
 def test_collection_schedule_sensor_state_with_data(mock_coordinator, mock_entry):
     today = date.today()
@@ -118,4 +146,106 @@ def test_collection_schedule_sensor_state_with_data(mock_coordinator, mock_entry
     
     # check content
     assert upcoming[0]["bins"][0]["name"] == "Recycling"
-    assert len(upcoming[1]["bins"]) == 2
\ No newline at end of file
+    assert len(upcoming[1]["bins"]) == 2
+
+
+def test_sensor_caches_state_and_skips_unchanged_writes(mock_coordinator, mock_entry):
+    address = Address(postcode="TE1 1ST", uid="123")
+    tomorrow = date.today() + timedelta(days=1)
+    mock_coordinator.data = [BinDay(date=tomorrow.isoformat(), address=address, bins=[])]
+
+    sensor = CollectionScheduleSensor(mock_coordinator, mock_entry.entry_id)
+    sensor.async_write_ha_state = MagicMock()
+
+    attributes = sensor.extra_state_attributes
+    assert sensor.extra_state_attributes is attributes
+
+    sensor._handle_coordinator_update()
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+
+    # New data with the same schedule is recomputed, but not written
+    mock_coordinator.data = list(mock_coordinator.data)
+    sensor._handle_coordinator_update()
+    assert sensor.extra_state_attributes is not attributes
+    assert sensor.async_write_ha_state.call_count == 1
+
+    # The first fetch time is written
+    mock_coordinator.fetched_at = datetime(2026, 1, 1, 8, 0)
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 2
+
+    # A refresh that only moves the fetch time on by less than the interval isn't
+    mock_coordinator.data = list(mock_coordinator.data)
+    mock_coordinator.fetched_at = datetime(2026, 1, 1, 9, 0)
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 2
+
+    mock_coordinator.data_source = "stale"
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 3
+    assert sensor.extra_state_attributes["fetched_at"] == "2026-01-01T09:00:00"
+
+    # Once it has moved on by the interval, it is written on its own
+    mock_coordinator.fetched_at = datetime(2026, 1, 1, 21, 0)
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 4
+
+
+def test_collection_schedule_sensor_caps_schedule_days(mock_coordinator, mock_entry):
+    today = date.today()
+    address = Address(postcode="TE1 1ST", uid="123")
+    mock_coordinator.data = [
+        BinDay(date=(today + timedelta(days=d)).isoformat(), address=address, bins=[])
+        for d in (0, 6, 7, 14)
+    ]
+
+    sensor = CollectionScheduleSensor(mock_coordinator, mock_entry.entry_id, schedule_days=7)
+
+    assert sensor.native_value == 4
+    upcoming = sensor.extra_state_attributes["upcoming_collections"]
+    assert [u["date"] for u in upcoming] == [
+        today.isoformat(),
+        (today + timedelta(days=6)).isoformat(),
+    ]
+    assert "upcoming_collections" in CollectionScheduleSensor._unrecorded_attributes
+
+
+def test_schedule_attributes_are_capped_and_recorded_on_request(mock_coordinator, mock_entry):
+    today = date.today()
+    address = Address(postcode="TE1 1ST", uid="123")
+    mock_coordinator.data = [
+        BinDay(date=(today + timedelta(days=d)).isoformat(), address=address, bins=[])
+        for d in (0, 27, 28, 100)
+    ]
+
+    sensor = CollectionScheduleSensor(mock_coordinator, mock_entry.entry_id)
+    assert len(sensor.extra_state_attributes["upcoming_collections"]) == 2
+
+    assert "raw_bins" in NextCollectionSensor._unrecorded_attributes
+    for recorded in (RecordedNextCollectionSensor, RecordedCollectionScheduleSensor):
+        assert recorded._unrecorded_attributes == frozenset({"fetched_at"})
+
+
+def test_sensor_rolls_over_after_cutoff(mock_coordinator, mock_entry, monkeypatch):
+    today = date.today()
+    address = Address(postcode="TE1 1ST", uid="123")
+    mock_coordinator.data = [
+        BinDay(date=today.isoformat(), address=address, bins=[]),
+        BinDay(date=(today + timedelta(days=7)).isoformat(), address=address, bins=[]),
+    ]
+    dt = sys.modules["homeassistant.util"].dt
+
+    sensor = NextCollectionSensor(mock_coordinator, mock_entry.entry_id, cutoff=time(9, 0))
+    sensor.async_write_ha_state = MagicMock()
+
+    monkeypatch.setattr(dt, "now", lambda: datetime.combine(today, time(8, 59)))
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == today
+
+    # The schedule isn't refreshed, only the state derived from it
+    monkeypatch.setattr(dt, "now", lambda: datetime.combine(today, time(9, 0)))
+    sensor._async_handle_rollover(dt.now())
+    assert sensor.native_value == today + timedelta(days=7)
+    assert sensor.async_write_ha_state.call_count == 2
+    mock_coordinator.async_request_refresh.assert_not_called()
@@ -0,0 +1,94 @@
+import sys
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+# Mock homeassistant modules
+sys.modules.setdefault("homeassistant", MagicMock())
+for module in [
+    "homeassistant.const",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.core",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.start",
+    "homeassistant.util",
+]:
+    sys.modules.setdefault(module, MagicMock())
+
+import pytest
+# Import AFTER mocking
+from custom_components.bindays import store as store_module
+from custom_components.bindays.models.address import Address
+from custom_components.bindays.models.bin import Bin
+from custom_components.bindays.models.bin_day import BinDay
+from custom_components.bindays.store import ScheduleStore
+
+
+class FakeStore:
+    """
+    In-memory stand-in for Home Assistant's Store.
+    """
+
+    files = {}
+
+    def __init__(self, hass, version, key, private=False):
+        self.key = key
+        self.private = private
+
+    async def async_load(self):
+        return self.files.get(self.key)
+
+    async def async_save(self, data):
+        self.files[self.key] = data
+
+    async def async_remove(self):
+        self.files.pop(self.key, None)
+
+
+@pytest.fixture(autouse=True)
+def fake_store(monkeypatch):
+    FakeStore.files = {}
+    monkeypatch.setattr(store_module, "Store", FakeStore)
+    return FakeStore
+
+
+@pytest.mark.asyncio
+async def test_store_saves_and_loads_a_compact_schedule(fake_store):
+    store = ScheduleStore(MagicMock(), "entry")
+    fetched_at = datetime(2026, 1, 1, 8, tzinfo=timezone.utc)
+    bin_days = [
+        BinDay(
+            date="2026-01-05",
+            address=Address(uid="1", postcode="AB1 2CD"),
+            bins=[Bin(name="General", colour="Black")],
+        )
+    ]
+
+    assert await store.async_load() is None
+
+    await store.async_save(bin_days, fetched_at)
+    saved = fake_store.files["bindays.entry"]
+    assert "property" not in saved["binDays"][0]["address"]
+
+    stored = await store.async_load()
+    assert stored.fetched_at == fetched_at
+    assert stored.bin_days == bin_days
+
+    await store.async_remove()
+    assert await store.async_load() is None
+
+
+@pytest.mark.asyncio
+async def test_store_discards_invalid_schedules(fake_store):
+    store = ScheduleStore(MagicMock(), "entry")
+
+    fake_store.files["bindays.entry"] = {"binDays": [{"date": "not a date"}]}
+    assert await store.async_load() is None
+
+    fake_store.files["bindays.entry"] = {}
+    assert await store.async_load() is None